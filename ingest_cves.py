@@ -10,7 +10,7 @@ import requests
 from psycopg2.extras import Json, execute_values
 
 from classification import IMPACT_CLASSIFICATION_VERSION, classify_impact_type
-from nvd_fetch import fetch_cves_from_db
+from nvd_fetch import CveRow, fetch_cves_from_db
 from settings import Settings, load_settings
 
 NVD_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
@@ -374,7 +374,7 @@ def sync_backlog_from_incremental(settings: Settings, changed_cve_ids: set[str])
             active_presets = fetch_active_presets(conn, profile_key)
             if not active_presets:
                 continue
-            matched_rows_by_cve: dict[str, dict[str, Any]] = {}
+            matched_rows_by_cve: dict[str, CveRow] = {}
             for rule in active_presets:
                 preset_rows, _ = fetch_cves_from_db(
                     settings=settings,
@@ -393,7 +393,7 @@ def sync_backlog_from_incremental(settings: Settings, changed_cve_ids: set[str])
                     include_total_count=False,
                 )
                 for row in preset_rows:
-                    cve_id = str(row.get("id", "")).strip()
+                    cve_id = str(row.id).strip()
                     if not cve_id:
                         continue
                     if cve_id not in matched_rows_by_cve:
@@ -403,10 +403,10 @@ def sync_backlog_from_incremental(settings: Settings, changed_cve_ids: set[str])
             with conn:
                 with conn.cursor() as cur:
                     for row in matched_rows_by_cve.values():
-                        cve_id = str(row.get("id", "")).strip()
+                        cve_id = str(row.id).strip()
                         if not cve_id:
                             continue
-                        cve_last_modified = row.get("last_modified_at")
+                        cve_last_modified = row.last_modified_at
                         cur.execute(
                             """
                             INSERT INTO daily_review_backlog (
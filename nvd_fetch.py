@@ -1,7 +1,7 @@
 import argparse
 import math
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 import psycopg2
 
@@ -40,6 +40,15 @@ def _parse_cpe_object(raw_value: str) -> tuple[str, str, str | None] | None:
     return (vendor, product, version)
 
 
+class CveRow(NamedTuple):
+    id: str
+    cvss_score: Any
+    last_modified_at: datetime | None
+    description: str
+    vuln_type: str
+    cpe_entries: list[str]
+
+
 def fetch_incremental_checkpoint(settings: Settings) -> datetime | None:
     conn = psycopg2.connect(
         host=settings.db_host,
@@ -76,7 +85,7 @@ def fetch_cves_from_db(
     cpe_objects: list[str] | None = None,
     cve_ids: list[str] | None = None,
     include_total_count: bool = True,
-) -> tuple[list[dict[str, Any]], int | None]:
+) -> tuple[list[CveRow], int | None]:
     where_clauses = [
         "c.cvss_score >= %s",
     ]
@@ -279,19 +288,17 @@ def fetch_cves_from_db(
     finally:
         conn.close()
 
-    parsed_rows: list[dict[str, Any]] = []
-    for cve_id, cvss_score, last_modified_at, impact, raw, cpe_entries in rows:
-        description = extract_english_description(raw)
-        parsed_rows.append(
-            {
-                "id": cve_id,
-                "cvss_score": cvss_score,
-                "last_modified_at": last_modified_at,
-                "description": description,
-                "vuln_type": impact or "Other",
-                "cpe_entries": cpe_entries or [],
-            }
+    parsed_rows = [
+        CveRow(
+            cve_id,
+            cvss_score,
+            last_modified_at,
+            extract_english_description(raw),
+            impact or "Other",
+            cpe_entries or [],
         )
+        for cve_id, cvss_score, last_modified_at, impact, raw, cpe_entries in rows
+    ]
     return parsed_rows, total_count
 
 
@@ -308,16 +315,16 @@ def extract_english_description(raw_item: Any) -> str:
     return ""
 
 
-def print_cves(cves: list[dict[str, Any]], min_cvss: float, total_count: int) -> None:
+def print_cves(cves: list[CveRow], min_cvss: float, total_count: int) -> None:
     print(f"Filtered CVEs (min CVSS {min_cvss}): total {total_count}, showing {len(cves)}")
     for item in cves:
-        cve_id = str(item.get("id", "UNKNOWN"))
-        score = item.get("cvss_score")
-        description = str(item.get("description", ""))
-        vuln_type = str(item.get("vuln_type", "Other"))
-        last_modified = item.get("last_modified_at")
+        cve_id = str(item.id)
+        score = item.cvss_score
+        description = str(item.description)
+        vuln_type = str(item.vuln_type)
+        last_modified = item.last_modified_at
         last_modified_text = "N/A" if last_modified is None else str(last_modified)
-        cpe_entries = item.get("cpe_entries") or []
+        cpe_entries = item.cpe_entries
         cpe_preview = ", ".join(cpe_entries[:3]) if cpe_entries else "-"
         score_text = "N/A" if score is None else str(score)
         print(
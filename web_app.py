@@ -1,32 +1,112 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import json
-import math
+import os
 import re
+import tempfile
+import threading
 import time
-from io import BytesIO
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from html import escape
+from itertools import islice
 from urllib.parse import urlencode
 
 import psycopg2
-from flask import Flask, jsonify, redirect, request, send_file
+from flask import Flask, Response, jsonify, redirect, request, send_file, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 from psycopg2.extras import Json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from classification import IMPACT_TYPE_OPTIONS
-from nvd_fetch import fetch_cves_from_db, fetch_incremental_checkpoint
+from nvd_fetch import CveRow, extract_english_description, fetch_cves_from_db, fetch_incremental_checkpoint
 from settings import Settings, load_settings
 
 app = Flask(__name__)
 
+
+class _TtlLruCache:
+    # Shared by request threads: every access holds the lock, and the entry count is capped LRU-style.
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> object | None:
+        with self._lock:
+            cached = self._entries.get(key)
+            if not cached:
+                return None
+            expires_at, value = cached
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                self._entries.popitem(last=False)
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+
+
 COUNT_CACHE_TTL_SECONDS = 120
 COUNT_CACHE_MAX_ENTRIES = 200
-_count_cache: dict[str, tuple[int, float]] = {}
+DAILY_REVIEW_INITIAL_ROWS = 100
+DAILY_ROWS_CACHE_TTL_SECONDS = 60
+DAILY_ROWS_CACHE_MAX_ENTRIES = 64
+_count_cache: OrderedDict[str, tuple[int, float]] = OrderedDict()
+_count_cache_lock = threading.Lock()
+PROFILE_SETTINGS_CACHE_TTL_SECONDS = 30
+_profile_settings_cache: dict[tuple[Settings, str], tuple[dict[str, object], float]] = {}
+CHECKPOINT_CACHE_TTL_SECONDS = 30
+_checkpoint_text_cache: dict[Settings, tuple[str, float]] = {}
+_daily_rows_cache = _TtlLruCache(DAILY_ROWS_CACHE_TTL_SECONDS, DAILY_ROWS_CACHE_MAX_ENTRIES)
+SEARCH_ROWS_CACHE_TTL_SECONDS = 60
+SEARCH_ROWS_CACHE_MAX_ENTRIES = 64
+_search_rows_cache = _TtlLruCache(SEARCH_ROWS_CACHE_TTL_SECONDS, SEARCH_ROWS_CACHE_MAX_ENTRIES)
 VALID_USER_PROFILES = {"hq", "jaehwa"}
 VALID_SORT_KEYS = {"cvss_desc", "cvss_asc", "last_modified_desc", "last_modified_asc"}
+_SORT_MAP: dict[str, tuple[str, str]] = {
+    "cvss_desc": ("cvss", "desc"),
+    "cvss_asc": ("cvss", "asc"),
+    "last_modified_desc": ("last_modified", "desc"),
+    "last_modified_asc": ("last_modified", "asc"),
+}
+_DEFAULT_SORT = ("cvss", "desc")
+_LAST_MODIFIED_ARG_NAMES = (
+    "last_modified_present",
+    "last_modified_start",
+    "last_modified_end",
+    "last_modified_start_date",
+    "last_modified_start_time",
+    "last_modified_end_date",
+    "last_modified_end_time",
+)
+_SORT_MARKERS: dict[str, tuple[str, str]] = {
+    "cvss_desc": ("▼", ""),
+    "cvss_asc": ("▲", ""),
+    "last_modified_desc": ("", "▼"),
+    "last_modified_asc": ("", "▲"),
+}
 KST = timezone(timedelta(hours=9))
 DEFAULT_PROFILE_SETTINGS: dict[str, object] = {
     "vendor": "",
@@ -47,6 +127,34 @@ _review_status_table_ready = False
 _review_backlog_table_ready = False
 _profile_presets_table_ready = False
 _last_bulk_action_cache: dict[str, dict[str, object]] = {}
+_db_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cve-db")
+_IMPACT_TYPE_CHOICES = tuple(IMPACT_TYPE_OPTIONS)
+_DEFAULT_REVIEW_STATE: dict[str, object] = {"status": "pending", "note": "", "note_html": "", "needs_recheck": False}
+_REVIEW_STATUS_SELECT_HTML = {
+    current: "<select class='row-status'>"
+    + "".join(
+        f"<option value='{value}' {'selected' if value == current else ''}>{label}</option>"
+        for value, label in (("pending", "미검토"), ("reviewed", "검토완료"), ("ignored", "제외"))
+    )
+    + "</select>"
+    for current in ("pending", "reviewed", "ignored")
+}
+_REVIEW_BADGE_HTML = {
+    "reviewed": "<div class='review-badge reviewed'>검토완료</div>",
+    "ignored": "<div class='review-badge ignored'>제외</div>",
+}
+_PENDING_BADGE_HTML = "<div class='review-badge pending'>미검토</div>"
+_RECHECK_BADGE_HTML = "<div class='review-badge pending'>재검토 필요</div>"
+_ESCAPED_IMPACT_TYPES = {option: escape(option) for option in IMPACT_TYPE_OPTIONS}
+_NO_RESULTS_HTML = "<tr><td colspan='7'>No results</td></tr>"
+_NO_FILTER_CHIP_HTML = "<span class='impact-chip muted-chip'>No filter</span>"
+_EMPTY_CPE_CHIP_HTML = "<span class='cpe-chip'>-</span>"
+_PAGER_PREV_DISABLED_HTML = "<span class='page-link disabled'>Prev</span>"
+_PAGER_NEXT_DISABLED_HTML = "<span class='page-link disabled'>Next</span>"
+_CPE_OBJECT_RE = re.compile(r"[a-z0-9:_.-]+")
+_TIME_INPUT_RE = re.compile(r"(\d{1,2}):(\d{2})")
+# escape() never emits any of these delimiters, so wrapping can run after escaping.
+_CPE_WRAP_TABLE = str.maketrans({delimiter: f"{delimiter}<wbr>" for delimiter in ":/._-"})
 
 
 def _normalize_user_profile(raw_value: str | None) -> str:
@@ -54,10 +162,41 @@ def _normalize_user_profile(raw_value: str | None) -> str:
     return profile if profile in VALID_USER_PROFILES else "hq"
 
 
+def _clip_int(raw_value: str | None, low: int, high: int, default: int) -> int:
+    value = (raw_value or "").strip()
+    digits = value[1:] if value[:1] == "-" else value
+    if not digits.isdecimal():
+        return default
+    return max(low, min(int(value), high))
+
+
+def _dump_json(value: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    def dumps(self, obj: object, **kwargs: object) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+
+
+if orjson is not None:
+    # jsonify() on the /api endpoints goes through app.json.
+    app.json = _OrjsonProvider(app)
+
+
 def _to_bool(value: object) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _invalid_new_cpe_objects(raw_catalog: str, stored_catalog: list[str]) -> list[str]:
+    # Only entries added in this request are checked; stored legacy entries are kept as-is.
+    submitted = _sanitize_profile_settings({"cpe_objects_catalog": raw_catalog})["cpe_objects_catalog"]
+    stored = set(stored_catalog)
+    return [value for value in submitted if value not in stored and not _CPE_OBJECT_RE.fullmatch(value)]
+
+
 def _sanitize_profile_settings(raw_settings: dict[str, object] | None) -> dict[str, object]:
     clean = dict(DEFAULT_PROFILE_SETTINGS)
     if not isinstance(raw_settings, dict):
@@ -133,6 +272,19 @@ def _sanitize_profile_settings(raw_settings: dict[str, object] | None) -> dict[s
     return clean
 
 
+@lru_cache(maxsize=4)
+def _load_settings_cached(config_path: str, mtime_ns: int) -> Settings:
+    return load_settings(config_path)
+
+
+def _load_app_settings(config_path: str = ".env") -> Settings:
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return load_settings(config_path)
+    return _load_settings_cached(config_path, mtime_ns)
+
+
 def _connect_db(settings_obj: Settings) -> psycopg2.extensions.connection:
     return psycopg2.connect(
         host=settings_obj.db_host,
@@ -238,7 +390,7 @@ def _ensure_review_backlog_table(settings_obj: Settings) -> None:
 def sync_daily_review_backlog(
     settings_obj: Settings,
     profile: str,
-    rows: list[dict[str, object]],
+    rows: list[CveRow],
 ) -> None:
     if not rows:
         return
@@ -249,10 +401,10 @@ def sync_daily_review_backlog(
         with conn:
             with conn.cursor() as cur:
                 for row in rows:
-                    cve_id = str(row.get("id", "")).strip()
+                    cve_id = str(row.id).strip()
                     if not cve_id:
                         continue
-                    cve_last_modified = row.get("last_modified_at")
+                    cve_last_modified = row.last_modified_at
                     cur.execute(
                         """
                         INSERT INTO daily_review_backlog (
@@ -316,9 +468,11 @@ def fetch_daily_review_backlog_map(
             )
             rows = cur.fetchall()
         for cve_id, status, note, needs_recheck in rows:
+            note_text = str(note or "")
             result[str(cve_id)] = {
                 "status": str(status),
-                "note": str(note or ""),
+                "note": note_text,
+                "note_html": escape(note_text) if note_text else "",
                 "needs_recheck": bool(needs_recheck),
             }
     finally:
@@ -406,6 +560,16 @@ def upsert_daily_review_backlog_item(
 
 def fetch_profile_settings(settings_obj: Settings, profile: str) -> dict[str, object]:
     normalized_profile = _normalize_user_profile(profile)
+    cache_key = (settings_obj, normalized_profile)
+    cached = _profile_settings_cache.get(cache_key)
+    if cached and time.monotonic() < cached[1]:
+        return dict(cached[0])
+    result = _fetch_profile_settings_uncached(settings_obj, normalized_profile)
+    _profile_settings_cache[cache_key] = (result, time.monotonic() + PROFILE_SETTINGS_CACHE_TTL_SECONDS)
+    return dict(result)
+
+
+def _fetch_profile_settings_uncached(settings_obj: Settings, normalized_profile: str) -> dict[str, object]:
     _ensure_profile_settings_table(settings_obj)
     conn = _connect_db(settings_obj)
     try:
@@ -451,6 +615,10 @@ def upsert_profile_settings(settings_obj: Settings, profile: str, payload: dict[
                 )
     finally:
         conn.close()
+    _profile_settings_cache[(settings_obj, normalized_profile)] = (
+        sanitized_payload,
+        time.monotonic() + PROFILE_SETTINGS_CACHE_TTL_SECONDS,
+    )
     return sanitized_payload
 
 
@@ -801,6 +969,19 @@ def fetch_cpe_autocomplete_suggestions(
     }
 
 
+def fetch_cve_description(settings_obj: Settings, cve_id: str) -> str | None:
+    conn = _connect_db(settings_obj)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT raw FROM cve WHERE id = %s", (cve_id,))
+            row = cur.fetchone()
+    finally:
+        conn.close()
+    if not row:
+        return None
+    return extract_english_description(row[0])
+
+
 def fetch_cpe_preview_rows(
     settings_obj: Settings,
     vendor_value: str,
@@ -873,21 +1054,24 @@ def _build_count_cache_key(
 
 
 def _get_cached_count(key: str) -> int | None:
-    cached = _count_cache.get(key)
-    if not cached:
-        return None
-    value, ts = cached
-    if time.time() - ts > COUNT_CACHE_TTL_SECONDS:
-        _count_cache.pop(key, None)
-        return None
-    return value
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+        if not cached:
+            return None
+        value, ts = cached
+        if time.time() - ts > COUNT_CACHE_TTL_SECONDS:
+            del _count_cache[key]
+            return None
+        _count_cache.move_to_end(key)
+        return value
 
 
 def _set_cached_count(key: str, value: int) -> None:
-    if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
-        oldest_key = min(_count_cache.items(), key=lambda item: item[1][1])[0]
-        _count_cache.pop(oldest_key, None)
-    _count_cache[key] = (value, time.time())
+    with _count_cache_lock:
+        _count_cache.pop(key, None)
+        if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.popitem(last=False)
+        _count_cache[key] = (value, time.time())
 
 
 def parse_datetime_local(raw_value: str) -> datetime | None:
@@ -897,10 +1081,41 @@ def parse_datetime_local(raw_value: str) -> datetime | None:
     return datetime.fromisoformat(value)
 
 
+def _parse_last_modified_range(start_raw: str, end_raw: str) -> tuple[datetime | None, datetime | None, str]:
+    try:
+        start = parse_datetime_local(start_raw)
+        end = parse_datetime_local(end_raw)
+    except ValueError:
+        return None, None, "Invalid Last Modified datetime. Use format YYYY-MM-DDTHH:MM."
+    if start is not None and end is not None and start > end:
+        return start, end, "Last Modified Start must be earlier than or equal to End."
+    return start, end, ""
+
+
+def _parse_min_cvss(raw_value: str | None) -> float:
+    if not raw_value:
+        return 0.0
+    try:
+        return float(raw_value.strip())
+    except ValueError:
+        return 0.0
+
+
+def _parse_page(raw_value: str | None) -> int:
+    # Most requests carry no page parameter at all.
+    if not raw_value:
+        return 1
+    try:
+        return max(1, int(raw_value.strip()))
+    except ValueError:
+        return 1
+
+
 def _compose_datetime_arg(param_name: str) -> str:
-    date_raw = (request.args.get(f"{param_name}_date") or "").strip()
-    time_raw = (request.args.get(f"{param_name}_time") or "").strip()
-    raw_value = (request.args.get(param_name) or "").strip()
+    args = request.args
+    date_raw = (args.get(f"{param_name}_date") or "").strip()
+    time_raw = (args.get(f"{param_name}_time") or "").strip()
+    raw_value = (args.get(param_name) or "").strip()
 
     # If date/time split inputs are present, they take precedence over legacy raw param.
     if date_raw or time_raw:
@@ -908,7 +1123,7 @@ def _compose_datetime_arg(param_name: str) -> str:
             return raw_value
         if not time_raw:
             return date_raw
-        match = re.fullmatch(r"(\d{1,2}):(\d{2})", time_raw)
+        match = _TIME_INPUT_RE.fullmatch(time_raw)
         if not match:
             return f"{date_raw}T{time_raw}"
         hour = int(match.group(1))
@@ -934,64 +1149,181 @@ def _split_datetime_for_inputs(raw_value: str) -> tuple[str, str]:
         return value[:10], ""
 
 
-def format_cvss_badge(score: object) -> tuple[str, str]:
-    if score is None:
-        return ("None 0.0", "cvss-none")
+# Upper-inclusive bucket bounds; anything above the last bound is Critical.
+_CVSS_BUCKET_BOUNDS = (0.0, 3.9, 6.9, 8.9)
+_CVSS_BUCKETS = (
+    ("None", "cvss-none"),
+    ("Low", "cvss-low"),
+    ("Medium", "cvss-medium"),
+    ("High", "cvss-high"),
+    ("Critical", "cvss-critical"),
+)
+
 
+def _compute_cvss_badge(value: float) -> tuple[str, str]:
+    name, css_class = _CVSS_BUCKETS[bisect_left(_CVSS_BUCKET_BOUNDS, value)]
+    return (f"{name} {value:.1f}", css_class)
+
+
+_CVSS_BADGES = tuple(_compute_cvss_badge(index / 10) for index in range(101))
+_CVSS_CHIPS = tuple(f"<span class='cvss-chip {css_class}'>{label}</span>" for label, css_class in _CVSS_BADGES)
+
+
+def _clamp_cvss(score: object) -> float:
+    if score is None:
+        return 0.0
     try:
         value = float(score)
     except (TypeError, ValueError):
-        return ("None 0.0", "cvss-none")
-
-    value = max(0.0, min(value, 10.0))
-    if value == 0.0:
-        return (f"None {value:.1f}", "cvss-none")
-    if value <= 3.9:
-        return (f"Low {value:.1f}", "cvss-low")
-    if value <= 6.9:
-        return (f"Medium {value:.1f}", "cvss-medium")
-    if value <= 8.9:
-        return (f"High {value:.1f}", "cvss-high")
-    return (f"Critical {value:.1f}", "cvss-critical")
+        return 0.0
+    return max(0.0, min(value, 10.0))
+
+
+def format_cvss_badge(score: object) -> tuple[str, str]:
+    value = _clamp_cvss(score)
+    scaled = value * 10
+    index = round(scaled)
+    if scaled == index:
+        return _CVSS_BADGES[index]
+    return _compute_cvss_badge(value)
 
 
+def _render_cvss_chip(score: object) -> str:
+    value = _clamp_cvss(score)
+    scaled = value * 10
+    index = round(scaled)
+    if scaled == index:
+        return _CVSS_CHIPS[index]
+    label, css_class = _compute_cvss_badge(value)
+    return f"<span class='cvss-chip {css_class}'>{label}</span>"
+
+
+@lru_cache(maxsize=2048)
 def shorten(text: str, limit: int = 130) -> str:
-    clean = " ".join(text.split())
+    # Past `limit` words the joined prefix is already longer than `limit`, so the tail never needs normalizing.
+    clean = " ".join(text.split(maxsplit=limit))
     if len(clean) <= limit:
         return clean
     return clean[: limit - 1] + "..."
 
 
 def format_cpe_for_wrap(value: object) -> str:
-    text = str(value)
-    tokens = re.split(r"([:/._-])", text)
-    chunks: list[str] = []
-    for token in tokens:
-        if token in {":", "/", ".", "_", "-"}:
-            chunks.append(f"{escape(token)}<wbr>")
-        else:
-            chunks.append(escape(token))
-    return "".join(chunks)
+    return escape(str(value)).translate(_CPE_WRAP_TABLE)
 
 
+# The same vendor:product pairs recur across most rows, so chips are memoized per value.
+@lru_cache(maxsize=8192)
+def _render_cpe_chip(cpe_value: str) -> str:
+    return f"<span class='cpe-chip'>{format_cpe_for_wrap(cpe_value)}</span>"
+
+
+def _render_cpe_badges(cpe_entries: list[str], limit: int = 10) -> str:
+    return "".join(map(_render_cpe_chip, islice(cpe_entries, limit))) or _EMPTY_CPE_CHIP_HTML
+
+
 def format_last_modified(value: object) -> str:
     if isinstance(value, datetime):
-        base = value.strftime("%Y-%m-%d %H:%M:%S")
-        offset = value.utcoffset()
-        if offset is None:
-            return base
-        total_minutes = int(offset.total_seconds() // 60)
-        if total_minutes == 0:
-            return base
-        sign = "+" if total_minutes >= 0 else "-"
-        abs_minutes = abs(total_minutes)
-        hours = abs_minutes // 60
-        minutes = abs_minutes % 60
-        tz_text = f"UTC{sign}{hours:02d}:{minutes:02d}"
-        return f"{base} {tz_text}"
+        # Aware datetimes compare equal across zones, so the offset is part of the cache key.
+        return _format_datetime(value, value.utcoffset())
     return str(value)
 
 
+@lru_cache(maxsize=4096)
+def _format_datetime(value: datetime, offset: timedelta | None) -> str:
+    base = value.isoformat(" ", "seconds")[:19]
+    # Naive and UTC timestamps (nearly all NVD data) skip the offset arithmetic.
+    if not offset:
+        return base
+    total_minutes = int(offset.total_seconds() // 60)
+    if total_minutes == 0:
+        return base
+    sign = "+" if total_minutes >= 0 else "-"
+    hours, minutes = divmod(abs(total_minutes), 60)
+    return f"{base} UTC{sign}{hours:02d}:{minutes:02d}"
+
+
+def _render_search_row(
+    row: CveRow,
+    *,
+    _escape=escape,
+    _shorten=shorten,
+    _format_last_modified=format_last_modified,
+    _render_cvss_chip=_render_cvss_chip,
+) -> str:
+    cve_id = _escape(row.id)
+    vuln_type = _ESCAPED_IMPACT_TYPES.get(row.vuln_type) or _escape(row.vuln_type)
+    last_modified = _format_last_modified(row.last_modified_at)
+    description = row.description
+    summary_text = _shorten(description)
+    summary = _escape(summary_text)
+    # Untruncated descriptions are read back from the cell; longer ones are fetched when View is clicked.
+    more_attr = " data-more='1'" if summary_text != description else ""
+    cpe_entries = row.cpe_entries
+    cpe_badges = _render_cpe_badges(cpe_entries)
+    cpe_for_copy = _escape(", ".join(cpe_entries)) if cpe_entries else "-"
+
+    return (
+        "<tr>"
+        f"<td class='id' data-label='CVE ID'>{cve_id}</td>"
+        f"<td class='score' data-label='CVSS'>{_render_cvss_chip(row.cvss_score)}</td>"
+        f"<td class='lastmod' data-label='Last Modified'>{last_modified}</td>"
+        f"<td class='vtype' data-label='Type'>{vuln_type}</td>"
+        f"<td class='desc' data-label='Description'>{summary}</td>"
+        f"<td class='cpe' data-label='CPE'><div class='cpe-wrap'>{cpe_badges}</div></td>"
+        "<td class='actions' data-label='Actions'>"
+        f"<button type='button' class='copy-btn' data-copy='{cve_id}'>Copy CVE</button>"
+        f"<button type='button' class='copy-btn alt' data-copy='{cpe_for_copy}'>Copy CPE</button>"
+        f"<button type='button' class='copy-btn view-btn' data-cve='{cve_id}'{more_attr}>View</button>"
+        "</td>"
+        "</tr>"
+    )
+
+
+def _render_daily_row(
+    row: CveRow,
+    current_status: str,
+    needs_recheck: bool,
+    note_html: str,
+    matched_presets: list[str],
+    highlighted: bool,
+    deferred: bool = False,
+    *,
+    _escape=escape,
+    _shorten=shorten,
+    _format_last_modified=format_last_modified,
+    _render_cvss_chip=_render_cvss_chip,
+) -> str:
+    cve_id = _escape(row.id)
+    status_badge_html = _REVIEW_BADGE_HTML.get(current_status, _PENDING_BADGE_HTML)
+    if needs_recheck and status_badge_html is not _PENDING_BADGE_HTML:
+        status_badge_html = _RECHECK_BADGE_HTML
+    description = row.description
+    cpe_badges = _render_cpe_badges(row.cpe_entries)
+    last_modified_text = _format_last_modified(row.last_modified_at)
+    last_modified_html = last_modified_text.replace(" ", "<br>", 1)
+    return (
+        f"<tr class='review-row{' row-deferred' if deferred else ''}'>"
+        f"<td class='sticky-col sticky-left'><input type='checkbox' name='selected_cve_id' value='{cve_id}' form='bulk-form' class='bulk-cve-check'></td>"
+        f"<td class='id'>{cve_id}</td>"
+        f"<td class='score'>{_render_cvss_chip(row.cvss_score)}</td>"
+        f"<td>{_ESCAPED_IMPACT_TYPES.get(row.vuln_type) or _escape(row.vuln_type)}</td>"
+        f"<td class='last-mod'>{last_modified_html}</td>"
+        f"<td class='desc'>{_escape(_shorten(description, 120))} "
+        f"<button type='button' class='view-btn' data-cve='{cve_id}' data-desc='{_escape(description)}'>View</button></td>"
+        f"<td class='cpe'><div class='cpe-wrap'>{cpe_badges}</div></td>"
+        f"<td>{_escape(', '.join(matched_presets) or '-')}</td>"
+        f"<td class='sticky-col sticky-right {'row-highlight' if highlighted else ''}'>"
+        f"{status_badge_html}"
+        f"<div class='review-form' data-cve='{cve_id}'>"
+        f"{_REVIEW_STATUS_SELECT_HTML.get(current_status) or _REVIEW_STATUS_SELECT_HTML['pending']}"
+        f"<input class='row-note' value='{note_html}' placeholder='메모 (선택)'>"
+        "<button type='button' class='row-save-btn'>저장</button>"
+        "</div>"
+        "</td>"
+        "</tr>"
+    )
+
+
 def format_checkpoint_kst(value: datetime | None) -> str:
     if value is None:
         return "기록 없음"
@@ -1001,6 +1333,34 @@ def format_checkpoint_kst(value: datetime | None) -> str:
     return f"{local_value.strftime('%Y-%m-%d %H:%M:%S')} KST"
 
 
+def _get_cached_checkpoint_text(settings_obj: Settings) -> str | None:
+    cached = _checkpoint_text_cache.get(settings_obj)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+    return None
+
+
+def _load_checkpoint_text(settings_obj: Settings) -> str:
+    try:
+        text = format_checkpoint_kst(fetch_incremental_checkpoint(settings_obj))
+    except Exception:
+        return "조회 실패"
+    _checkpoint_text_cache[settings_obj] = (text, time.monotonic() + CHECKPOINT_CACHE_TTL_SECONDS)
+    return text
+
+
+@lru_cache(maxsize=64)
+def _render_checkbox_options_html(field_name: str, options: tuple[str, ...], selected: frozenset[str]) -> str:
+    return "".join(
+        "<label class='impact-option'>"
+        f"<input type='checkbox' class='impact-check' name='{field_name}' value='{escape(option)}' {'checked' if option in selected else ''}>"
+        f"<span>{escape(option)}</span>"
+        "</label>"
+        for option in options
+    )
+
+
+@lru_cache(maxsize=16)
 def _build_menu_html(active_page: str, user_profile: str | None = None) -> str:
     profile_query = f"?user_profile={escape(_normalize_user_profile(user_profile))}" if user_profile else ""
     return (
@@ -1012,65 +1372,81 @@ def _build_menu_html(active_page: str, user_profile: str | None = None) -> str:
     )
 
 
+_XLSX_META_LABEL_FONT = Font(bold=True, color="0F6F65")
+_XLSX_META_LABEL_FILL = PatternFill(fill_type="solid", start_color="E8F1EF", end_color="E8F1EF")
+_XLSX_HEADER_FONT = Font(bold=True, color="2F3F45")
+_XLSX_HEADER_FILL = PatternFill(fill_type="solid", start_color="F2EEE4", end_color="F2EEE4")
+_XLSX_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_XLSX_LEFT_ALIGNMENT = Alignment(horizontal="left")
+_XLSX_LEFT_WRAP_ALIGNMENT = Alignment(horizontal="left", wrap_text=True)
+_XLSX_TOP_ALIGNMENT = Alignment(vertical="top")
+_XLSX_CENTER_TOP_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+_XLSX_TOP_WRAP_ALIGNMENT = Alignment(vertical="top", wrap_text=True)
+
+
+def _styled_cell(
+    sheet: object,
+    value: object,
+    *,
+    font: Font | None = None,
+    fill: PatternFill | None = None,
+    alignment: Alignment | None = None,
+) -> WriteOnlyCell:
+    cell = WriteOnlyCell(sheet, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def _send_workbook(workbook: Workbook, filename: str) -> Response:
+    # Spool to an anonymous temp file so large exports are not held in memory while they are sent.
+    output = tempfile.TemporaryFile(suffix=".xlsx")
+    workbook.save(output)
+    output.seek(0)
+    response = send_file(
+        output,
+        as_attachment=True,
+        download_name=filename,
+        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+    response.content_length = os.fstat(output.fileno()).st_size
+    return response
+
+
 @app.get("/export.xlsx")
 def export_xlsx() -> object:
-    sort_key_param = request.args.get("sort_key")
-    product = (request.args.get("product") or "").strip()
-    vendor = (request.args.get("vendor") or "").strip()
-    keyword = (request.args.get("keyword") or "").strip()
+    args = request.args
+    sort_key_param = args.get("sort_key")
+    product = (args.get("product") or "").strip()
+    vendor = (args.get("vendor") or "").strip()
+    keyword = (args.get("keyword") or "").strip()
     last_modified_start_raw = _compose_datetime_arg("last_modified_start")
     last_modified_end_raw = _compose_datetime_arg("last_modified_end")
-    cpe_missing_only = request.args.get("cpe_missing_only") == "1"
-    selected_impacts = [value.strip() for value in request.args.getlist("impact_type") if value.strip()]
-    selected_cpe_objects = [value.strip().lower() for value in request.args.getlist("cpe_object") if value.strip()]
-    export_scope = (request.args.get("export_scope") or "page").strip().lower()
+    cpe_missing_only = args.get("cpe_missing_only") == "1"
+    selected_impacts = [value.strip() for value in args.getlist("impact_type") if value.strip()]
+    selected_cpe_objects = [value.strip().lower() for value in args.getlist("cpe_object") if value.strip()]
+    export_scope = (args.get("export_scope") or "page").strip().lower()
     if export_scope not in {"page", "all"}:
         export_scope = "page"
 
-    sort_map = {
-        "cvss_desc": ("cvss", "desc"),
-        "cvss_asc": ("cvss", "asc"),
-        "last_modified_desc": ("last_modified", "desc"),
-        "last_modified_asc": ("last_modified", "asc"),
-    }
-
-    min_cvss_raw = (request.args.get("min_cvss") or "0").strip()
-    limit_raw = (request.args.get("limit") or "50").strip()
-    page_raw = (request.args.get("page") or "1").strip()
-
-    try:
-        min_cvss = float(min_cvss_raw)
-    except ValueError:
-        min_cvss = 0.0
-
-    try:
-        limit = int(limit_raw)
-    except ValueError:
-        limit = 50
-    limit = max(1, min(limit, 500))
-
-    try:
-        page = int(page_raw)
-    except ValueError:
-        page = 1
-    page = max(1, page)
+    min_cvss = _parse_min_cvss(args.get("min_cvss"))
+    limit = _clip_int(args.get("limit"), 1, 500, 50)
+    page = _parse_page(args.get("page"))
 
     sort_key = (sort_key_param or "cvss_desc").strip()
-    sort_by, sort_order = sort_map.get(sort_key, ("cvss", "desc"))
+    sort_by, sort_order = _SORT_MAP.get(sort_key, _DEFAULT_SORT)
 
-    try:
-        last_modified_start = parse_datetime_local(last_modified_start_raw)
-        last_modified_end = parse_datetime_local(last_modified_end_raw)
-    except ValueError:
-        return "Invalid Last Modified datetime. Use format YYYY-MM-DDTHH:MM.", 400
-    if (
-        last_modified_start is not None
-        and last_modified_end is not None
-        and last_modified_start > last_modified_end
-    ):
-        return "Last Modified Start must be earlier than or equal to End.", 400
+    last_modified_start, last_modified_end, range_error = _parse_last_modified_range(
+        last_modified_start_raw, last_modified_end_raw
+    )
+    if range_error:
+        return range_error, 400
 
-    settings = load_settings(".env")
+    settings = _load_app_settings()
     count_cache_key = _build_count_cache_key(
         product,
         vendor,
@@ -1083,7 +1459,101 @@ def export_xlsx() -> object:
         selected_cpe_objects,
     )
 
-    rows: list[dict[str, object]] = []
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("CVE Results")
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    filter_summary_parts: list[str] = []
+    if keyword:
+        filter_summary_parts.append(f"keyword={keyword}")
+    if vendor:
+        filter_summary_parts.append(f"vendor={vendor}")
+    if product:
+        filter_summary_parts.append(f"product={product}")
+    if selected_impacts:
+        filter_summary_parts.append(f"impact_type={', '.join(selected_impacts)}")
+    if last_modified_start_raw:
+        filter_summary_parts.append(f"last_modified_start={last_modified_start_raw}")
+    if last_modified_end_raw:
+        filter_summary_parts.append(f"last_modified_end={last_modified_end_raw}")
+    if cpe_missing_only:
+        filter_summary_parts.append("cpe_missing_only=1")
+    if selected_cpe_objects:
+        filter_summary_parts.append(f"cpe_object={', '.join(selected_cpe_objects)}")
+    filter_summary_parts.append(f"min_cvss={min_cvss}")
+    filter_summary_parts.append(f"limit={limit}")
+    filter_summary_parts.append(f"sort={sort_key}")
+    filter_summary_parts.append(f"export_scope={export_scope}")
+    filter_summary = "; ".join(filter_summary_parts)
+
+    sheet.column_dimensions["A"].width = 20
+    sheet.column_dimensions["B"].width = 14
+    sheet.column_dimensions["C"].width = 10
+    sheet.column_dimensions["D"].width = 28
+    sheet.column_dimensions["E"].width = 24
+    sheet.column_dimensions["F"].width = 90
+    sheet.column_dimensions["G"].width = 70
+
+    sheet.append(
+        [
+            _styled_cell(sheet, "Search Time", font=_XLSX_META_LABEL_FONT, fill=_XLSX_META_LABEL_FILL),
+            _styled_cell(sheet, generated_at, alignment=_XLSX_LEFT_ALIGNMENT),
+        ]
+    )
+    sheet.append(
+        [
+            _styled_cell(sheet, "Filter Summary", font=_XLSX_META_LABEL_FONT, fill=_XLSX_META_LABEL_FILL),
+            _styled_cell(sheet, filter_summary, alignment=_XLSX_LEFT_WRAP_ALIGNMENT),
+        ]
+    )
+    sheet.append([])
+
+    headers = [
+        "CVE ID",
+        "CVSS Severity",
+        "CVSS Score",
+        "Impact Type",
+        "Last Modified",
+        "Description",
+        "CPE Entries",
+    ]
+    sheet.append(
+        [
+            _styled_cell(
+                sheet,
+                header,
+                font=_XLSX_HEADER_FONT,
+                fill=_XLSX_HEADER_FILL,
+                alignment=_XLSX_HEADER_ALIGNMENT,
+            )
+            for header in headers
+        ]
+    )
+
+    def append_rows(batch_rows: list[CveRow]) -> None:
+        for row in batch_rows:
+            severity_label, _ = format_cvss_badge(row.cvss_score)
+            score_value = row.cvss_score
+            cpe_entries = row.cpe_entries
+            sheet.append(
+                [
+                    _styled_cell(sheet, row.id, alignment=_XLSX_TOP_ALIGNMENT),
+                    _styled_cell(sheet, severity_label.split(" ", 1)[0], alignment=_XLSX_CENTER_TOP_ALIGNMENT),
+                    _styled_cell(
+                        sheet,
+                        "0.0" if score_value is None else str(score_value),
+                        alignment=_XLSX_CENTER_TOP_ALIGNMENT,
+                    ),
+                    _styled_cell(sheet, row.vuln_type, alignment=_XLSX_TOP_ALIGNMENT),
+                    _styled_cell(sheet, format_last_modified(row.last_modified_at), alignment=_XLSX_TOP_ALIGNMENT),
+                    _styled_cell(sheet, row.description, alignment=_XLSX_TOP_WRAP_ALIGNMENT),
+                    _styled_cell(
+                        sheet,
+                        "\n".join(cpe_entries),
+                        alignment=_XLSX_TOP_WRAP_ALIGNMENT,
+                    ),
+                ]
+            )
+
     total_count = _get_cached_count(count_cache_key)
     if export_scope == "page":
         rows, _ = fetch_cves_from_db(
@@ -1103,11 +1573,12 @@ def export_xlsx() -> object:
             cpe_objects=selected_cpe_objects or None,
             include_total_count=False,
         )
+        append_rows(rows)
     else:
         batch_size = 1000
-        offset = 0
-        while True:
-            batch_rows, batch_total = fetch_cves_from_db(
+
+        def fetch_batch(offset: int, include_total_count: bool) -> tuple[list[CveRow], int | None]:
+            return fetch_cves_from_db(
                 settings,
                 product,
                 vendor or None,
@@ -1122,125 +1593,32 @@ def export_xlsx() -> object:
                 last_modified_end=last_modified_end,
                 cpe_missing_only=cpe_missing_only,
                 cpe_objects=selected_cpe_objects or None,
-                include_total_count=(total_count is None and offset == 0),
+                include_total_count=include_total_count,
             )
+
+        # Fetch the next batch on the DB pool while the current one is written to the sheet.
+        offset = 0
+        pending_batch = _db_executor.submit(fetch_batch, 0, total_count is None)
+        while pending_batch is not None:
+            batch_rows, batch_total = pending_batch.result()
             if batch_total is not None:
                 total_count = batch_total
                 _set_cached_count(count_cache_key, batch_total)
             if not batch_rows:
                 break
-            rows.extend(batch_rows)
             offset += len(batch_rows)
-            if total_count is not None and offset >= total_count:
-                break
-
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "CVE Results"
-    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    filter_summary_parts: list[str] = []
-    if keyword:
-        filter_summary_parts.append(f"keyword={keyword}")
-    if vendor:
-        filter_summary_parts.append(f"vendor={vendor}")
-    if product:
-        filter_summary_parts.append(f"product={product}")
-    if selected_impacts:
-        filter_summary_parts.append(f"impact_type={', '.join(selected_impacts)}")
-    if last_modified_start_raw:
-        filter_summary_parts.append(f"last_modified_start={last_modified_start_raw}")
-    if last_modified_end_raw:
-        filter_summary_parts.append(f"last_modified_end={last_modified_end_raw}")
-    if cpe_missing_only:
-        filter_summary_parts.append("cpe_missing_only=1")
-    if selected_cpe_objects:
-        filter_summary_parts.append(f"cpe_object={', '.join(selected_cpe_objects)}")
-    filter_summary_parts.append(f"min_cvss={min_cvss}")
-    filter_summary_parts.append(f"limit={limit}")
-    filter_summary_parts.append(f"sort={sort_key}")
-    filter_summary_parts.append(f"export_scope={export_scope}")
-    filter_summary = "; ".join(filter_summary_parts)
-
-    sheet.append(["Search Time", generated_at])
-    sheet.append(["Filter Summary", filter_summary])
-    sheet.append([])
-
-    headers = [
-        "CVE ID",
-        "CVSS Severity",
-        "CVSS Score",
-        "Impact Type",
-        "Last Modified",
-        "Description",
-        "CPE Entries",
-    ]
-    sheet.append(headers)
-    meta_label_fill = PatternFill(fill_type="solid", start_color="E8F1EF", end_color="E8F1EF")
-    header_fill = PatternFill(fill_type="solid", start_color="F2EEE4", end_color="F2EEE4")
-    sheet["A1"].font = Font(bold=True, color="0F6F65")
-    sheet["A2"].font = Font(bold=True, color="0F6F65")
-    sheet["A1"].fill = meta_label_fill
-    sheet["A2"].fill = meta_label_fill
-    sheet["B1"].alignment = Alignment(horizontal="left")
-    sheet["B2"].alignment = Alignment(horizontal="left", wrap_text=True)
-
-    header_row = 4
-    for col in range(1, len(headers) + 1):
-        cell = sheet.cell(row=header_row, column=col)
-        cell.font = Font(bold=True, color="2F3F45")
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    for row in rows:
-        severity_label, _ = format_cvss_badge(row.get("cvss_score"))
-        severity = severity_label.split(" ", 1)[0]
-        score_value = row.get("cvss_score")
-        score_text = "0.0" if score_value is None else str(score_value)
-        cpe_entries = row.get("cpe_entries") or []
-        sheet.append(
-            [
-                str(row.get("id", "UNKNOWN")),
-                severity,
-                score_text,
-                str(row.get("vuln_type", "Other")),
-                format_last_modified(row.get("last_modified_at", "N/A")),
-                str(row.get("description", "")),
-                "\n".join(str(cpe) for cpe in cpe_entries) if cpe_entries else "",
-            ]
-        )
-
-    sheet.column_dimensions["A"].width = 20
-    sheet.column_dimensions["B"].width = 14
-    sheet.column_dimensions["C"].width = 10
-    sheet.column_dimensions["D"].width = 28
-    sheet.column_dimensions["E"].width = 24
-    sheet.column_dimensions["F"].width = 90
-    sheet.column_dimensions["G"].width = 70
-
-    for row_idx in range(5, sheet.max_row + 1):
-        sheet.cell(row=row_idx, column=6).alignment = Alignment(vertical="top", wrap_text=True)
-        sheet.cell(row=row_idx, column=7).alignment = Alignment(vertical="top", wrap_text=True)
-        sheet.cell(row=row_idx, column=1).alignment = Alignment(vertical="top")
-        sheet.cell(row=row_idx, column=2).alignment = Alignment(horizontal="center", vertical="top")
-        sheet.cell(row=row_idx, column=3).alignment = Alignment(horizontal="center", vertical="top")
-        sheet.cell(row=row_idx, column=4).alignment = Alignment(vertical="top")
-        sheet.cell(row=row_idx, column=5).alignment = Alignment(vertical="top")
+            pending_batch = None
+            if total_count is None or offset < total_count:
+                pending_batch = _db_executor.submit(fetch_batch, offset, False)
+            append_rows(batch_rows)
 
-    output = BytesIO()
-    workbook.save(output)
-    output.seek(0)
     scope_text = "all" if export_scope == "all" else f"page{page}"
     filename = f"cve_export_{scope_text}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    return send_file(
-        output,
-        as_attachment=True,
-        download_name=filename,
-        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    )
+    return _send_workbook(workbook, filename)
 
 
 @app.route("/settings", methods=["GET", "POST"])
-def settings_page() -> str | object:
+def settings_page() -> object:
     user_profile = _normalize_user_profile(request.values.get("user_profile"))
     save_error = ""
     saved_notice = request.args.get("saved") == "1"
@@ -1251,7 +1629,7 @@ def settings_page() -> str | object:
     app_settings: Settings | None = None
     profile_settings = dict(DEFAULT_PROFILE_SETTINGS)
     try:
-        app_settings = load_settings(".env")
+        app_settings = _load_app_settings()
         profile_settings = fetch_profile_settings(app_settings, user_profile)
         presets = fetch_profile_presets(app_settings, user_profile)
     except Exception as exc:  # pragma: no cover
@@ -1290,8 +1668,14 @@ def settings_page() -> str | object:
                         "cpe_missing_only": request.form.get("cpe_missing_only") == "1",
                         "impact_type": [value.strip() for value in request.form.getlist("impact_type") if value.strip()],
                     }
-                    upsert_profile_preset(app_settings, user_profile, preset_name, candidate_payload, enabled=True)
-                    preview_notice = f"프리셋 '{preset_name}' 저장 완료"
+                    invalid_cpe = _invalid_new_cpe_objects(
+                        str(candidate_payload["cpe_objects_catalog"]), list(profile_settings["cpe_objects_catalog"])
+                    )
+                    if invalid_cpe:
+                        save_error = f"CPE 객체에는 a-z, 0-9, :_.- 만 사용할 수 있습니다: {', '.join(invalid_cpe)}"
+                    else:
+                        upsert_profile_preset(app_settings, user_profile, preset_name, candidate_payload, enabled=True)
+                        preview_notice = f"프리셋 '{preset_name}' 저장 완료"
                 except Exception as exc:  # pragma: no cover
                     save_error = f"프리셋 저장 실패: {exc}"
         elif action == "toggle_preset":
@@ -1357,7 +1741,13 @@ def settings_page() -> str | object:
             "impact_type": [value.strip() for value in request.form.getlist("impact_type") if value.strip()],
         }
         if action == "save":
-            if app_settings is None:
+            invalid_cpe = _invalid_new_cpe_objects(
+                str(payload["cpe_objects_catalog"]), list(profile_settings["cpe_objects_catalog"])
+            )
+            if invalid_cpe:
+                save_error = f"CPE 객체에는 a-z, 0-9, :_.- 만 사용할 수 있습니다: {', '.join(invalid_cpe)}"
+                profile_settings = _sanitize_profile_settings(payload)
+            elif app_settings is None:
                 save_error = "DB 연결 정보를 불러올 수 없어 저장할 수 없습니다."
                 profile_settings = _sanitize_profile_settings(payload)
             else:
@@ -1401,13 +1791,8 @@ def settings_page() -> str | object:
         if app_settings is not None:
             presets = fetch_profile_presets(app_settings, user_profile)
 
-    impact_options_html = "".join(
-        "<label class='impact-option'>"
-        f"<input type='checkbox' name='impact_type' value='{escape(option)}' "
-        f"{'checked' if option in profile_settings['impact_type'] else ''}>"
-        f"<span>{escape(option)}</span>"
-        "</label>"
-        for option in IMPACT_TYPE_OPTIONS
+    impact_options_html = _render_checkbox_options_html(
+        "impact_type", _IMPACT_TYPE_CHOICES, frozenset(profile_settings["impact_type"])
     )
 
     save_notice_html = "<p class='ok-msg'>저장되었습니다.</p>" if saved_notice and not save_error else ""
@@ -1415,7 +1800,20 @@ def settings_page() -> str | object:
     preview_notice_html = f"<p class='ok-msg'>{escape(preview_notice)}</p>" if preview_notice and not save_error else ""
     error_html = f"<p class='error-msg'>{escape(save_error)}</p>" if save_error else ""
     menu_html = _build_menu_html("settings", user_profile=user_profile)
-    cpe_catalog_json = json.dumps(profile_settings["cpe_objects_catalog"])
+    cpe_catalog_text = "\n".join(profile_settings["cpe_objects_catalog"])
+    escaped_settings = {
+        key: escape(str(profile_settings[key]))
+        for key in (
+            "vendor",
+            "product",
+            "keyword",
+            "min_cvss",
+            "limit",
+            "last_modified_lookback_days",
+            "daily_review_window_days",
+            "daily_review_limit",
+        )
+    }
     preset_rows_html = "".join(
         (
             "<tr>"
@@ -1460,18 +1858,286 @@ def settings_page() -> str | object:
     )
     if not preset_rows_html:
         preset_rows_html = "<tr><td colspan='7'>등록된 프리셋 없음</td></tr>"
-    return f"""
-<!doctype html>
-<html lang="ko">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>CVE Settings</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
-  <style>
-    :root {{
+    return _html_response(_SETTINGS_PAGE_HEAD_BYTES, f"""<body>
+  <main class="wrap">
+    {menu_html}
+    <section class="panel">
+      <div class="header-row">
+        <div>
+          <h1 style="margin:0 0 4px;font-size:24px;">사용자 설정</h1>
+          <p style="margin:0;color:var(--muted);font-size:13px;">프로필별 기본 검색값을 저장합니다.</p>
+        </div>
+        <div class="profile-tabs">
+          <a class="tab {'active' if user_profile == 'hq' else ''}" href="/settings?user_profile=hq">본사</a>
+          <a class="tab {'active' if user_profile == 'jaehwa' else ''}" href="/settings?user_profile=jaehwa">재화</a>
+        </div>
+      </div>
+      {save_notice_html}
+      {reset_notice_html}
+      {preview_notice_html}
+      {error_html}
+      <form method="post">
+        <input type="hidden" name="user_profile" value="{escape(user_profile)}">
+        <div>
+          <label for="vendor">기본 Vendor</label>
+          <input id="vendor" name="vendor" value="{escaped_settings['vendor']}" placeholder="e.g. ivanti">
+        </div>
+        <div>
+          <label for="product">기본 Product (쉼표로 OR)</label>
+          <input id="product" name="product" value="{escaped_settings['product']}" placeholder="e.g. endpoint_manager_mobile, pulse_connect_secure">
+        </div>
+        <div>
+          <label for="keyword">기본 Keyword (쉼표로 OR)</label>
+          <input id="keyword" name="keyword" value="{escaped_settings['keyword']}" placeholder="e.g. ssl, auth bypass, rce">
+        </div>
+        <div class="full">
+          <label>CPE 객체 목록 (vendor:product[:version])</label>
+          <input type="hidden" id="cpe_objects_catalog" name="cpe_objects_catalog" value="{escape(cpe_catalog_text)}">
+          <div class="impact-box" id="cpe-catalog-list" style="max-height:none;min-height:60px;"></div>
+          <div style="display:grid;grid-template-columns:1fr 1fr 1fr auto;gap:8px;margin-top:8px;">
+            <input id="cpe_vendor" list="cpe_vendor_suggestions" placeholder="vendor (e.g. ivanti)">
+            <input id="cpe_product" list="cpe_product_suggestions" placeholder="product (e.g. pulse_connect_secure)">
+            <input id="cpe_version" list="cpe_version_suggestions" placeholder="version (optional)">
+            <button class="btn" type="button" id="add-cpe-btn">추가</button>
+          </div>
+          <p id="cpe-input-hint" style="margin:6px 0 0;font-size:12px;color:#5e6c73;">입력 형식: vendor + product는 필수, version은 선택입니다.</p>
+          <div id="cpe-preview-grid" style="margin-top:8px;border:1px solid var(--line);border-radius:10px;overflow:hidden;background:#fff;">
+            <div style="display:grid;grid-template-columns:1fr 1fr 1fr;background:#f6f8f7;font-size:12px;font-weight:700;color:#4c5a60;padding:8px 10px;">
+              <span>Vendor</span><span>Product</span><span>Version</span>
+            </div>
+            <div id="cpe-preview-rows" style="font-size:12px;color:#2f3f45;padding:8px 10px;">추천 결과 없음</div>
+          </div>
+          <datalist id="cpe_vendor_suggestions"></datalist>
+          <datalist id="cpe_product_suggestions"></datalist>
+          <datalist id="cpe_version_suggestions"></datalist>
+        </div>
+        <div>
+          <label for="min_cvss">기본 Min CVSS</label>
+          <input id="min_cvss" name="min_cvss" type="number" min="0" max="10" step="0.1" value="{escaped_settings['min_cvss']}">
+        </div>
+        <div>
+          <label for="limit">기본 Limit (1-500)</label>
+          <input id="limit" name="limit" type="number" min="1" max="500" step="1" value="{escaped_settings['limit']}">
+        </div>
+        <div>
+          <label for="sort_key">기본 정렬</label>
+          <select id="sort_key" name="sort_key">
+            <option value="cvss_desc" {'selected' if profile_settings['sort_key'] == 'cvss_desc' else ''}>CVSS 내림차순</option>
+            <option value="cvss_asc" {'selected' if profile_settings['sort_key'] == 'cvss_asc' else ''}>CVSS 오름차순</option>
+            <option value="last_modified_desc" {'selected' if profile_settings['sort_key'] == 'last_modified_desc' else ''}>Last Modified 내림차순</option>
+            <option value="last_modified_asc" {'selected' if profile_settings['sort_key'] == 'last_modified_asc' else ''}>Last Modified 오름차순</option>
+          </select>
+        </div>
+        <div>
+          <label for="last_modified_lookback_days">기본 Last Modified 범위(일)</label>
+          <input id="last_modified_lookback_days" name="last_modified_lookback_days" type="number" min="1" max="365" step="1" value="{escaped_settings['last_modified_lookback_days']}">
+        </div>
+        <div>
+          <label for="daily_review_window_days">일일 검토 기본 기간(일)</label>
+          <input id="daily_review_window_days" name="daily_review_window_days" type="number" min="1" max="30" step="1" value="{escaped_settings['daily_review_window_days']}">
+        </div>
+        <div>
+          <label for="daily_review_limit">일일 검토 최대 건수</label>
+          <input id="daily_review_limit" name="daily_review_limit" type="number" min="1" max="1000" step="1" value="{escaped_settings['daily_review_limit']}">
+        </div>
+        <div class="checkbox-row">
+          <input id="cpe_missing_only" name="cpe_missing_only" type="checkbox" value="1" {'checked' if profile_settings['cpe_missing_only'] else ''}>
+          <label for="cpe_missing_only">기본 CPE missing only 사용</label>
+        </div>
+        <div class="full">
+          <label>기본 Impact Type</label>
+          <div class="impact-box">
+            {impact_options_html}
+          </div>
+        </div>
+        <div class="actions">
+          <a class="btn ghost" href="/?user_profile={escape(user_profile)}">검색으로 이동</a>
+          <button class="btn warn" type="submit" name="action" value="reset">기본값 복원</button>
+          <input class="preset-name-input" name="preset_name" placeholder="프리셋 이름">
+          <button class="btn ghost" type="submit" name="action" value="save_preset">현재값을 프리셋 저장</button>
+          <button class="btn ghost" type="submit" name="action" value="preview">미리보기</button>
+          <button class="btn primary" type="submit">저장</button>
+        </div>
+      </form>
+      <div class="full" style="margin-top:12px;">
+        <h3 style="margin:8px 0;font-size:16px;">프리셋 목록 (일일검토 OR 합집합 대상)</h3>
+        <table style="width:100%;border-collapse:collapse;font-size:13px;">
+          <thead>
+            <tr>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">프리셋</th>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">상태</th>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">Vendor</th>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">Product</th>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">CPE 수</th>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">수정시각</th>
+              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">관리</th>
+            </tr>
+          </thead>
+          <tbody>
+            {preset_rows_html}
+          </tbody>
+        </table>
+      </div>
+    </section>
+  </main>
+</body>
+</html>
+""")
+
+
+def _html_response(*parts: bytes | str) -> Response:
+    return Response(
+        [part.encode("utf-8") if isinstance(part, str) else part for part in parts],
+        mimetype="text/html",
+    )
+
+
+@app.get("/api/cpe/suggest")
+def api_cpe_suggest() -> object:
+    args = request.args
+    vendor = (args.get("vendor") or "").strip()
+    product = (args.get("product") or "").strip()
+    version = (args.get("version") or "").strip()
+    limit = _clip_int(args.get("limit"), 1, 20, 10)
+    try:
+        settings_obj = _load_app_settings()
+        data = fetch_cpe_autocomplete_suggestions(settings_obj, vendor, product, version, max_items=limit)
+        return jsonify(data)
+    except Exception as exc:  # pragma: no cover
+        return jsonify({"vendors": [], "products": [], "versions": [], "error": str(exc)}), 500
+
+
+@app.get("/api/cve/description")
+def api_cve_description() -> object:
+    cve_id = (request.args.get("cve_id") or "").strip()
+    if not cve_id:
+        return jsonify({"description": "", "error": "cve_id is required"}), 400
+    try:
+        settings_obj = _load_app_settings()
+        description = fetch_cve_description(settings_obj, cve_id)
+    except Exception as exc:  # pragma: no cover
+        return jsonify({"description": "", "error": str(exc)}), 500
+    if description is None:
+        return jsonify({"description": "", "error": "not found"}), 404
+    return jsonify({"description": description})
+
+
+@app.get("/api/cpe/preview")
+def api_cpe_preview() -> object:
+    args = request.args
+    vendor = (args.get("vendor") or "").strip()
+    product = (args.get("product") or "").strip()
+    version = (args.get("version") or "").strip()
+    limit = _clip_int(args.get("limit"), 1, 20, 10)
+    try:
+        settings_obj = _load_app_settings()
+        rows = fetch_cpe_preview_rows(settings_obj, vendor, product, version, limit=limit)
+        return jsonify({"rows": rows})
+    except Exception as exc:  # pragma: no cover
+        return jsonify({"rows": [], "error": str(exc)}), 500
+
+
+_COMPRESS_LEVEL = 6
+_COMPRESS_MIN_SIZE = 1024
+# Streamed tables are flushed every few rows so each WSGI write carries more than one <tr>.
+_STREAM_BATCH_ROWS = 16
+_COMPRESSIBLE_MIMETYPES = frozenset({"text/html", "text/css", "application/javascript", "application/json"})
+
+
+def _accepts_gzip() -> bool:
+    # Quality-aware, so "gzip;q=0" counts as a refusal.
+    return request.accept_encodings["gzip"] > 0
+
+
+def _gzip_stream(chunks: Iterable[bytes | str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _join_in_batches(chunks: Iterable[str], size: int = _STREAM_BATCH_ROWS) -> Iterator[str]:
+    iterator = iter(chunks)
+    while True:
+        batch = "".join(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+@app.after_request
+def compress_response(response: Response) -> Response:
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in _COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if not _accepts_gzip():
+        return response
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < _COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(data, _COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_assets: dict[str, tuple[bytes, bytes, str]] = {}
+
+
+def _register_asset(stem: str, extension: str, body: str, mimetype: str) -> str:
+    payload = body.encode("utf-8")
+    filename = f"{stem}.{hashlib.sha1(payload).hexdigest()[:10]}.{extension}"
+    _assets[filename] = (payload, gzip.compress(payload, 9), mimetype)
+    return f"/assets/{filename}"
+
+
+@app.get("/assets/<filename>")
+def serve_asset(filename: str) -> Response:
+    asset = _assets.get(filename)
+    if asset is None:
+        return Response("Not Found", status=404, mimetype="text/plain")
+    payload, gzipped, mimetype = asset
+    headers = {"Cache-Control": _ASSET_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    # The filename already carries the content hash; the gzip variant gets its own strong tag.
+    content_hash = filename.rsplit(".", 2)[1]
+    gzip_etag = f"{content_hash}-gz"
+    use_gzip = _accepts_gzip()
+    etag = gzip_etag if use_gzip else content_hash
+    # Either tag means the client already holds this content, so both revalidate to 304.
+    if_none_match = request.if_none_match
+    if if_none_match.contains_weak(content_hash) or if_none_match.contains_weak(gzip_etag):
+        response = Response(status=304, headers=headers)
+    else:
+        if use_gzip:
+            payload = gzipped
+            headers["Content-Encoding"] = "gzip"
+        response = Response(payload, mimetype=mimetype, headers=headers)
+    response.set_etag(etag)
+    return response
+
+
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    css = _CSS_PUNCT_SPACE_RE.sub(r"\1", _CSS_SPACE_RE.sub(" ", css))
+    return css.replace(";}", "}").strip()
+
+
+_SETTINGS_CSS = """
+    :root {
       --bg: #f7f4ee;
       --panel: #fffdf8;
       --ink: #1e2b31;
@@ -1479,21 +2145,21 @@ def settings_page() -> str | object:
       --line: #d7d5cc;
       --accent: #c2482e;
       --accent-2: #0f6f65;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{
+    }
+    * { box-sizing: border-box; }
+    body {
       margin: 0;
       font-family: "Space Grotesk", "Pretendard", "Noto Sans KR", sans-serif;
       color: var(--ink);
       background: radial-gradient(circle at 0% 0%, #fff9ef 0, #f7f4ee 58%);
-    }}
-    .wrap {{ width: min(1600px, 90vw); margin: 34px auto 54px; }}
-    .top-menu {{
+    }
+    .wrap { width: min(1600px, 90vw); margin: 34px auto 54px; }
+    .top-menu {
       display: flex;
       gap: 10px;
       margin-bottom: 14px;
-    }}
-    .menu-link {{
+    }
+    .menu-link {
       text-decoration: none;
       color: var(--ink);
       border: 1px solid var(--line);
@@ -1502,30 +2168,30 @@ def settings_page() -> str | object:
       padding: 8px 14px;
       font-size: 13px;
       font-weight: 700;
-    }}
-    .menu-link.active {{
+    }
+    .menu-link.active {
       color: #fff;
       background: var(--accent-2);
       border-color: var(--accent-2);
-    }}
-    .panel {{
+    }
+    .panel {
       background: var(--panel);
       border: 1px solid var(--line);
       border-radius: 16px;
       padding: 20px;
-    }}
-    .header-row {{
+    }
+    .header-row {
       display: flex;
       justify-content: space-between;
       align-items: center;
       gap: 12px;
       margin-bottom: 12px;
-    }}
-    .profile-tabs {{
+    }
+    .profile-tabs {
       display: flex;
       gap: 8px;
-    }}
-    .tab {{
+    }
+    .tab {
       text-decoration: none;
       border: 1px solid var(--line);
       color: var(--ink);
@@ -1534,34 +2200,34 @@ def settings_page() -> str | object:
       font-size: 13px;
       font-weight: 700;
       background: #fff;
-    }}
-    .tab.active {{
+    }
+    .tab.active {
       color: #fff;
       background: var(--accent);
       border-color: var(--accent);
-    }}
-    form {{
+    }
+    form {
       display: grid;
       grid-template-columns: repeat(2, minmax(0, 1fr));
       gap: 12px 16px;
-    }}
-    label {{
+    }
+    label {
       display: block;
       font-size: 12px;
       font-weight: 700;
       color: var(--muted);
       margin-bottom: 6px;
-    }}
-    input, select {{
+    }
+    input, select {
       width: 100%;
       border: 1px solid var(--line);
       border-radius: 10px;
       padding: 10px 12px;
       font: inherit;
       background: #fff;
-    }}
-    .full {{ grid-column: 1 / -1; }}
-    .impact-box {{
+    }
+    .full { grid-column: 1 / -1; }
+    .impact-box {
       border: 1px solid var(--line);
       border-radius: 10px;
       padding: 10px 12px;
@@ -1570,31 +2236,31 @@ def settings_page() -> str | object:
       overflow: auto;
       display: grid;
       gap: 8px;
-    }}
-    .impact-option {{
+    }
+    .impact-option {
       display: flex;
       align-items: center;
       gap: 8px;
       font-size: 13px;
       color: var(--ink);
-    }}
-    .impact-option input {{
+    }
+    .impact-check {
       width: auto;
       margin: 0;
-    }}
-    .checkbox-row {{
+    }
+    .checkbox-row {
       display: flex;
       align-items: center;
       gap: 8px;
       min-height: 42px;
-    }}
-    .checkbox-row label {{
+    }
+    .checkbox-row label {
       margin: 0;
       color: var(--ink);
       font-size: 13px;
       font-weight: 600;
-    }}
-    .actions {{
+    }
+    .actions {
       grid-column: 1 / -1;
       display: flex;
       justify-content: flex-end;
@@ -1602,12 +2268,12 @@ def settings_page() -> str | object:
       flex-wrap: wrap;
       gap: 8px;
       margin-top: 6px;
-    }}
-    .preset-name-input {{
+    }
+    .preset-name-input {
       width: 180px;
       min-width: 160px;
-    }}
-    .preset-mini-input {{
+    }
+    .preset-mini-input {
       width: 120px;
       min-width: 110px;
       border: 1px solid var(--line);
@@ -1615,15 +2281,15 @@ def settings_page() -> str | object:
       padding: 8px 10px;
       font: inherit;
       background: #fff;
-    }}
-    .preset-action-inline {{
+    }
+    .preset-action-inline {
       display: inline-flex;
       gap: 6px;
       align-items: center;
       margin-right: 6px;
       margin-bottom: 6px;
-    }}
-    .preset-status {{
+    }
+    .preset-status {
       display: inline-flex;
       align-items: center;
       justify-content: center;
@@ -1633,18 +2299,18 @@ def settings_page() -> str | object:
       font-size: 11px;
       font-weight: 700;
       padding: 2px 8px;
-    }}
-    .preset-status.on {{
+    }
+    .preset-status.on {
       background: #e7f6ef;
       color: #0e6a4c;
       border-color: #9ecfb9;
-    }}
-    .preset-status.off {{
+    }
+    .preset-status.off {
       background: #fff0ea;
       color: #8d3a21;
       border-color: #efb8a3;
-    }}
-    .btn {{
+    }
+    .btn {
       text-decoration: none;
       border: 1px solid var(--line);
       border-radius: 10px;
@@ -1655,768 +2321,282 @@ def settings_page() -> str | object:
       cursor: pointer;
       background: #fff;
       color: var(--ink);
-    }}
-    .btn.ghost {{
+    }
+    .btn.ghost {
       background: #f7f8f8;
       border-color: #d8dedb;
       color: #244149;
-    }}
-    .btn.warn {{
+    }
+    .btn.warn {
       background: #fff2eb;
       border-color: #efc0a8;
       color: #8a3d1e;
-    }}
-    .preset-enable-btn {{
+    }
+    .preset-enable-btn {
       background: #e7f6ef;
       border-color: #9ecfb9;
       color: #0e6a4c;
-    }}
-    .preset-toggle-btn {{
+    }
+    .preset-toggle-btn {
       min-width: 88px;
       text-align: center;
-    }}
-    .preset-disable-btn {{
+    }
+    .preset-disable-btn {
       background: #fff0ea;
       border-color: #efb8a3;
       color: #8d3a21;
-    }}
-    .preset-delete-btn {{
+    }
+    .preset-delete-btn {
       background: #fff6f2;
       border-color: #e8c8b9;
       color: #8b4432;
-    }}
-    .btn.primary {{
+    }
+    .btn.primary {
       background: var(--accent-2);
       color: #fff;
       border-color: var(--accent-2);
-    }}
-    .ok-msg {{
+    }
+    .ok-msg {
       margin: 0 0 10px;
       color: #0c6d57;
       font-size: 13px;
       font-weight: 700;
-    }}
-    .error-msg {{
+    }
+    .error-msg {
       margin: 0 0 10px;
       color: #ad3427;
       font-size: 13px;
       font-weight: 700;
-    }}
-    @media (max-width: 820px) {{
-      form {{ grid-template-columns: 1fr; }}
-      .header-row {{ flex-direction: column; align-items: flex-start; }}
-      .actions {{ justify-content: stretch; }}
-      .btn {{ flex: 1; text-align: center; min-width: 140px; }}
-      .preset-name-input {{ width: 100%; min-width: 0; }}
-    }}
-  </style>
+    }
+    @media (max-width: 820px) {
+      form { grid-template-columns: 1fr; }
+      .header-row { flex-direction: column; align-items: flex-start; }
+      .actions { justify-content: stretch; }
+      .btn { flex: 1; text-align: center; min-width: 140px; }
+      .preset-name-input { width: 100%; min-width: 0; }
+    }
+"""
+_SETTINGS_CSS_URL = _register_asset("settings", "css", _minify_css(_SETTINGS_CSS), "text/css")
+
+_SETTINGS_JS = """
+(() => {
+  const hiddenInput = document.querySelector("#cpe_objects_catalog");
+  const listWrap = document.querySelector("#cpe-catalog-list");
+  const addBtn = document.querySelector("#add-cpe-btn");
+  const vendorInput = document.querySelector("#cpe_vendor");
+  const productInput = document.querySelector("#cpe_product");
+  const versionInput = document.querySelector("#cpe_version");
+  const vendorList = document.querySelector("#cpe_vendor_suggestions");
+  const productList = document.querySelector("#cpe_product_suggestions");
+  const versionList = document.querySelector("#cpe_version_suggestions");
+  const inputHint = document.querySelector("#cpe-input-hint");
+  const previewRows = document.querySelector("#cpe-preview-rows");
+  let catalog = (hiddenInput?.value || "").split("\\n").filter(Boolean);
+  const catalogSet = new Set(catalog);
+  let suggestTimer = null;
+  let suggestAbortController = null;
+  let previewTimer = null;
+  let previewAbortController = null;
+
+  const normalize = (value) => (value || "").trim().toLowerCase();
+  const setDataList = (target, items) => {
+    if (!target) return;
+    target.innerHTML = (items || []).map((item) => `<option value="${item}"></option>`).join("");
+  };
+  const fetchSuggest = async () => {
+    const vendor = normalize(vendorInput?.value);
+    const product = normalize(productInput?.value);
+    const version = normalize(versionInput?.value);
+    const canFetch = (vendor.length >= 2) || (product.length >= 2) || (version.length >= 1 && vendor && product);
+    if (!canFetch) {
+      setDataList(vendorList, []);
+      setDataList(productList, []);
+      setDataList(versionList, []);
+      return;
+    }
+    if (suggestAbortController) {
+      suggestAbortController.abort();
+    }
+    suggestAbortController = new AbortController();
+    const params = new URLSearchParams();
+    if (vendor) params.set("vendor", vendor);
+    if (product) params.set("product", product);
+    if (version) params.set("version", version);
+    params.set("limit", "10");
+    try {
+      const response = await fetch("/api/cpe/suggest?" + params.toString(), {
+        method: "GET",
+        signal: suggestAbortController.signal,
+        headers: { "Accept": "application/json" },
+      });
+      if (!response.ok) {
+        return;
+      }
+      const data = await response.json();
+      setDataList(vendorList, data?.vendors || []);
+      setDataList(productList, data?.products || []);
+      setDataList(versionList, data?.versions || []);
+    } catch (_) {
+      // Ignore aborted or transient suggestion errors.
+    }
+  };
+  const queueSuggest = () => {
+    if (suggestTimer) {
+      clearTimeout(suggestTimer);
+    }
+    suggestTimer = setTimeout(fetchSuggest, 220);
+  };
+  const renderPreviewRows = (rows) => {
+    if (!previewRows) return;
+    if (!rows || !rows.length) {
+      previewRows.textContent = "추천 결과 없음";
+      return;
+    }
+    previewRows.innerHTML = rows.map((row) => {
+      const vendor = row?.vendor || "-";
+      const product = row?.product || "-";
+      const version = row?.version || "-";
+      return `<div style="display:grid;grid-template-columns:1fr 1fr 1fr;padding:4px 0;border-top:1px dashed #e2e6e4;"><span>${vendor}</span><span>${product}</span><span>${version}</span></div>`;
+    }).join("");
+  };
+  const fetchPreview = async () => {
+    const vendor = normalize(vendorInput?.value);
+    const product = normalize(productInput?.value);
+    const version = normalize(versionInput?.value);
+    if (previewAbortController) {
+      previewAbortController.abort();
+    }
+    previewAbortController = new AbortController();
+    const params = new URLSearchParams();
+    if (vendor) params.set("vendor", vendor);
+    if (product) params.set("product", product);
+    if (version) params.set("version", version);
+    params.set("limit", "10");
+    try {
+      const response = await fetch("/api/cpe/preview?" + params.toString(), {
+        method: "GET",
+        signal: previewAbortController.signal,
+        headers: { "Accept": "application/json" },
+      });
+      if (!response.ok) {
+        return;
+      }
+      const data = await response.json();
+      renderPreviewRows(data?.rows || []);
+    } catch (_) {
+      // Ignore aborted or transient preview errors.
+    }
+  };
+  const queuePreview = () => {
+    if (previewTimer) {
+      clearTimeout(previewTimer);
+    }
+    previewTimer = setTimeout(fetchPreview, 260);
+  };
+  const rebuildHidden = () => {
+    if (hiddenInput) {
+      hiddenInput.value = catalog.join("\\n");
+    }
+  };
+  const render = () => {
+    if (!listWrap) return;
+    if (!catalog.length) {
+      listWrap.innerHTML = "<span class='impact-chip muted-chip'>등록된 CPE 객체가 없습니다.</span>";
+      rebuildHidden();
+      return;
+    }
+    listWrap.innerHTML = catalog.map((item, idx) => {
+      return `<span class="impact-chip">${item} <button type="button" data-cpe-idx="${idx}" style="margin-left:6px;border:0;background:transparent;cursor:pointer;color:#8a2f23;">x</button></span>`;
+    }).join("");
+    rebuildHidden();
+  };
+
+  listWrap?.addEventListener("click", (event) => {
+    const btn = event.target.closest("[data-cpe-idx]");
+    if (!btn) return;
+    const idx = Number(btn.getAttribute("data-cpe-idx") || "-1");
+    if (idx < 0 || idx >= catalog.length) return;
+    catalogSet.delete(catalog[idx]);
+    catalog = catalog.filter((_, i) => i !== idx);
+    render();
+  });
+
+  addBtn?.addEventListener("click", () => {
+    const vendor = normalize(vendorInput?.value);
+    const product = normalize(productInput?.value);
+    const version = normalize(versionInput?.value);
+    if (!vendor || !product) {
+      if (inputHint) {
+        inputHint.textContent = "vendor와 product를 모두 입력해야 추가됩니다.";
+        inputHint.style.color = "#ad3427";
+      }
+      return;
+    }
+    if (inputHint) {
+      inputHint.textContent = "입력 형식: vendor + product는 필수, version은 선택입니다.";
+      inputHint.style.color = "#5e6c73";
+    }
+    const cpe = version ? `${vendor}:${product}:${version}` : `${vendor}:${product}`;
+    const added = !catalogSet.has(cpe);
+    if (added) {
+      catalog.push(cpe);
+      catalogSet.add(cpe);
+    }
+    if (vendorInput) vendorInput.value = "";
+    if (productInput) productInput.value = "";
+    if (versionInput) versionInput.value = "";
+    if (added) {
+      render();
+    }
+  });
+  vendorInput?.addEventListener("input", queueSuggest);
+  productInput?.addEventListener("input", queueSuggest);
+  versionInput?.addEventListener("input", queueSuggest);
+  vendorInput?.addEventListener("input", queuePreview);
+  productInput?.addEventListener("input", queuePreview);
+  versionInput?.addEventListener("input", queuePreview);
+  vendorInput?.addEventListener("focus", queueSuggest);
+  productInput?.addEventListener("focus", queueSuggest);
+  versionInput?.addEventListener("focus", queueSuggest);
+  vendorInput?.addEventListener("focus", queuePreview);
+  productInput?.addEventListener("focus", queuePreview);
+  versionInput?.addEventListener("focus", queuePreview);
+
+  render();
+  fetchPreview();
+})();
+"""
+_SETTINGS_JS_URL = _register_asset("settings", "js", _SETTINGS_JS, "application/javascript")
+
+_SETTINGS_PAGE_HEAD = f"""
+<!doctype html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>CVE Settings</title>
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
+  <link rel="stylesheet" href="{_SETTINGS_CSS_URL}">
+  <script defer src="{_SETTINGS_JS_URL}"></script>
 </head>
-<body>
-  <main class="wrap">
-    {menu_html}
-    <section class="panel">
-      <div class="header-row">
-        <div>
-          <h1 style="margin:0 0 4px;font-size:24px;">사용자 설정</h1>
-          <p style="margin:0;color:var(--muted);font-size:13px;">프로필별 기본 검색값을 저장합니다.</p>
-        </div>
-        <div class="profile-tabs">
-          <a class="tab {'active' if user_profile == 'hq' else ''}" href="/settings?user_profile=hq">본사</a>
-          <a class="tab {'active' if user_profile == 'jaehwa' else ''}" href="/settings?user_profile=jaehwa">재화</a>
-        </div>
-      </div>
-      {save_notice_html}
-      {reset_notice_html}
-      {preview_notice_html}
-      {error_html}
-      <form method="post">
-        <input type="hidden" name="user_profile" value="{escape(user_profile)}">
-        <div>
-          <label for="vendor">기본 Vendor</label>
-          <input id="vendor" name="vendor" value="{escape(str(profile_settings['vendor']))}" placeholder="e.g. ivanti">
-        </div>
-        <div>
-          <label for="product">기본 Product (쉼표로 OR)</label>
-          <input id="product" name="product" value="{escape(str(profile_settings['product']))}" placeholder="e.g. endpoint_manager_mobile, pulse_connect_secure">
-        </div>
-        <div>
-          <label for="keyword">기본 Keyword (쉼표로 OR)</label>
-          <input id="keyword" name="keyword" value="{escape(str(profile_settings['keyword']))}" placeholder="e.g. ssl, auth bypass, rce">
-        </div>
-        <div class="full">
-          <label>CPE 객체 목록 (vendor:product[:version])</label>
-          <input type="hidden" id="cpe_objects_catalog" name="cpe_objects_catalog" value="{escape(chr(10).join(profile_settings['cpe_objects_catalog']))}">
-          <div class="impact-box" id="cpe-catalog-list" style="max-height:none;min-height:60px;"></div>
-          <div style="display:grid;grid-template-columns:1fr 1fr 1fr auto;gap:8px;margin-top:8px;">
-            <input id="cpe_vendor" list="cpe_vendor_suggestions" placeholder="vendor (e.g. ivanti)">
-            <input id="cpe_product" list="cpe_product_suggestions" placeholder="product (e.g. pulse_connect_secure)">
-            <input id="cpe_version" list="cpe_version_suggestions" placeholder="version (optional)">
-            <button class="btn" type="button" id="add-cpe-btn">추가</button>
-          </div>
-          <p id="cpe-input-hint" style="margin:6px 0 0;font-size:12px;color:#5e6c73;">입력 형식: vendor + product는 필수, version은 선택입니다.</p>
-          <div id="cpe-preview-grid" style="margin-top:8px;border:1px solid var(--line);border-radius:10px;overflow:hidden;background:#fff;">
-            <div style="display:grid;grid-template-columns:1fr 1fr 1fr;background:#f6f8f7;font-size:12px;font-weight:700;color:#4c5a60;padding:8px 10px;">
-              <span>Vendor</span><span>Product</span><span>Version</span>
-            </div>
-            <div id="cpe-preview-rows" style="font-size:12px;color:#2f3f45;padding:8px 10px;">추천 결과 없음</div>
-          </div>
-          <datalist id="cpe_vendor_suggestions"></datalist>
-          <datalist id="cpe_product_suggestions"></datalist>
-          <datalist id="cpe_version_suggestions"></datalist>
-        </div>
-        <div>
-          <label for="min_cvss">기본 Min CVSS</label>
-          <input id="min_cvss" name="min_cvss" type="number" min="0" max="10" step="0.1" value="{escape(str(profile_settings['min_cvss']))}">
-        </div>
-        <div>
-          <label for="limit">기본 Limit (1-500)</label>
-          <input id="limit" name="limit" type="number" min="1" max="500" step="1" value="{escape(str(profile_settings['limit']))}">
-        </div>
-        <div>
-          <label for="sort_key">기본 정렬</label>
-          <select id="sort_key" name="sort_key">
-            <option value="cvss_desc" {'selected' if profile_settings['sort_key'] == 'cvss_desc' else ''}>CVSS 내림차순</option>
-            <option value="cvss_asc" {'selected' if profile_settings['sort_key'] == 'cvss_asc' else ''}>CVSS 오름차순</option>
-            <option value="last_modified_desc" {'selected' if profile_settings['sort_key'] == 'last_modified_desc' else ''}>Last Modified 내림차순</option>
-            <option value="last_modified_asc" {'selected' if profile_settings['sort_key'] == 'last_modified_asc' else ''}>Last Modified 오름차순</option>
-          </select>
-        </div>
-        <div>
-          <label for="last_modified_lookback_days">기본 Last Modified 범위(일)</label>
-          <input id="last_modified_lookback_days" name="last_modified_lookback_days" type="number" min="1" max="365" step="1" value="{escape(str(profile_settings['last_modified_lookback_days']))}">
-        </div>
-        <div>
-          <label for="daily_review_window_days">일일 검토 기본 기간(일)</label>
-          <input id="daily_review_window_days" name="daily_review_window_days" type="number" min="1" max="30" step="1" value="{escape(str(profile_settings['daily_review_window_days']))}">
-        </div>
-        <div>
-          <label for="daily_review_limit">일일 검토 최대 건수</label>
-          <input id="daily_review_limit" name="daily_review_limit" type="number" min="1" max="1000" step="1" value="{escape(str(profile_settings['daily_review_limit']))}">
-        </div>
-        <div class="checkbox-row">
-          <input id="cpe_missing_only" name="cpe_missing_only" type="checkbox" value="1" {'checked' if profile_settings['cpe_missing_only'] else ''}>
-          <label for="cpe_missing_only">기본 CPE missing only 사용</label>
-        </div>
-        <div class="full">
-          <label>기본 Impact Type</label>
-          <div class="impact-box">
-            {impact_options_html}
-          </div>
-        </div>
-        <div class="actions">
-          <a class="btn ghost" href="/?user_profile={escape(user_profile)}">검색으로 이동</a>
-          <button class="btn warn" type="submit" name="action" value="reset">기본값 복원</button>
-          <input class="preset-name-input" name="preset_name" placeholder="프리셋 이름">
-          <button class="btn ghost" type="submit" name="action" value="save_preset">현재값을 프리셋 저장</button>
-          <button class="btn ghost" type="submit" name="action" value="preview">미리보기</button>
-          <button class="btn primary" type="submit">저장</button>
-        </div>
-      </form>
-      <div class="full" style="margin-top:12px;">
-        <h3 style="margin:8px 0;font-size:16px;">프리셋 목록 (일일검토 OR 합집합 대상)</h3>
-        <table style="width:100%;border-collapse:collapse;font-size:13px;">
-          <thead>
-            <tr>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">프리셋</th>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">상태</th>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">Vendor</th>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">Product</th>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">CPE 수</th>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">수정시각</th>
-              <th style="text-align:left;border-top:1px solid var(--line);padding:8px;">관리</th>
-            </tr>
-          </thead>
-          <tbody>
-            {preset_rows_html}
-          </tbody>
-        </table>
-      </div>
-    </section>
-  </main>
-</body>
-<script>
-  (() => {{
-    const hiddenInput = document.querySelector("#cpe_objects_catalog");
-    const listWrap = document.querySelector("#cpe-catalog-list");
-    const addBtn = document.querySelector("#add-cpe-btn");
-    const vendorInput = document.querySelector("#cpe_vendor");
-    const productInput = document.querySelector("#cpe_product");
-    const versionInput = document.querySelector("#cpe_version");
-    const vendorList = document.querySelector("#cpe_vendor_suggestions");
-    const productList = document.querySelector("#cpe_product_suggestions");
-    const versionList = document.querySelector("#cpe_version_suggestions");
-    const inputHint = document.querySelector("#cpe-input-hint");
-    const previewRows = document.querySelector("#cpe-preview-rows");
-    let catalog = {cpe_catalog_json};
-    let suggestTimer = null;
-    let suggestAbortController = null;
-    let previewTimer = null;
-    let previewAbortController = null;
-
-    const normalize = (value) => (value || "").trim().toLowerCase();
-    const setDataList = (target, items) => {{
-      if (!target) return;
-      target.innerHTML = (items || []).map((item) => `<option value="${{item}}"></option>`).join("");
-    }};
-    const fetchSuggest = async () => {{
-      const vendor = normalize(vendorInput?.value);
-      const product = normalize(productInput?.value);
-      const version = normalize(versionInput?.value);
-      const canFetch = (vendor.length >= 2) || (product.length >= 2) || (version.length >= 1 && vendor && product);
-      if (!canFetch) {{
-        setDataList(vendorList, []);
-        setDataList(productList, []);
-        setDataList(versionList, []);
-        return;
-      }}
-      if (suggestAbortController) {{
-        suggestAbortController.abort();
-      }}
-      suggestAbortController = new AbortController();
-      const params = new URLSearchParams();
-      if (vendor) params.set("vendor", vendor);
-      if (product) params.set("product", product);
-      if (version) params.set("version", version);
-      params.set("limit", "10");
-      try {{
-        const response = await fetch("/api/cpe/suggest?" + params.toString(), {{
-          method: "GET",
-          signal: suggestAbortController.signal,
-          headers: {{ "Accept": "application/json" }},
-        }});
-        if (!response.ok) {{
-          return;
-        }}
-        const data = await response.json();
-        setDataList(vendorList, data?.vendors || []);
-        setDataList(productList, data?.products || []);
-        setDataList(versionList, data?.versions || []);
-      }} catch (_) {{
-        // Ignore aborted or transient suggestion errors.
-      }}
-    }};
-    const queueSuggest = () => {{
-      if (suggestTimer) {{
-        clearTimeout(suggestTimer);
-      }}
-      suggestTimer = setTimeout(fetchSuggest, 220);
-    }};
-    const renderPreviewRows = (rows) => {{
-      if (!previewRows) return;
-      if (!rows || !rows.length) {{
-        previewRows.textContent = "추천 결과 없음";
-        return;
-      }}
-      previewRows.innerHTML = rows.map((row) => {{
-        const vendor = row?.vendor || "-";
-        const product = row?.product || "-";
-        const version = row?.version || "-";
-        return `<div style="display:grid;grid-template-columns:1fr 1fr 1fr;padding:4px 0;border-top:1px dashed #e2e6e4;"><span>${{vendor}}</span><span>${{product}}</span><span>${{version}}</span></div>`;
-      }}).join("");
-    }};
-    const fetchPreview = async () => {{
-      const vendor = normalize(vendorInput?.value);
-      const product = normalize(productInput?.value);
-      const version = normalize(versionInput?.value);
-      if (previewAbortController) {{
-        previewAbortController.abort();
-      }}
-      previewAbortController = new AbortController();
-      const params = new URLSearchParams();
-      if (vendor) params.set("vendor", vendor);
-      if (product) params.set("product", product);
-      if (version) params.set("version", version);
-      params.set("limit", "10");
-      try {{
-        const response = await fetch("/api/cpe/preview?" + params.toString(), {{
-          method: "GET",
-          signal: previewAbortController.signal,
-          headers: {{ "Accept": "application/json" }},
-        }});
-        if (!response.ok) {{
-          return;
-        }}
-        const data = await response.json();
-        renderPreviewRows(data?.rows || []);
-      }} catch (_) {{
-        // Ignore aborted or transient preview errors.
-      }}
-    }};
-    const queuePreview = () => {{
-      if (previewTimer) {{
-        clearTimeout(previewTimer);
-      }}
-      previewTimer = setTimeout(fetchPreview, 260);
-    }};
-    const rebuildHidden = () => {{
-      if (hiddenInput) {{
-        hiddenInput.value = catalog.join("\\n");
-      }}
-    }};
-    const render = () => {{
-      if (!listWrap) return;
-      if (!catalog.length) {{
-        listWrap.innerHTML = "<span class='impact-chip muted-chip'>등록된 CPE 객체가 없습니다.</span>";
-        rebuildHidden();
-        return;
-      }}
-      listWrap.innerHTML = catalog.map((item, idx) => {{
-        return `<span class="impact-chip">${{item}} <button type="button" data-cpe-idx="${{idx}}" style="margin-left:6px;border:0;background:transparent;cursor:pointer;color:#8a2f23;">x</button></span>`;
-      }}).join("");
-      listWrap.querySelectorAll("[data-cpe-idx]").forEach((btn) => {{
-        btn.addEventListener("click", () => {{
-          const idx = Number(btn.getAttribute("data-cpe-idx") || "-1");
-          if (idx < 0) return;
-          catalog = catalog.filter((_, i) => i !== idx);
-          render();
-        }});
-      }});
-      rebuildHidden();
-    }};
-
-    addBtn?.addEventListener("click", () => {{
-      const vendor = normalize(vendorInput?.value);
-      const product = normalize(productInput?.value);
-      const version = normalize(versionInput?.value);
-      if (!vendor || !product) {{
-        if (inputHint) {{
-          inputHint.textContent = "vendor와 product를 모두 입력해야 추가됩니다.";
-          inputHint.style.color = "#ad3427";
-        }}
-        return;
-      }}
-      if (inputHint) {{
-        inputHint.textContent = "입력 형식: vendor + product는 필수, version은 선택입니다.";
-        inputHint.style.color = "#5e6c73";
-      }}
-      const cpe = version ? `${{vendor}}:${{product}}:${{version}}` : `${{vendor}}:${{product}}`;
-      if (!catalog.includes(cpe)) {{
-        catalog.push(cpe);
-      }}
-      if (vendorInput) vendorInput.value = "";
-      if (productInput) productInput.value = "";
-      if (versionInput) versionInput.value = "";
-      render();
-    }});
-    vendorInput?.addEventListener("input", queueSuggest);
-    productInput?.addEventListener("input", queueSuggest);
-    versionInput?.addEventListener("input", queueSuggest);
-    vendorInput?.addEventListener("input", queuePreview);
-    productInput?.addEventListener("input", queuePreview);
-    versionInput?.addEventListener("input", queuePreview);
-    vendorInput?.addEventListener("focus", queueSuggest);
-    productInput?.addEventListener("focus", queueSuggest);
-    versionInput?.addEventListener("focus", queueSuggest);
-    vendorInput?.addEventListener("focus", queuePreview);
-    productInput?.addEventListener("focus", queuePreview);
-    versionInput?.addEventListener("focus", queuePreview);
-
-    render();
-    fetchPreview();
-  }})();
-</script>
-</html>
 """
+_SETTINGS_PAGE_HEAD_BYTES = _SETTINGS_PAGE_HEAD.encode("utf-8")
 
-
-@app.get("/api/cpe/suggest")
-def api_cpe_suggest() -> object:
-    vendor = (request.args.get("vendor") or "").strip()
-    product = (request.args.get("product") or "").strip()
-    version = (request.args.get("version") or "").strip()
-    limit_raw = (request.args.get("limit") or "10").strip()
-    try:
-        limit = int(limit_raw)
-    except ValueError:
-        limit = 10
-    limit = max(1, min(limit, 20))
-    try:
-        settings_obj = load_settings(".env")
-        data = fetch_cpe_autocomplete_suggestions(settings_obj, vendor, product, version, max_items=limit)
-        return jsonify(data)
-    except Exception as exc:  # pragma: no cover
-        return jsonify({"vendors": [], "products": [], "versions": [], "error": str(exc)}), 500
-
-
-@app.get("/api/cpe/preview")
-def api_cpe_preview() -> object:
-    vendor = (request.args.get("vendor") or "").strip()
-    product = (request.args.get("product") or "").strip()
-    version = (request.args.get("version") or "").strip()
-    limit_raw = (request.args.get("limit") or "10").strip()
-    try:
-        limit = int(limit_raw)
-    except ValueError:
-        limit = 10
-    limit = max(1, min(limit, 20))
-    try:
-        settings_obj = load_settings(".env")
-        rows = fetch_cpe_preview_rows(settings_obj, vendor, product, version, limit=limit)
-        return jsonify({"rows": rows})
-    except Exception as exc:  # pragma: no cover
-        return jsonify({"rows": [], "error": str(exc)}), 500
-
-
-@app.get("/")
-def index() -> str:
-    user_profile = _normalize_user_profile(request.args.get("user_profile"))
-    app_settings: Settings | None = None
-    profile_defaults = dict(DEFAULT_PROFILE_SETTINGS)
-    bootstrap_error = ""
-    try:
-        app_settings = load_settings(".env")
-        profile_defaults = fetch_profile_settings(app_settings, user_profile)
-    except Exception as exc:  # pragma: no cover
-        bootstrap_error = f"설정 로딩 실패: {exc}"
-
-    product = (
-        (request.args.get("product") if "product" in request.args else str(profile_defaults["product"]) or "").strip()
-    )
-    vendor = (
-        (request.args.get("vendor") if "vendor" in request.args else str(profile_defaults["vendor"]) or "").strip()
-    )
-    keyword = (
-        (request.args.get("keyword") if "keyword" in request.args else str(profile_defaults["keyword"]) or "").strip()
-    )
-
-    user_supplied_last_modified = any(
-        name in request.args
-        for name in {
-            "last_modified_present",
-            "last_modified_start",
-            "last_modified_end",
-            "last_modified_start_date",
-            "last_modified_start_time",
-            "last_modified_end_date",
-            "last_modified_end_time",
-        }
-    )
-    if user_supplied_last_modified:
-        last_modified_start_raw = _compose_datetime_arg("last_modified_start")
-        last_modified_end_raw = _compose_datetime_arg("last_modified_end")
-    else:
-        lookback_days = int(profile_defaults["last_modified_lookback_days"])
-        now_local = datetime.now().replace(second=0, microsecond=0)
-        last_modified_end_raw = now_local.isoformat(timespec="minutes")
-        last_modified_start_raw = (now_local - timedelta(days=lookback_days)).isoformat(timespec="minutes")
-    last_modified_start_date_raw, last_modified_start_time_raw = _split_datetime_for_inputs(last_modified_start_raw)
-    last_modified_end_date_raw, last_modified_end_time_raw = _split_datetime_for_inputs(last_modified_end_raw)
-
-    if "cpe_missing_only_present" in request.args or "cpe_missing_only" in request.args:
-        cpe_missing_only = request.args.get("cpe_missing_only") == "1"
-    else:
-        cpe_missing_only = bool(profile_defaults["cpe_missing_only"])
-
-    if "impact_type_present" in request.args or "impact_type" in request.args:
-        selected_impacts = [value.strip() for value in request.args.getlist("impact_type") if value.strip()]
-    else:
-        selected_impacts = list(profile_defaults["impact_type"])
-    cpe_objects_catalog = [str(value).strip().lower() for value in profile_defaults.get("cpe_objects_catalog", []) if str(value).strip()]
-    if "cpe_object_present" in request.args or "cpe_object" in request.args:
-        selected_cpe_objects = [value.strip().lower() for value in request.args.getlist("cpe_object") if value.strip()]
-    else:
-        selected_cpe_objects = []
-    selected_cpe_objects = [value for value in selected_cpe_objects if value in cpe_objects_catalog]
-
-    sort_map = {
-        "cvss_desc": ("cvss", "desc"),
-        "cvss_asc": ("cvss", "asc"),
-        "last_modified_desc": ("last_modified", "desc"),
-        "last_modified_asc": ("last_modified", "asc"),
+_SEARCH_CSS = """
+    :root {
+      --bg: #f7f4ee;
+      --panel: #fffdf8;
+      --ink: #1e2b31;
+      --muted: #5e6c73;
+      --line: #d7d5cc;
+      --accent: #c2482e;
+      --accent-2: #0f6f65;
+      --shadow: 0 14px 36px rgba(30, 43, 49, 0.12);
     }
-
-    min_cvss_raw = (
-        request.args.get("min_cvss")
-        if "min_cvss" in request.args
-        else str(profile_defaults["min_cvss"])
-    )
-    limit_raw = (
-        request.args.get("limit")
-        if "limit" in request.args
-        else str(profile_defaults["limit"])
-    )
-    min_cvss_raw = (min_cvss_raw or "0").strip()
-    limit_raw = (limit_raw or "50").strip()
-
-    try:
-        min_cvss = float(min_cvss_raw)
-    except ValueError:
-        min_cvss = 0.0
-
-    try:
-        limit = int(limit_raw)
-    except ValueError:
-        limit = 50
-    limit = max(1, min(limit, 500))
-
-    page_raw = (request.args.get("page") or "1").strip()
-    try:
-        page = int(page_raw)
-    except ValueError:
-        page = 1
-    page = max(1, page)
-    offset = (page - 1) * limit
-
-    sort_key_param = (
-        request.args.get("sort_key")
-        if "sort_key" in request.args
-        else str(profile_defaults["sort_key"])
-    )
-    sort_key = (sort_key_param or "cvss_desc").strip().lower()
-    sort_by, sort_order = sort_map.get(sort_key, ("cvss", "desc"))
-
-    last_modified_start: datetime | None = None
-    last_modified_end: datetime | None = None
-    rows: list[dict[str, object]] = []
-    total_count = 0
-    error_text = ""
-    checkpoint_text = "기록 없음"
-    count_cache_key = _build_count_cache_key(
-        product,
-        vendor,
-        keyword,
-        selected_impacts,
-        min_cvss,
-        last_modified_start_raw,
-        last_modified_end_raw,
-        cpe_missing_only,
-        selected_cpe_objects,
-    )
-    cached_total = _get_cached_count(count_cache_key)
-    should_fetch_total_count = (page == 1) or (cached_total is None)
-
-    try:
-        if last_modified_start_raw:
-            last_modified_start = datetime.fromisoformat(last_modified_start_raw)
-        if last_modified_end_raw:
-            last_modified_end = datetime.fromisoformat(last_modified_end_raw)
-    except ValueError:
-        error_text = "Invalid Last Modified datetime. Use format YYYY-MM-DDTHH:MM."
-
-    if (
-        not error_text
-        and last_modified_start is not None
-        and last_modified_end is not None
-        and last_modified_start > last_modified_end
-    ):
-        error_text = "Last Modified Start must be earlier than or equal to End."
-
-    if not error_text and not bootstrap_error:
-        try:
-            try:
-                checkpoint_value = fetch_incremental_checkpoint(app_settings)
-                checkpoint_text = format_checkpoint_kst(checkpoint_value)
-            except Exception:
-                checkpoint_text = "조회 실패"
-            rows, total_count = fetch_cves_from_db(
-                app_settings,
-                product,
-                vendor or None,
-                keyword or None,
-                selected_impacts or None,
-                min_cvss,
-                limit,
-                offset=offset,
-                sort_by=sort_by,
-                sort_order=sort_order,
-                last_modified_start=last_modified_start,
-                last_modified_end=last_modified_end,
-                cpe_missing_only=cpe_missing_only,
-                cpe_objects=selected_cpe_objects or None,
-                include_total_count=should_fetch_total_count,
-            )
-            if total_count is None:
-                total_count = cached_total or 0
-            else:
-                _set_cached_count(count_cache_key, total_count)
-        except Exception as exc:  # pragma: no cover
-            error_text = str(exc)
-    if bootstrap_error and not error_text:
-        error_text = bootstrap_error
-
-    row_chunks: list[str] = []
-    for row in rows:
-        cve_id = escape(str(row.get("id", "UNKNOWN")))
-        score_label, score_class = format_cvss_badge(row.get("cvss_score"))
-        score_text = escape(score_label)
-        vuln_type = escape(str(row.get("vuln_type", "Other")))
-        last_modified = escape(format_last_modified(row.get("last_modified_at", "N/A")))
-        description = str(row.get("description", ""))
-        summary = escape(shorten(description))
-        full_description = escape(description)
-        cpe_entries = row.get("cpe_entries") or []
-        cpe_badges = "".join(
-            f"<span class='cpe-chip'>{format_cpe_for_wrap(cpe_value)}</span>" for cpe_value in cpe_entries[:10]
-        )
-        if not cpe_badges:
-            cpe_badges = "<span class='cpe-chip'>-</span>"
-        cpe_for_copy = escape(", ".join(str(cpe_value) for cpe_value in cpe_entries)) if cpe_entries else "-"
-
-        row_chunks.append(
-            "<tr>"
-            f"<td class='id'>{cve_id}</td>"
-            f"<td class='score'><span class='cvss-chip {escape(score_class)}'>{score_text}</span></td>"
-            f"<td class='lastmod'>{last_modified}</td>"
-            f"<td class='vtype'>{vuln_type}</td>"
-            f"<td class='desc'>{summary}</td>"
-            f"<td class='cpe'><div class='cpe-wrap'>{cpe_badges}</div></td>"
-            "<td class='actions'>"
-            f"<button type='button' class='copy-btn' data-copy='{cve_id}'>Copy CVE</button>"
-            f"<button type='button' class='copy-btn alt' data-copy='{cpe_for_copy}'>Copy CPE</button>"
-            f"<button type='button' class='copy-btn view-btn' data-cve='{cve_id}' data-desc='{full_description}'>View</button>"
-            "</td>"
-            "</tr>"
-        )
-    rows_html = "".join(row_chunks)
-    if not rows_html:
-        rows_html = "<tr><td colspan='7'>No results</td></tr>"
-
-    base_query: dict[str, object] = {
-        "user_profile": user_profile,
-        "vendor": vendor,
-        "product": product,
-        "keyword": keyword,
-        "min_cvss": str(min_cvss),
-        "limit": str(limit),
-        "page": str(page),
-        "sort_key": sort_key,
-    }
-    if "impact_type_present" in request.args:
-        base_query["impact_type_present"] = "1"
-    if "cpe_missing_only_present" in request.args:
-        base_query["cpe_missing_only_present"] = "1"
-    if "last_modified_present" in request.args:
-        base_query["last_modified_present"] = "1"
-    if "cpe_object_present" in request.args:
-        base_query["cpe_object_present"] = "1"
-    if last_modified_start_raw:
-        base_query["last_modified_start"] = last_modified_start_raw
-    if last_modified_end_raw:
-        base_query["last_modified_end"] = last_modified_end_raw
-    if selected_impacts:
-        base_query["impact_type"] = selected_impacts
-    if cpe_missing_only:
-        base_query["cpe_missing_only"] = "1"
-    if selected_cpe_objects:
-        base_query["cpe_object"] = selected_cpe_objects
-
-    def build_sort_href(target: str) -> str:
-        if target == "cvss":
-            next_key = "cvss_asc" if sort_key == "cvss_desc" else "cvss_desc"
-        else:
-            next_key = "last_modified_asc" if sort_key == "last_modified_desc" else "last_modified_desc"
-        query = dict(base_query)
-        query["sort_key"] = next_key
-        return "?" + urlencode(query, doseq=True)
-
-    cvss_sort_href = build_sort_href("cvss")
-    last_modified_sort_href = build_sort_href("last_modified")
-    cvss_sort_marker = "▼" if sort_key == "cvss_desc" else ("▲" if sort_key == "cvss_asc" else "")
-    last_modified_sort_marker = (
-        "▼" if sort_key == "last_modified_desc" else ("▲" if sort_key == "last_modified_asc" else "")
-    )
-
-    impact_options_html = "".join(
-        "<label class='impact-option'>"
-        f"<input type='checkbox' name='impact_type' value='{escape(option)}' {'checked' if option in selected_impacts else ''}>"
-        f"<span>{escape(option)}</span>"
-        "</label>"
-        for option in IMPACT_TYPE_OPTIONS
-    )
-    impact_summary = "All impact types" if not selected_impacts else f"Impact Type ({len(selected_impacts)} selected)"
-    impact_selected_html = (
-        "".join(f"<span class='impact-chip'>{escape(value)}</span>" for value in selected_impacts)
-        if selected_impacts
-        else "<span class='impact-chip muted-chip'>No filter</span>"
-    )
-    cpe_object_options_html = "".join(
-        "<label class='impact-option'>"
-        f"<input type='checkbox' name='cpe_object' value='{escape(cpe_obj)}' {'checked' if cpe_obj in selected_cpe_objects else ''}>"
-        f"<span>{escape(cpe_obj)}</span>"
-        "</label>"
-        for cpe_obj in cpe_objects_catalog
-    )
-    cpe_object_summary = (
-        "No CPE object configured"
-        if not cpe_objects_catalog
-        else (
-            "All configured CPE objects" if not selected_cpe_objects else f"CPE Object ({len(selected_cpe_objects)} selected)"
-        )
-    )
-    cpe_object_selected_html = (
-        "".join(f"<span class='impact-chip'>{escape(value)}</span>" for value in selected_cpe_objects)
-        if selected_cpe_objects
-        else "<span class='impact-chip muted-chip'>No filter</span>"
-    )
-    cpe_missing_checked = "checked" if cpe_missing_only else ""
-    total_pages = max(1, math.ceil(total_count / limit)) if total_count > 0 else 1
-    if page > total_pages:
-        page = total_pages
-    page_start = max(1, page - 2)
-    page_end = min(total_pages, page + 2)
-    pager_links: list[str] = []
-    for page_no in range(page_start, page_end + 1):
-        page_query = dict(base_query)
-        page_query["page"] = str(page_no)
-        page_href = "?" + urlencode(page_query, doseq=True)
-        if page_no == page:
-            pager_links.append(f"<span class='page-link current'>{page_no}</span>")
-        else:
-            pager_links.append(f"<a class='page-link' href='{escape(page_href)}'>{page_no}</a>")
-    prev_href = ""
-    next_href = ""
-    if page > 1:
-        prev_query = dict(base_query)
-        prev_query["page"] = str(page - 1)
-        prev_href = "?" + urlencode(prev_query, doseq=True)
-    if page < total_pages:
-        next_query = dict(base_query)
-        next_query["page"] = str(page + 1)
-        next_href = "?" + urlencode(next_query, doseq=True)
-    prev_link_html = (
-        f"<a class='page-link' href='{escape(prev_href)}'>Prev</a>"
-        if prev_href
-        else "<span class='page-link disabled'>Prev</span>"
-    )
-    next_link_html = (
-        f"<a class='page-link' href='{escape(next_href)}'>Next</a>"
-        if next_href
-        else "<span class='page-link disabled'>Next</span>"
-    )
-    pager_html = (
-        "<div class='pager'>"
-        f"{prev_link_html}"
-        f"{''.join(pager_links)}"
-        f"{next_link_html}"
-        "</div>"
-    )
-
-    error_html = f"<p class='error'>Error: {escape(error_text)}</p>" if error_text else ""
-    menu_html = _build_menu_html("search", user_profile=user_profile)
-
-    return f"""
-<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>CVE Query</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
-  <style>
-    :root {{
-      --bg: #f7f4ee;
-      --panel: #fffdf8;
-      --ink: #1e2b31;
-      --muted: #5e6c73;
-      --line: #d7d5cc;
-      --accent: #c2482e;
-      --accent-2: #0f6f65;
-      --shadow: 0 14px 36px rgba(30, 43, 49, 0.12);
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{
+    * { box-sizing: border-box; }
+    body {
       margin: 0;
       font-family: 'Space Grotesk', 'Segoe UI', sans-serif;
       color: var(--ink);
@@ -2425,18 +2605,18 @@ def index() -> str:
         radial-gradient(circle at 100% 100%, rgba(15, 111, 101, 0.2), transparent 45%),
         var(--bg);
       min-height: 100vh;
-    }}
-    .wrap {{
+    }
+    .wrap {
       width: min(1600px, 90vw);
       margin: 34px auto 54px;
       animation: rise 280ms ease-out;
-    }}
-    .top-menu {{
+    }
+    .top-menu {
       display: flex;
       gap: 10px;
       margin-bottom: 12px;
-    }}
-    .menu-link {{
+    }
+    .menu-link {
       text-decoration: none;
       color: var(--ink);
       border: 1px solid var(--line);
@@ -2445,13 +2625,13 @@ def index() -> str:
       padding: 8px 14px;
       font-size: 13px;
       font-weight: 700;
-    }}
-    .menu-link.active {{
+    }
+    .menu-link.active {
       color: #fff;
       background: var(--accent-2);
       border-color: var(--accent-2);
-    }}
-    .hero {{
+    }
+    .hero {
       margin-bottom: 14px;
       padding: 20px 22px;
       border: 1px solid var(--line);
@@ -2463,19 +2643,19 @@ def index() -> str:
       align-items: flex-start;
       gap: 14px;
       flex-wrap: wrap;
-    }}
-    .hero-copy {{ min-width: 260px; }}
-    h1 {{
+    }
+    .hero-copy { min-width: 260px; }
+    h1 {
       margin: 0;
       font-size: clamp(24px, 3vw, 34px);
       letter-spacing: 0.2px;
-    }}
-    .sub {{
+    }
+    .sub {
       margin: 8px 0 0;
       color: var(--muted);
       font-size: 14px;
-    }}
-    .checkpoint-badge {{
+    }
+    .checkpoint-badge {
       margin-left: auto;
       border: 1px solid #c8d8d3;
       border-radius: 11px;
@@ -2485,23 +2665,23 @@ def index() -> str:
       color: #27424a;
       line-height: 1.35;
       text-align: right;
-    }}
-    .checkpoint-badge strong {{
+    }
+    .checkpoint-badge strong {
       display: block;
       color: #123a44;
       font-size: 11px;
       letter-spacing: 0.2px;
       text-transform: uppercase;
       margin-bottom: 2px;
-    }}
-    .panel {{
+    }
+    .panel {
       border: 1px solid var(--line);
       border-radius: 18px;
       background: var(--panel);
       box-shadow: var(--shadow);
       overflow: visible;
-    }}
-    .panel > form {{
+    }
+    .panel > form {
       padding: 16px;
       display: grid;
       grid-template-columns:
@@ -2515,29 +2695,29 @@ def index() -> str:
       align-items: start;
       background: linear-gradient(180deg, #fffdf8, #fff9ef);
       border-bottom: 1px solid var(--line);
-    }}
-    .field-lastmod-start {{ grid-column: 1 / 2; }}
-    .field-lastmod-end {{ grid-column: 2 / 3; }}
-    .datetime-parts {{
+    }
+    .field-lastmod-start { grid-column: 1 / 2; }
+    .field-lastmod-end { grid-column: 2 / 3; }
+    .datetime-parts {
       display: grid;
       grid-template-columns: minmax(0, 1fr) 88px;
       gap: 6px;
-    }}
-    .datetime-time {{
+    }
+    .datetime-time {
       text-align: center;
       font-variant-numeric: tabular-nums;
-    }}
-    .field-keyword {{ grid-column: 1 / 3; }}
-    .field-vendor {{ grid-column: 3 / 5; }}
-    .field-product {{ grid-column: 5 / 7; }}
-    label {{
+    }
+    .field-keyword { grid-column: 1 / 3; }
+    .field-vendor { grid-column: 3 / 5; }
+    .field-product { grid-column: 5 / 7; }
+    label {
       font-size: 12px;
       color: var(--muted);
       display: block;
       margin-bottom: 5px;
       font-weight: 500;
-    }}
-    input {{
+    }
+    input {
       width: 100%;
       padding: 10px 11px;
       border: 1px solid var(--line);
@@ -2546,8 +2726,8 @@ def index() -> str:
       color: var(--ink);
       outline: none;
       transition: border-color 140ms ease, box-shadow 140ms ease;
-    }}
-    select {{
+    }
+    select {
       width: 100%;
       padding: 10px 11px;
       border: 1px solid var(--line);
@@ -2555,35 +2735,35 @@ def index() -> str:
       background: #fff;
       color: var(--ink);
       outline: none;
-    }}
-    input:focus {{
+    }
+    input:focus {
       border-color: var(--accent-2);
       box-shadow: 0 0 0 3px rgba(15, 111, 101, 0.15);
-    }}
-    select:focus {{
+    }
+    select:focus {
       border-color: var(--accent-2);
       box-shadow: 0 0 0 3px rgba(15, 111, 101, 0.15);
-    }}
-    .impact-details {{
+    }
+    .impact-details {
       position: relative;
       border: 1px solid var(--line);
       border-radius: 10px;
       background: #fff;
       overflow: visible;
-    }}
-    .impact-details > summary {{
+    }
+    .impact-details > summary {
       list-style: none;
       cursor: pointer;
       padding: 10px 11px;
       font-size: 14px;
       user-select: none;
-    }}
-    .impact-details > summary::-webkit-details-marker {{ display: none; }}
-    .impact-details[open] > summary {{
+    }
+    .impact-details > summary::-webkit-details-marker { display: none; }
+    .impact-details[open] > summary {
       border-bottom: 1px solid var(--line);
       background: #f9fbfa;
-    }}
-    .impact-list {{
+    }
+    .impact-list {
       position: absolute;
       top: calc(100% + 6px);
       left: 0;
@@ -2599,8 +2779,8 @@ def index() -> str:
       border-radius: 10px;
       background: #fff;
       box-shadow: 0 12px 28px rgba(25, 39, 45, 0.18);
-    }}
-    .impact-option {{
+    }
+    .impact-option {
       display: grid;
       grid-template-columns: 16px minmax(0, 1fr);
       align-items: center;
@@ -2610,27 +2790,27 @@ def index() -> str:
       padding: 6px 8px;
       border-radius: 6px;
       line-height: 1.2;
-    }}
-    .impact-option input[type="checkbox"] {{
+    }
+    .impact-check {
       width: 14px;
       height: 14px;
       margin: 0;
       accent-color: #0f6f65;
-    }}
-    .impact-option span {{
+    }
+    .impact-option span {
       display: inline-block;
       min-width: 0;
       font-weight: 500;
       color: #2f3f45;
-    }}
-    .impact-option:hover {{ background: #f6faf9; }}
-    .impact-selected {{
+    }
+    .impact-option:hover { background: #f6faf9; }
+    .impact-selected {
       margin-top: 6px;
       display: flex;
       flex-wrap: wrap;
       gap: 6px;
-    }}
-    .impact-chip {{
+    }
+    .impact-chip {
       border: 1px solid #cfddd9;
       background: #f0faf7;
       color: #1a5852;
@@ -2638,13 +2818,13 @@ def index() -> str:
       padding: 2px 8px;
       font-size: 11px;
       white-space: nowrap;
-    }}
-    .muted-chip {{
+    }
+    .muted-chip {
       border-color: #d6d9d7;
       background: #f6f7f6;
       color: #6b7471;
-    }}
-    button {{
+    }
+    button {
       width: 100%;
       padding: 11px 14px;
       border: 0;
@@ -2654,17 +2834,17 @@ def index() -> str:
       font-weight: 700;
       cursor: pointer;
       transition: transform 100ms ease, filter 160ms ease;
-    }}
-    button:hover {{ filter: brightness(1.04); }}
-    button:active {{ transform: translateY(1px); }}
-    .search-btn {{ align-self: end; }}
-    .field-cvss, .field-limit {{ max-width: 110px; }}
-    .field-cpe-missing {{
+    }
+    button:hover { filter: brightness(1.04); }
+    button:active { transform: translateY(1px); }
+    .search-btn { align-self: end; }
+    .field-cvss, .field-limit { max-width: 110px; }
+    .field-cpe-missing {
       display: flex;
       align-items: end;
       padding-bottom: 8px;
-    }}
-    .field-cpe-missing label {{
+    }
+    .field-cpe-missing label {
       display: inline-flex;
       align-items: center;
       gap: 8px;
@@ -2672,21 +2852,21 @@ def index() -> str:
       font-size: 13px;
       color: #2f3f45;
       cursor: pointer;
-    }}
-    .field-cpe-missing input[type="checkbox"] {{
+    }
+    .cpe-missing-check {
       width: 15px;
       height: 15px;
       margin: 0;
       accent-color: #0f6f65;
-    }}
-    .actions-bar {{
+    }
+    .actions-bar {
       display: flex;
       gap: 8px;
       align-items: end;
       align-self: end;
       grid-column: 1 / 7;
-    }}
-    .secondary-btn {{
+    }
+    .secondary-btn {
       width: auto;
       background: #f1f4f3;
       color: #1f4048;
@@ -2702,20 +2882,20 @@ def index() -> str:
       min-height: 42px;
       cursor: pointer;
       white-space: nowrap;
-    }}
-    .secondary-btn:hover {{ background: #e8edeb; }}
-    .export-dialog {{
+    }
+    .secondary-btn:hover { background: #e8edeb; }
+    .export-dialog {
       border: 1px solid #cfdad6;
       border-radius: 14px;
       padding: 0;
       width: min(92vw, 420px);
       box-shadow: 0 18px 42px rgba(18, 58, 68, 0.26);
-    }}
-    .export-dialog::backdrop {{
+    }
+    .export-dialog::backdrop {
       background: rgba(21, 40, 48, 0.42);
       backdrop-filter: blur(2px);
-    }}
-    .export-dialog-body {{
+    }
+    .export-dialog-body {
       display: block;
       padding: 18px;
       border: 0;
@@ -2723,58 +2903,58 @@ def index() -> str:
       min-width: 0;
       max-width: 100%;
       overflow: visible;
-    }}
-    .export-dialog h3 {{
+    }
+    .export-dialog h3 {
       margin: 0 0 8px;
       font-size: 17px;
       color: #123a44;
-    }}
-    .export-dialog p {{
+    }
+    .export-dialog p {
       margin: 0;
       color: #4b5f64;
       font-size: 13px;
       line-height: 1.45;
-    }}
-    .export-dialog-actions {{
+    }
+    .export-dialog-actions {
       margin-top: 16px;
       display: flex;
       gap: 8px;
       justify-content: flex-end;
       flex-wrap: nowrap;
-    }}
-    .dialog-btn {{
+    }
+    .dialog-btn {
       width: auto;
       min-height: 36px;
       padding: 8px 11px;
       font-size: 12px;
       border-radius: 9px;
-    }}
-    .dialog-btn.page {{
+    }
+    .dialog-btn.page {
       background: #eef3f2;
       color: #21464f;
       border: 1px solid #c6d6d1;
-    }}
-    .dialog-btn.cancel {{
+    }
+    .dialog-btn.cancel {
       background: #f8f4f0;
       color: #6e4f3d;
       border: 1px solid #dfc9b8;
-    }}
-    .meta {{
+    }
+    .meta {
       margin: 0;
       padding: 12px 16px 4px;
       color: var(--muted);
       font-size: 13px;
       text-align: right;
-    }}
-    .pager {{
+    }
+    .pager {
       margin: 8px 16px 0;
       display: flex;
       justify-content: flex-end;
       align-items: center;
       gap: 6px;
       flex-wrap: wrap;
-    }}
-    .page-link {{
+    }
+    .page-link {
       display: inline-flex;
       align-items: center;
       justify-content: center;
@@ -2787,18 +2967,18 @@ def index() -> str:
       text-decoration: none;
       font-size: 12px;
       font-weight: 600;
-    }}
-    .page-link.current {{
+    }
+    .page-link.current {
       background: #e5f3ef;
       border-color: #9ec2b8;
       color: #0f6f65;
-    }}
-    .page-link.disabled {{
+    }
+    .page-link.disabled {
       background: #f1f3f2;
       border-color: #d9dfdc;
       color: #9aa4a1;
-    }}
-    .error {{
+    }
+    .error {
       margin: 8px 16px 0;
       padding: 10px 11px;
       border: 1px solid rgba(194, 72, 46, 0.35);
@@ -2806,9 +2986,10 @@ def index() -> str:
       border-radius: 10px;
       color: #8f2917;
       font-size: 13px;
-    }}
-    table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-    thead th {{
+    }
+    .results-scroll { max-height: 72vh; overflow: auto; margin-top: 10px; }
+    table { width: 100%; border-collapse: collapse; }
+    thead th {
       position: sticky;
       top: 0;
       background: #f2eee4;
@@ -2818,8 +2999,8 @@ def index() -> str:
       letter-spacing: 0.4px;
       text-transform: uppercase;
       color: var(--muted);
-    }}
-    thead th a {{
+    }
+    thead th a {
       color: inherit;
       text-decoration: none;
       display: inline-flex;
@@ -2827,20 +3008,20 @@ def index() -> str:
       justify-content: center;
       gap: 5px;
       width: 100%;
-    }}
-    thead th a:hover {{ color: #1e5a53; }}
-    .sort-mark {{ font-size: 11px; opacity: 0.9; }}
-    th, td {{
+    }
+    thead th a:hover { color: #1e5a53; }
+    .sort-mark { font-size: 11px; opacity: 0.9; }
+    th, td {
       border-top: 1px solid var(--line);
       padding: 10px 12px;
       vertical-align: top;
       font-size: 14px;
-    }}
-    tbody tr:hover {{ background: #fff8ec; }}
-    .id {{ width: 190px; white-space: nowrap; font-weight: 700; color: #123a44; }}
-    .score {{ width: 92px; white-space: nowrap; }}
-    .actions {{ width: 120px; white-space: nowrap; }}
-    .cvss-chip {{
+    }
+    tbody tr:hover { background: #fff8ec; }
+    .id { width: 190px; white-space: nowrap; font-weight: 700; color: #123a44; }
+    .score { width: 92px; white-space: nowrap; }
+    .actions { width: 120px; white-space: nowrap; }
+    .cvss-chip {
       display: inline-flex;
       align-items: center;
       justify-content: center;
@@ -2850,37 +3031,37 @@ def index() -> str:
       font-size: 12px;
       font-weight: 700;
       border: 1px solid transparent;
-    }}
-    .cvss-critical {{
+    }
+    .cvss-critical {
       color: #9f1f1f;
       background: #fde8e8;
       border-color: #efb6b6;
-    }}
-    .cvss-high {{
+    }
+    .cvss-high {
       color: #9a4a00;
       background: #fff1e4;
       border-color: #f0c79c;
-    }}
-    .cvss-medium {{
+    }
+    .cvss-medium {
       color: #7b6400;
       background: #fff8d8;
       border-color: #ead88a;
-    }}
-    .cvss-low {{
+    }
+    .cvss-low {
       color: #4b4f55;
       background: #eef0f3;
       border-color: #d3d8de;
-    }}
-    .cvss-none {{
+    }
+    .cvss-none {
       color: #8f98a3;
       background: #1b1f24;
       border-color: #2f3842;
-    }}
-    td.cpe, td.actions {{
+    }
+    td.cpe, td.actions {
       vertical-align: middle;
       text-align: left;
-    }}
-    .copy-btn {{
+    }
+    .copy-btn {
       width: auto;
       font-size: 11px;
       padding: 5px 8px;
@@ -2891,23 +3072,23 @@ def index() -> str:
       margin-right: 6px;
       margin-top: 3px;
       cursor: pointer;
-    }}
-    .copy-btn.alt {{
+    }
+    .copy-btn.alt {
       background: #eef3f7;
       border-color: #c5d0d9;
       color: #2d4658;
-    }}
-    .copy-btn:hover {{ filter: brightness(0.98); }}
-    .desc {{
+    }
+    .copy-btn:hover { filter: brightness(0.98); }
+    .desc {
       color: #334b53;
       font-weight: 500;
-    }}
-    .view-btn {{
+    }
+    .view-btn {
       background: #f7f2ff;
       border-color: #d2c2ee;
       color: #49356a;
-    }}
-    .desc-drawer {{
+    }
+    .desc-drawer {
       position: fixed;
       top: 0;
       right: 0;
@@ -2921,11 +3102,11 @@ def index() -> str:
       transition: transform 170ms ease;
       display: flex;
       flex-direction: column;
-    }}
-    .desc-drawer.open {{
+    }
+    .desc-drawer.open {
       transform: translateX(0);
-    }}
-    .desc-drawer-header {{
+    }
+    .desc-drawer-header {
       display: flex;
       justify-content: space-between;
       align-items: center;
@@ -2933,22 +3114,22 @@ def index() -> str:
       padding: 14px 16px;
       border-bottom: 1px solid var(--line);
       background: #f7faf8;
-    }}
-    .desc-drawer-title {{
+    }
+    .desc-drawer-title {
       margin: 0;
       font-size: 15px;
       font-weight: 700;
       color: #1f343b;
-    }}
-    .desc-drawer-body {{
+    }
+    .desc-drawer-body {
       padding: 14px 16px;
       overflow: auto;
       line-height: 1.55;
       white-space: pre-wrap;
       color: #2f3f45;
       font-size: 14px;
-    }}
-    .desc-drawer-close {{
+    }
+    .desc-drawer-close {
       width: auto;
       min-height: 34px;
       border: 1px solid #ced9d5;
@@ -2959,15 +3140,15 @@ def index() -> str:
       font-size: 12px;
       font-weight: 700;
       cursor: pointer;
-    }}
-    .cpe-wrap {{
+    }
+    .cpe-wrap {
       display: flex;
       flex-wrap: wrap;
       gap: 6px;
       align-items: center;
       justify-content: flex-start;
-    }}
-    .cpe-chip {{
+    }
+    .cpe-chip {
       display: inline-block;
       border: 1px solid #cfddd9;
       background: #f0faf7;
@@ -2979,57 +3160,560 @@ def index() -> str:
       overflow-wrap: break-word;
       word-break: normal;
       max-width: 100%;
-    }}
-    @keyframes rise {{
-      from {{ opacity: 0; transform: translateY(10px); }}
-      to {{ opacity: 1; transform: translateY(0); }}
-    }}
-    @media (max-width: 900px) {{
-      .wrap {{ width: min(1120px, 96vw); margin-top: 16px; }}
-      .checkpoint-badge {{ width: 100%; margin-left: 0; text-align: left; }}
-      .panel > form {{ grid-template-columns: 1fr 1fr; }}
-      .field-lastmod-start,
-      .field-lastmod-end,
-      .field-vendor,
-      .field-product,
-      .field-keyword,
-      .field-cvss,
-      .field-impact,
-      .field-cpe-missing,
-      .field-limit {{
-        grid-column: auto;
-      }}
-      .search-btn {{ grid-column: 1 / -1; }}
-      .actions-bar {{ grid-column: 1 / -1; justify-content: flex-start; }}
-      .impact-list {{ width: min(92vw, 360px); }}
-      .detail-body {{
-        position: static;
-        width: 100%;
-        min-width: 0;
-        max-height: none;
-        margin-top: 8px;
-      }}
-      table, thead, tbody, th, td, tr {{ display: block; }}
-      thead {{ display: none; }}
-      td {{
-        border-top: 0;
-        padding: 6px 12px;
-      }}
-      tbody tr {{
-        padding: 8px 0;
-        border-top: 1px solid var(--line);
-      }}
-      td.id::before {{ content: "CVE ID"; display: block; font-size: 12px; color: var(--muted); }}
-      td.score::before {{ content: "CVSS"; display: block; font-size: 12px; color: var(--muted); }}
-      td.lastmod::before {{ content: "Last Modified"; display: block; font-size: 12px; color: var(--muted); }}
-      td.vtype::before {{ content: "Type"; display: block; font-size: 12px; color: var(--muted); }}
-      td.desc::before {{ content: "Description"; display: block; font-size: 12px; color: var(--muted); }}
-      td.cpe::before {{ content: "CPE"; display: block; font-size: 12px; color: var(--muted); }}
-      td.actions::before {{ content: "Actions"; display: block; font-size: 12px; color: var(--muted); }}
-    }}
-  </style>
+    }
+    @keyframes rise {
+      from { opacity: 0; transform: translateY(10px); }
+      to { opacity: 1; transform: translateY(0); }
+    }
+"""
+
+# Narrow-screen card layout; linked with a media attribute so desktop renders never wait on or apply it.
+_SEARCH_MOBILE_CSS = """
+    .wrap { width: min(1120px, 96vw); margin-top: 16px; }
+    .checkpoint-badge { width: 100%; margin-left: 0; text-align: left; }
+    .panel > form { grid-template-columns: 1fr 1fr; }
+    .field-lastmod-start,
+    .field-lastmod-end,
+    .field-vendor,
+    .field-product,
+    .field-keyword,
+    .field-cvss,
+    .field-impact,
+    .field-cpe-missing,
+    .field-limit {
+      grid-column: auto;
+    }
+    .search-btn { grid-column: 1 / -1; }
+    .actions-bar { grid-column: 1 / -1; justify-content: flex-start; }
+    .impact-list { width: min(92vw, 360px); }
+    .detail-body {
+      position: static;
+      width: 100%;
+      min-width: 0;
+      max-height: none;
+      margin-top: 8px;
+    }
+    .results-scroll { max-height: none; overflow: visible; }
+    table, thead, tbody, th, td, tr { display: block; }
+    thead { display: none; }
+    td {
+      border-top: 0;
+      padding: 6px 12px;
+    }
+    tbody tr {
+      padding: 8px 0;
+      border-top: 1px solid var(--line);
+      content-visibility: auto;
+      contain-intrinsic-size: auto 240px;
+    }
+    td[data-label]::before { content: attr(data-label); display: block; font-size: 12px; color: var(--muted); }
+"""
+
+_EXPLORER_JS = """
+(() => {
+  const form = document.querySelector("form");
+  const impactDetailsList = document.querySelectorAll(".impact-details");
+  const shareButton = document.querySelector("#share-url-btn");
+  const exportButton = document.querySelector("#export-xlsx-btn");
+  const exportDialog = document.querySelector("#export-dialog");
+  const lastModifiedStartDateInput = document.querySelector("#last_modified_start_date");
+  const lastModifiedEndDateInput = document.querySelector("#last_modified_end_date");
+  const resultsBody = document.querySelector(".results-scroll tbody");
+  const descDrawer = document.querySelector("#desc-drawer");
+  const descDrawerBody = document.querySelector("#desc-drawer-body");
+  const descDrawerTitle = document.querySelector("#desc-drawer-title");
+  const descDrawerClose = document.querySelector("#desc-drawer-close");
+
+  const syncLastModifiedDateRange = () => {
+    if (!lastModifiedStartDateInput || !lastModifiedEndDateInput) {
+      return;
+    }
+    const startValue = (lastModifiedStartDateInput.value || "").trim();
+    if (startValue) {
+      lastModifiedEndDateInput.min = startValue;
+      lastModifiedEndDateInput.title = `End date must be on or after ${startValue}`;
+    } else {
+      lastModifiedEndDateInput.removeAttribute("min");
+      lastModifiedEndDateInput.title = "";
+    }
+    const endValue = (lastModifiedEndDateInput.value || "").trim();
+    if (startValue && endValue && endValue < startValue) {
+      lastModifiedEndDateInput.value = startValue;
+    }
+  };
+
+  let dateRangeSyncPending = false;
+  const scheduleDateRangeSync = () => {
+    if (dateRangeSyncPending) {
+      return;
+    }
+    dateRangeSyncPending = true;
+    requestAnimationFrame(() => {
+      dateRangeSyncPending = false;
+      syncLastModifiedDateRange();
+    });
+  };
+
+  const openExportDialog = () => {
+    if (!exportDialog || typeof exportDialog.showModal !== "function") {
+      return Promise.resolve(window.confirm("전체 결과를 내보낼까요?\\n확인: 전체 결과\\n취소: 현재 페이지만") ? "all" : "page");
+    }
+    return new Promise((resolve) => {
+      const buttons = exportDialog.querySelectorAll("[data-export-scope]");
+      const onSelect = (event) => {
+        const target = event.currentTarget;
+        const scope = target?.dataset?.exportScope || "cancel";
+        cleanup();
+        exportDialog.close();
+        resolve(scope);
+      };
+      const onClose = () => {
+        cleanup();
+        resolve("cancel");
+      };
+      const cleanup = () => {
+        buttons.forEach((btn) => btn.removeEventListener("click", onSelect));
+        exportDialog.removeEventListener("close", onClose);
+      };
+      buttons.forEach((btn) => btn.addEventListener("click", onSelect));
+      exportDialog.addEventListener("close", onClose, { once: true });
+      exportDialog.showModal();
+    });
+  };
+
+  impactDetailsList.forEach((details) => {
+    const onPointerDown = (event) => {
+      if (!details.contains(event.target)) {
+        details.open = false;
+      }
+    };
+    const onKeyDown = (event) => {
+      if (event.key === "Escape") {
+        details.open = false;
+      }
+    };
+    details.addEventListener("toggle", () => {
+      if (details.open) {
+        document.addEventListener("pointerdown", onPointerDown);
+        document.addEventListener("keydown", onKeyDown);
+      } else {
+        document.removeEventListener("pointerdown", onPointerDown);
+        document.removeEventListener("keydown", onKeyDown);
+      }
+    });
+  });
+
+  // Share and Export both serialize the live form state the same way.
+  // The form is always read: the landing URL carries none of the profile-default filters it shows.
+  // Unchecked checkboxes are missing from FormData, so their keys are never taken from the URL.
+  const formOwnedKeys = new Set(["cpe_missing_only", "impact_type", "cpe_object"]);
+  const getCurrentParams = () => {
+    if (!form) {
+      return new URLSearchParams(window.location.search);
+    }
+    const params = new URLSearchParams(new FormData(form));
+    for (const [key, value] of new URLSearchParams(window.location.search)) {
+      if (!params.has(key) && !formOwnedKeys.has(key)) {
+        params.append(key, value);
+      }
+    }
+    return params;
+  };
+
+  if (shareButton) {
+    shareButton.addEventListener("click", async () => {
+      const query = getCurrentParams().toString();
+      const url = `${window.location.origin}${window.location.pathname}${query ? `?${query}` : ""}`;
+      try {
+        await navigator.clipboard.writeText(url);
+        shareButton.textContent = "Copied URL";
+        setTimeout(() => { shareButton.textContent = "Share URL"; }, 1200);
+      } catch (_) {
+        window.prompt("Copy URL:", url);
+      }
+    });
+  }
+
+  if (lastModifiedStartDateInput && lastModifiedEndDateInput) {
+    syncLastModifiedDateRange();
+    lastModifiedStartDateInput.addEventListener("change", scheduleDateRangeSync);
+    lastModifiedStartDateInput.addEventListener("input", scheduleDateRangeSync);
+    lastModifiedEndDateInput.addEventListener("focus", scheduleDateRangeSync);
+    lastModifiedEndDateInput.addEventListener("change", scheduleDateRangeSync);
+    if (form) {
+      form.addEventListener("submit", syncLastModifiedDateRange);
+    }
+  }
+
+  if (exportButton) {
+    exportButton.addEventListener("click", async () => {
+      const exportScope = await openExportDialog();
+      if (exportScope === "cancel") {
+        return;
+      }
+      const params = getCurrentParams();
+      params.set("export_scope", exportScope);
+      window.location.href = `/export.xlsx?${params.toString()}`;
+    });
+  }
+
+  // Outside-click and Escape listeners only exist while the drawer is open.
+  const onDescDrawerOutsideClick = (event) => {
+    if (event.target.closest("#desc-drawer, .view-btn")) return;
+    closeDescDrawer();
+  };
+  const onDescDrawerKeyDown = (event) => {
+    if (event.key === "Escape") closeDescDrawer();
+  };
+  const openDescDrawer = () => {
+    descDrawer.classList.add("open");
+    descDrawer.setAttribute("aria-hidden", "false");
+    document.addEventListener("click", onDescDrawerOutsideClick);
+    document.addEventListener("keydown", onDescDrawerKeyDown);
+  };
+  const closeDescDrawer = () => {
+    descDrawer?.classList.remove("open");
+    descDrawer?.setAttribute("aria-hidden", "true");
+    document.removeEventListener("click", onDescDrawerOutsideClick);
+    document.removeEventListener("keydown", onDescDrawerKeyDown);
+  };
+
+  resultsBody?.addEventListener("click", async (event) => {
+    const btn = event.target instanceof Element ? event.target.closest(".copy-btn") : null;
+    if (!btn) return;
+    if (btn.classList.contains("view-btn")) {
+      const cve = btn.dataset.cve || "CVE";
+      const summary = btn.closest("tr")?.querySelector("td.desc")?.textContent || "";
+      if (descDrawer && descDrawerBody && descDrawerTitle) {
+        descDrawerTitle.textContent = cve;
+        descDrawerBody.textContent = btn.dataset.desc ?? summary;
+        openDescDrawer();
+      }
+      if (btn.dataset.more && btn.dataset.desc === undefined) {
+        try {
+          const response = await fetch(`/api/cve/description?cve_id=${encodeURIComponent(cve)}`);
+          const data = await response.json();
+          if (!response.ok) throw new Error(data.error || "description lookup failed");
+          btn.dataset.desc = data.description || summary;
+          if (descDrawerTitle?.textContent === cve && descDrawerBody) {
+            descDrawerBody.textContent = btn.dataset.desc;
+          }
+        } catch (_) {
+          // Leave the summary in the drawer; the next click retries.
+        }
+      }
+      return;
+    }
+    const text = btn.dataset.copy || "";
+    try {
+      await navigator.clipboard.writeText(text);
+      const before = btn.textContent;
+      btn.textContent = "Copied";
+      setTimeout(() => { btn.textContent = before; }, 900);
+    } catch (_) {
+      window.prompt("Copy value:", text);
+    }
+  });
+  descDrawerClose?.addEventListener("click", closeDescDrawer);
+})();
+"""
+
+_SEARCH_PAGE_TAIL = """
+        </tbody>
+      </table>
+      </div>
+    </section>
+  </main>
+  <aside id="desc-drawer" class="desc-drawer" aria-hidden="true">
+    <div class="desc-drawer-header">
+      <h3 id="desc-drawer-title" class="desc-drawer-title">Description</h3>
+      <button id="desc-drawer-close" type="button" class="desc-drawer-close">닫기</button>
+    </div>
+    <div id="desc-drawer-body" class="desc-drawer-body"></div>
+  </aside>
+  <dialog id="export-dialog" class="export-dialog">
+    <form method="dialog" class="export-dialog-body">
+      <h3>엑셀 내보내기 범위 선택</h3>
+      <p>현재 검색 조건 결과를 엑셀로 다운로드합니다. 전체 결과 또는 현재 페이지만 선택하세요.</p>
+      <div class="export-dialog-actions">
+        <button type="button" class="dialog-btn" data-export-scope="all">전체 결과</button>
+        <button type="button" class="dialog-btn page" data-export-scope="page">현재 페이지만</button>
+        <button type="button" class="dialog-btn cancel" data-export-scope="cancel">취소</button>
+      </div>
+    </form>
+  </dialog>
+</body>
+</html>
+"""
+
+_EXPLORER_JS_URL = _register_asset("explorer", "js", _EXPLORER_JS, "application/javascript")
+_SEARCH_CSS_URL = _register_asset("search", "css", _minify_css(_SEARCH_CSS), "text/css")
+_SEARCH_MOBILE_CSS_URL = _register_asset("search-mobile", "css", _minify_css(_SEARCH_MOBILE_CSS), "text/css")
+# Sent as a header so a proxy or browser can start the asset fetches before the streamed <head> arrives.
+_SEARCH_PAGE_LINK_HEADER = f"<{_SEARCH_CSS_URL}>; rel=preload; as=style, <{_EXPLORER_JS_URL}>; rel=preload; as=script"
+_SEARCH_PAGE_HEAD_BYTES = f"""
+<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>CVE Query</title>
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
+  <link rel="stylesheet" href="{_SEARCH_CSS_URL}">
+  <link rel="stylesheet" href="{_SEARCH_MOBILE_CSS_URL}" media="(max-width: 900px)">
+  <script defer src="{_EXPLORER_JS_URL}"></script>
 </head>
-  <body>
+""".encode("utf-8")
+_SEARCH_PAGE_TAIL_BYTES = _SEARCH_PAGE_TAIL.encode("utf-8")
+
+
+@app.get("/")
+def index() -> Response:
+    args = request.args
+    user_profile = _normalize_user_profile(args.get("user_profile"))
+    app_settings: Settings | None = None
+    profile_defaults = DEFAULT_PROFILE_SETTINGS
+    bootstrap_error = ""
+    try:
+        app_settings = _load_app_settings()
+        profile_defaults = fetch_profile_settings(app_settings, user_profile)
+    except Exception as exc:  # pragma: no cover
+        bootstrap_error = f"설정 로딩 실패: {exc}"
+
+    product = (
+        (args.get("product") if "product" in args else str(profile_defaults["product"]) or "").strip()
+    )
+    vendor = (
+        (args.get("vendor") if "vendor" in args else str(profile_defaults["vendor"]) or "").strip()
+    )
+    keyword = (
+        (args.get("keyword") if "keyword" in args else str(profile_defaults["keyword"]) or "").strip()
+    )
+
+    if any(name in args for name in _LAST_MODIFIED_ARG_NAMES):
+        last_modified_start_raw = _compose_datetime_arg("last_modified_start")
+        last_modified_end_raw = _compose_datetime_arg("last_modified_end")
+    else:
+        lookback_days = int(profile_defaults["last_modified_lookback_days"])
+        now_local = datetime.now().replace(second=0, microsecond=0)
+        last_modified_end_raw = now_local.isoformat(timespec="minutes")
+        last_modified_start_raw = (now_local - timedelta(days=lookback_days)).isoformat(timespec="minutes")
+    last_modified_start_date_raw, last_modified_start_time_raw = _split_datetime_for_inputs(last_modified_start_raw)
+    last_modified_end_date_raw, last_modified_end_time_raw = _split_datetime_for_inputs(last_modified_end_raw)
+
+    if "cpe_missing_only_present" in args or "cpe_missing_only" in args:
+        cpe_missing_only = args.get("cpe_missing_only") == "1"
+    else:
+        cpe_missing_only = bool(profile_defaults["cpe_missing_only"])
+
+    if "impact_type_present" in args or "impact_type" in args:
+        selected_impacts = [value.strip() for value in args.getlist("impact_type") if value.strip()]
+    else:
+        selected_impacts = list(profile_defaults["impact_type"])
+    cpe_objects_catalog = [str(value).strip().lower() for value in profile_defaults.get("cpe_objects_catalog", []) if str(value).strip()]
+    if "cpe_object_present" in args or "cpe_object" in args:
+        selected_cpe_objects = [value.strip().lower() for value in args.getlist("cpe_object") if value.strip()]
+    else:
+        selected_cpe_objects = []
+    if selected_cpe_objects:
+        catalog_set = set(cpe_objects_catalog)
+        selected_cpe_objects = [value for value in selected_cpe_objects if value in catalog_set]
+
+    min_cvss_raw = (
+        args.get("min_cvss")
+        if "min_cvss" in args
+        else str(profile_defaults["min_cvss"])
+    )
+    limit_raw = (
+        args.get("limit")
+        if "limit" in args
+        else str(profile_defaults["limit"])
+    )
+    min_cvss = _parse_min_cvss(min_cvss_raw)
+    limit = _clip_int(limit_raw, 1, 500, 50)
+    page = _parse_page(args.get("page"))
+
+    sort_key_param = (
+        args.get("sort_key")
+        if "sort_key" in args
+        else str(profile_defaults["sort_key"])
+    )
+    sort_key = (sort_key_param or "cvss_desc").strip().lower()
+    if sort_key not in _SORT_MAP:
+        sort_key = "cvss_desc"
+    sort_by, sort_order = _SORT_MAP[sort_key]
+
+    rows: list[CveRow] = []
+    total_count = 0
+    checkpoint_text = "기록 없음"
+    count_cache_key = _build_count_cache_key(
+        product,
+        vendor,
+        keyword,
+        selected_impacts,
+        min_cvss,
+        last_modified_start_raw,
+        last_modified_end_raw,
+        cpe_missing_only,
+        selected_cpe_objects,
+    )
+    cached_total = _get_cached_count(count_cache_key)
+    if cached_total is not None:
+        page = min(page, max(1, (cached_total + limit - 1) // limit))
+    offset = (page - 1) * limit
+    should_fetch_total_count = (page == 1) or (cached_total is None)
+
+    last_modified_start, last_modified_end, error_text = _parse_last_modified_range(
+        last_modified_start_raw, last_modified_end_raw
+    )
+
+    if not error_text and not bootstrap_error:
+        # The checkpoint lookup is independent of the search, so a cache miss runs on the DB pool alongside it.
+        cached_checkpoint_text = _get_cached_checkpoint_text(app_settings)
+        checkpoint_future = (
+            _db_executor.submit(_load_checkpoint_text, app_settings) if cached_checkpoint_text is None else None
+        )
+        # Repeat searches (shared URLs, paging back) reuse both cached rows and the cached count.
+        rows_cache_key = (app_settings, count_cache_key, sort_key, limit, offset)
+        cached_rows = _search_rows_cache.get(rows_cache_key) if cached_total is not None else None
+        if cached_rows is not None:
+            rows, total_count = cached_rows, cached_total
+        else:
+            try:
+                rows, total_count = fetch_cves_from_db(
+                    app_settings,
+                    product,
+                    vendor or None,
+                    keyword or None,
+                    selected_impacts or None,
+                    min_cvss,
+                    limit,
+                    offset=offset,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    last_modified_start=last_modified_start,
+                    last_modified_end=last_modified_end,
+                    cpe_missing_only=cpe_missing_only,
+                    cpe_objects=selected_cpe_objects or None,
+                    include_total_count=should_fetch_total_count,
+                )
+                if total_count is None:
+                    total_count = cached_total or 0
+                else:
+                    _set_cached_count(count_cache_key, total_count)
+                _search_rows_cache.set(rows_cache_key, rows)
+            except Exception as exc:  # pragma: no cover
+                error_text = str(exc)
+        checkpoint_text = cached_checkpoint_text or checkpoint_future.result()
+    if bootstrap_error and not error_text:
+        error_text = bootstrap_error
+
+    base_query: list[tuple[str, object]] = [
+        ("user_profile", user_profile),
+        ("vendor", vendor),
+        ("product", product),
+        ("keyword", keyword),
+        ("min_cvss", str(min_cvss)),
+        ("limit", str(limit)),
+    ]
+    if "impact_type_present" in args:
+        base_query.append(("impact_type_present", "1"))
+    if "cpe_missing_only_present" in args:
+        base_query.append(("cpe_missing_only_present", "1"))
+    if "last_modified_present" in args:
+        base_query.append(("last_modified_present", "1"))
+    if "cpe_object_present" in args:
+        base_query.append(("cpe_object_present", "1"))
+    if last_modified_start_raw:
+        base_query.append(("last_modified_start", last_modified_start_raw))
+    if last_modified_end_raw:
+        base_query.append(("last_modified_end", last_modified_end_raw))
+    if selected_impacts:
+        base_query.append(("impact_type", selected_impacts))
+    if cpe_missing_only:
+        base_query.append(("cpe_missing_only", "1"))
+    if selected_cpe_objects:
+        base_query.append(("cpe_object", selected_cpe_objects))
+
+    common_query = urlencode(base_query, doseq=True)
+    # sort_key is whitelisted above, so it is appended without another urlencode pass.
+    page_query_prefix = f"{common_query}&sort_key={sort_key}"
+    sort_query_prefix = f"{common_query}&page={page}"
+
+    def build_sort_href(target: str) -> str:
+        if target == "cvss":
+            next_key = "cvss_asc" if sort_key == "cvss_desc" else "cvss_desc"
+        else:
+            next_key = "last_modified_asc" if sort_key == "last_modified_desc" else "last_modified_desc"
+        return f"?{sort_query_prefix}&sort_key={next_key}"
+
+    cvss_sort_href = build_sort_href("cvss")
+    last_modified_sort_href = build_sort_href("last_modified")
+    cvss_sort_marker, last_modified_sort_marker = _SORT_MARKERS[sort_key]
+
+    impact_options_html = _render_checkbox_options_html(
+        "impact_type", _IMPACT_TYPE_CHOICES, frozenset(selected_impacts)
+    )
+    impact_summary = "All impact types" if not selected_impacts else f"Impact Type ({len(selected_impacts)} selected)"
+    impact_selected_html = (
+        "".join(f"<span class='impact-chip'>{escape(value)}</span>" for value in selected_impacts)
+        if selected_impacts
+        else _NO_FILTER_CHIP_HTML
+    )
+    cpe_object_options_html = _render_checkbox_options_html(
+        "cpe_object", tuple(cpe_objects_catalog), frozenset(selected_cpe_objects)
+    )
+    cpe_object_summary = (
+        "No CPE object configured"
+        if not cpe_objects_catalog
+        else (
+            "All configured CPE objects" if not selected_cpe_objects else f"CPE Object ({len(selected_cpe_objects)} selected)"
+        )
+    )
+    cpe_object_selected_html = (
+        "".join(f"<span class='impact-chip'>{escape(value)}</span>" for value in selected_cpe_objects)
+        if selected_cpe_objects
+        else _NO_FILTER_CHIP_HTML
+    )
+    cpe_missing_checked = "checked" if cpe_missing_only else ""
+    total_pages = max(1, (total_count + limit - 1) // limit) if total_count > 0 else 1
+    if page > total_pages:
+        page = total_pages
+    page_start = max(1, page - 2)
+    page_end = min(total_pages, page + 2)
+    page_href_prefix = escape(f"?{page_query_prefix}&page=")
+    pager_links: list[str] = []
+    for page_no in range(page_start, page_end + 1):
+        if page_no == page:
+            pager_links.append(f"<span class='page-link current'>{page_no}</span>")
+        else:
+            pager_links.append(f"<a class='page-link' href='{page_href_prefix}{page_no}'>{page_no}</a>")
+    prev_link_html = (
+        f"<a class='page-link' href='{page_href_prefix}{page - 1}'>Prev</a>"
+        if page > 1
+        else _PAGER_PREV_DISABLED_HTML
+    )
+    next_link_html = (
+        f"<a class='page-link' href='{page_href_prefix}{page + 1}'>Next</a>"
+        if page < total_pages
+        else _PAGER_NEXT_DISABLED_HTML
+    )
+    pager_html = (
+        "<div class='pager'>"
+        f"{prev_link_html}"
+        f"{''.join(pager_links)}"
+        f"{next_link_html}"
+        "</div>"
+    )
+
+    error_html = f"<p class='error'>Error: {escape(error_text)}</p>" if error_text else ""
+    menu_html = _build_menu_html("search", user_profile=user_profile)
+
+    # user_profile is whitelisted, the numbers are formatted from float/int and the sort marks are constants,
+    # so only free-form values are escaped below.
+    page_body = f"""  <body>
   <main class="wrap">
     {menu_html}
     <section class="hero">
@@ -3044,7 +3728,7 @@ def index() -> str:
     </section>
     <section class="panel">
       <form method="get">
-        <input id="user_profile" type="hidden" name="user_profile" value="{escape(user_profile)}">
+        <input id="user_profile" type="hidden" name="user_profile" value="{user_profile}">
         <input type="hidden" name="impact_type_present" value="1">
         <input type="hidden" name="cpe_missing_only_present" value="1">
         <input type="hidden" name="last_modified_present" value="1">
@@ -3065,7 +3749,7 @@ def index() -> str:
         </div>
         <div class="field-cvss">
           <label for="min_cvss">Min CVSS</label>
-          <input id="min_cvss" name="min_cvss" type="number" min="0" max="10" step="0.1" value="{escape(str(min_cvss))}">
+          <input id="min_cvss" name="min_cvss" type="number" min="0" max="10" step="0.1" value="{min_cvss}">
         </div>
         <div class="field-impact">
           <label for="impact_type">Impact Type</label>
@@ -3079,11 +3763,11 @@ def index() -> str:
         </div>
         <div class="field-limit">
           <label for="limit">Limit (1-500)</label>
-          <input id="limit" name="limit" type="number" min="1" max="500" step="1" value="{escape(str(limit))}">
+          <input id="limit" name="limit" type="number" min="1" max="500" step="1" value="{limit}">
         </div>
         <div class="field-cpe-missing">
           <label for="cpe_missing_only">
-            <input id="cpe_missing_only" name="cpe_missing_only" type="checkbox" value="1" {cpe_missing_checked}>
+            <input id="cpe_missing_only" class="cpe-missing-check" name="cpe_missing_only" type="checkbox" value="1" {cpe_missing_checked}>
             CPE missing only
           </label>
         </div>
@@ -3121,555 +3805,113 @@ def index() -> str:
       </form>
       <p class="meta">Results: {total_count} total (showing {len(rows)})</p>
       {pager_html}
-      {error_html}
-      <table>
-        <thead>
-          <tr>
-            <th>CVE ID</th>
-            <th><a href="{escape(cvss_sort_href)}">CVSS <span class="sort-mark">{escape(cvss_sort_marker)}</span></a></th>
-            <th><a href="{escape(last_modified_sort_href)}">Last Modified <span class="sort-mark">{escape(last_modified_sort_marker)}</span></a></th>
-            <th>Type</th>
-            <th>Description</th>
-            <th>CPE</th>
-            <th>Actions</th>
-          </tr>
-        </thead>
-        <tbody>
-          {rows_html}
-        </tbody>
-      </table>
-    </section>
-  </main>
-  <aside id="desc-drawer" class="desc-drawer" aria-hidden="true">
-    <div class="desc-drawer-header">
-      <h3 id="desc-drawer-title" class="desc-drawer-title">Description</h3>
-      <button id="desc-drawer-close" type="button" class="desc-drawer-close">닫기</button>
-    </div>
-    <div id="desc-drawer-body" class="desc-drawer-body"></div>
-  </aside>
-  <dialog id="export-dialog" class="export-dialog">
-    <form method="dialog" class="export-dialog-body">
-      <h3>엑셀 내보내기 범위 선택</h3>
-      <p>현재 검색 조건 결과를 엑셀로 다운로드합니다. 전체 결과 또는 현재 페이지만 선택하세요.</p>
-      <div class="export-dialog-actions">
-        <button type="button" class="dialog-btn" data-export-scope="all">전체 결과</button>
-        <button type="button" class="dialog-btn page" data-export-scope="page">현재 페이지만</button>
-        <button type="button" class="dialog-btn cancel" data-export-scope="cancel">취소</button>
-      </div>
-    </form>
-  </dialog>
-</body>
-<script>
-  (() => {{
-    const form = document.querySelector("form");
-    const impactDetails = document.querySelector(".impact-details");
-    const shareButton = document.querySelector("#share-url-btn");
-    const exportButton = document.querySelector("#export-xlsx-btn");
-    const exportDialog = document.querySelector("#export-dialog");
-    const lastModifiedStartDateInput = document.querySelector("#last_modified_start_date");
-    const lastModifiedEndDateInput = document.querySelector("#last_modified_end_date");
-    const copyButtons = document.querySelectorAll(".copy-btn");
-    const descDrawer = document.querySelector("#desc-drawer");
-    const descDrawerBody = document.querySelector("#desc-drawer-body");
-    const descDrawerTitle = document.querySelector("#desc-drawer-title");
-    const descDrawerClose = document.querySelector("#desc-drawer-close");
-
-    const syncLastModifiedDateRange = () => {{
-      if (!lastModifiedStartDateInput || !lastModifiedEndDateInput) {{
-        return;
-      }}
-      const startValue = (lastModifiedStartDateInput.value || "").trim();
-      if (startValue) {{
-        lastModifiedEndDateInput.min = startValue;
-        lastModifiedEndDateInput.title = `End date must be on or after ${{startValue}}`;
-      }} else {{
-        lastModifiedEndDateInput.removeAttribute("min");
-        lastModifiedEndDateInput.title = "";
-      }}
-      const endValue = (lastModifiedEndDateInput.value || "").trim();
-      if (startValue && endValue && endValue < startValue) {{
-        lastModifiedEndDateInput.value = startValue;
-      }}
-    }};
-
-    const openExportDialog = () => {{
-      if (!exportDialog || typeof exportDialog.showModal !== "function") {{
-        return Promise.resolve(window.confirm("전체 결과를 내보낼까요?\\n확인: 전체 결과\\n취소: 현재 페이지만") ? "all" : "page");
-      }}
-      return new Promise((resolve) => {{
-        const buttons = exportDialog.querySelectorAll("[data-export-scope]");
-        const onSelect = (event) => {{
-          const target = event.currentTarget;
-          const scope = target?.dataset?.exportScope || "cancel";
-          cleanup();
-          exportDialog.close();
-          resolve(scope);
-        }};
-        const onClose = () => {{
-          cleanup();
-          resolve("cancel");
-        }};
-        const cleanup = () => {{
-          buttons.forEach((btn) => btn.removeEventListener("click", onSelect));
-          exportDialog.removeEventListener("close", onClose);
-        }};
-        buttons.forEach((btn) => btn.addEventListener("click", onSelect));
-        exportDialog.addEventListener("close", onClose, {{ once: true }});
-        exportDialog.showModal();
-      }});
-    }};
-
-    if (impactDetails) {{
-      document.addEventListener("click", (event) => {{
-        if (!impactDetails.open) return;
-        if (impactDetails.contains(event.target)) return;
-        impactDetails.open = false;
-      }});
-
-      document.addEventListener("keydown", (event) => {{
-        if (event.key === "Escape" && impactDetails.open) {{
-          impactDetails.open = false;
-        }}
-      }});
-    }}
-
-    if (shareButton) {{
-      shareButton.addEventListener("click", async () => {{
-        const url = window.location.href;
-        try {{
-          await navigator.clipboard.writeText(url);
-          shareButton.textContent = "Copied URL";
-          setTimeout(() => {{ shareButton.textContent = "Share URL"; }}, 1200);
-        }} catch (_) {{
-          window.prompt("Copy URL:", url);
-        }}
-      }});
-    }}
-
-    if (lastModifiedStartDateInput && lastModifiedEndDateInput) {{
-      syncLastModifiedDateRange();
-      lastModifiedStartDateInput.addEventListener("change", syncLastModifiedDateRange);
-      lastModifiedStartDateInput.addEventListener("input", syncLastModifiedDateRange);
-      lastModifiedEndDateInput.addEventListener("focus", syncLastModifiedDateRange);
-      lastModifiedEndDateInput.addEventListener("change", syncLastModifiedDateRange);
-    }}
-
-    if (exportButton) {{
-      exportButton.addEventListener("click", async () => {{
-        const exportScope = await openExportDialog();
-        if (exportScope === "cancel") {{
-          return;
-        }}
-        const params = new URLSearchParams(window.location.search);
-        if (form) {{
-          const formData = new FormData(form);
-          for (const [key, value] of formData.entries()) {{
-            params.set(key, String(value));
-          }}
-          if (!formData.has("cpe_missing_only")) {{
-            params.delete("cpe_missing_only");
-          }}
-          if (!formData.has("impact_type")) {{
-            params.delete("impact_type");
-          }}
-          if (!formData.has("cpe_object")) {{
-            params.delete("cpe_object");
-          }}
-        }}
-        params.set("export_scope", exportScope);
-        window.location.href = `/export.xlsx?${{params.toString()}}`;
-      }});
-    }}
-
-    copyButtons.forEach((btn) => {{
-      btn.addEventListener("click", async () => {{
-        if (btn.classList.contains("view-btn")) {{
-          const cve = btn.dataset.cve || "CVE";
-          const desc = btn.dataset.desc || "";
-          if (descDrawer && descDrawerBody && descDrawerTitle) {{
-            descDrawerTitle.textContent = cve;
-            descDrawerBody.textContent = desc;
-            descDrawer.classList.add("open");
-            descDrawer.setAttribute("aria-hidden", "false");
-          }}
-          return;
-        }}
-        const text = btn.dataset.copy || "";
-        try {{
-          await navigator.clipboard.writeText(text);
-          const before = btn.textContent;
-          btn.textContent = "Copied";
-          setTimeout(() => {{ btn.textContent = before; }}, 900);
-        }} catch (_) {{
-          window.prompt("Copy value:", text);
-        }}
-      }});
-    }});
-    descDrawerClose?.addEventListener("click", () => {{
-      if (!descDrawer) return;
-      descDrawer.classList.remove("open");
-      descDrawer.setAttribute("aria-hidden", "true");
-    }});
-    document.addEventListener("click", (event) => {{
-      if (!descDrawer || !descDrawer.classList.contains("open")) {{
-        return;
-      }}
-      const target = event.target;
-      if (target.closest("#desc-drawer")) {{
-        return;
-      }}
-      if (target.closest(".view-btn")) {{
-        return;
-      }}
-      descDrawer.classList.remove("open");
-      descDrawer.setAttribute("aria-hidden", "true");
-    }});
-    document.addEventListener("keydown", (event) => {{
-      if (event.key === "Escape" && descDrawer?.classList.contains("open")) {{
-        descDrawer.classList.remove("open");
-        descDrawer.setAttribute("aria-hidden", "true");
-      }}
-    }});
-  }})();
-</script>
-</html>
-"""
-
-
-@app.route("/daily", methods=["GET", "POST"])
-def daily_review() -> str | object:
-    user_profile = _normalize_user_profile(request.values.get("user_profile"))
-    app_settings: Settings | None = None
-    profile_defaults = dict(DEFAULT_PROFILE_SETTINGS)
-    error_text = ""
-    notice_text = (request.args.get("notice") or "").strip()
-    highlight_cve_id = (request.args.get("highlight_cve") or "").strip()
-    try:
-        app_settings = load_settings(".env")
-        profile_defaults = fetch_profile_settings(app_settings, user_profile)
-    except Exception as exc:  # pragma: no cover
-        error_text = f"설정 로딩 실패: {exc}"
-    active_presets: list[dict[str, object]] = []
-    if app_settings is not None:
-        try:
-            active_presets = [item for item in fetch_profile_presets(app_settings, user_profile) if item["is_enabled"]]
-        except Exception:
-            active_presets = []
-
-    now_utc = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-    window_days_raw = request.values.get("window_days") or str(profile_defaults["daily_review_window_days"])
-    try:
-        window_days = max(1, min(int(window_days_raw), 30))
-    except ValueError:
-        window_days = int(profile_defaults["daily_review_window_days"])
-    review_limit_raw = request.values.get("review_limit") or str(profile_defaults["daily_review_limit"])
-    try:
-        review_limit = max(1, min(int(review_limit_raw), 1000))
-    except ValueError:
-        review_limit = int(profile_defaults["daily_review_limit"])
-
-    period_mode = (request.values.get("period_mode") or "previous_day").strip().lower()
-    if period_mode not in {"previous_day", "last24h"}:
-        period_mode = "previous_day"
-    status_filter = (request.values.get("status_filter") or "pending").strip().lower()
-    if status_filter not in {"all", "pending", "reviewed", "ignored"}:
-        status_filter = "pending"
-
-    if period_mode == "previous_day":
-        utc_midnight = now_utc.replace(hour=0, minute=0)
-        start_dt = utc_midnight - timedelta(days=window_days)
-        end_dt = now_utc
-        period_label = f"{start_dt.strftime('%Y-%m-%d %H:%M')} ~ {end_dt.strftime('%Y-%m-%d %H:%M')} UTC"
-    else:
-        end_dt = now_utc
-        start_dt = now_utc - timedelta(hours=24 * window_days)
-        period_label = f"{start_dt.strftime('%Y-%m-%d %H:%M')} ~ {end_dt.strftime('%Y-%m-%d %H:%M')} UTC"
-    undo_cache_key = f"{user_profile}:backlog"
-
-    if request.method == "POST" and not error_text:
-        action = (request.form.get("action") or "row_update").strip().lower()
-        redirect_query = {
-            "user_profile": user_profile,
-            "period_mode": period_mode,
-            "window_days": str(window_days),
-            "review_limit": str(review_limit),
-            "status_filter": status_filter,
-        }
-        if action == "bulk_update":
-            selected_cve_ids = [value.strip() for value in request.form.getlist("selected_cve_id") if value.strip()]
-            bulk_status = (request.form.get("bulk_status") or "pending").strip().lower()
-            bulk_note = (request.form.get("bulk_note") or "").strip()
-            if not selected_cve_ids:
-                error_text = "일괄 변경할 CVE를 선택하세요."
-            else:
-                try:
-                    previous_state = fetch_daily_review_backlog_map(app_settings, user_profile, selected_cve_ids)
-                    _last_bulk_action_cache[undo_cache_key] = {
-                        "items": [
-                            {
-                                "cve_id": cve_id,
-                                "status": previous_state.get(cve_id, {}).get("status", "pending"),
-                                "note": previous_state.get(cve_id, {}).get("note", ""),
-                            }
-                            for cve_id in selected_cve_ids
-                        ]
-                    }
-                    for cve_id in selected_cve_ids:
-                        upsert_daily_review_backlog_item(app_settings, user_profile, cve_id, bulk_status, bulk_note)
-                    redirect_query["notice"] = f"{len(selected_cve_ids)}건 상태가 일괄 저장되었습니다."
-                    return redirect("/daily?" + urlencode(redirect_query))
-                except Exception as exc:  # pragma: no cover
-                    error_text = f"일괄 상태 저장 실패: {exc}"
-        elif action == "undo_bulk":
-            last_bulk = _last_bulk_action_cache.get(undo_cache_key, {})
-            items = list(last_bulk.get("items", []))
-            if not items:
-                error_text = "되돌릴 최근 일괄 변경이 없습니다."
-            else:
-                try:
-                    for item in items:
-                        upsert_daily_review_backlog_item(
-                            app_settings,
-                            user_profile,
-                            str(item.get("cve_id", "")),
-                            str(item.get("status", "pending")),
-                            str(item.get("note", "")),
-                        )
-                    _last_bulk_action_cache.pop(undo_cache_key, None)
-                    redirect_query["notice"] = f"{len(items)}건 일괄 변경을 되돌렸습니다."
-                    return redirect("/daily?" + urlencode(redirect_query))
-                except Exception as exc:  # pragma: no cover
-                    error_text = f"일괄 상태 되돌리기 실패: {exc}"
-        else:
-            cve_id = (request.form.get("cve_id") or "").strip()
-            status = (request.form.get("status") or "pending").strip().lower()
-            note = (request.form.get("note") or "").strip()
-            if not cve_id:
-                error_text = "상태를 저장할 CVE ID가 없습니다."
-            else:
-                try:
-                    upsert_daily_review_backlog_item(app_settings, user_profile, cve_id, status, note)
-                    redirect_query["notice"] = f"{cve_id} 상태가 저장되었습니다."
-                    redirect_query["highlight_cve"] = cve_id
-                    return redirect("/daily?" + urlencode(redirect_query))
-                except Exception as exc:  # pragma: no cover
-                    error_text = f"상태 저장 실패: {exc}"
-
-    rows: list[dict[str, object]] = []
-    total_count = 0
-    review_map: dict[str, dict[str, str]] = {}
-    matched_preset_map: dict[str, list[str]] = {}
-    if not error_text:
-        try:
-            if active_presets:
-                merged_by_cve: dict[str, dict[str, object]] = {}
-                for preset in active_presets:
-                    preset_name = str(preset["preset_name"])
-                    rule = dict(preset["rule"])
-                    preset_rows, _ = fetch_cves_from_db(
-                        app_settings,
-                        str(rule["product"]) or None,
-                        str(rule["vendor"]) or None,
-                        str(rule["keyword"]) or None,
-                        list(rule["impact_type"]) or None,
-                        float(rule["min_cvss"]),
-                        review_limit,
-                        offset=0,
-                        sort_by="last_modified",
-                        sort_order="desc",
-                        last_modified_start=start_dt,
-                        last_modified_end=end_dt,
-                        cpe_missing_only=bool(rule["cpe_missing_only"]),
-                        cpe_objects=list(rule["cpe_objects_catalog"]) or None,
-                        include_total_count=False,
-                    )
-                    for row in preset_rows:
-                        cve_id = str(row.get("id", ""))
-                        if not cve_id:
-                            continue
-                        if cve_id not in merged_by_cve:
-                            merged_by_cve[cve_id] = row
-                        matched_preset_map.setdefault(cve_id, [])
-                        if preset_name not in matched_preset_map[cve_id]:
-                            matched_preset_map[cve_id].append(preset_name)
-                rows = list(merged_by_cve.values())
-                rows.sort(
-                    key=lambda row: (
-                        row.get("last_modified_at") or datetime.min,
-                        float(row.get("cvss_score") or 0.0),
-                    ),
-                    reverse=True,
-                )
-                total_count = len(rows)
-                rows = rows[:review_limit]
-            else:
-                rows, total_count = fetch_cves_from_db(
-                    app_settings,
-                    str(profile_defaults["product"]) or None,
-                    str(profile_defaults["vendor"]) or None,
-                    str(profile_defaults["keyword"]) or None,
-                    list(profile_defaults["impact_type"]) or None,
-                    float(profile_defaults["min_cvss"]),
-                    review_limit,
-                    offset=0,
-                    sort_by="last_modified",
-                    sort_order="desc",
-                    last_modified_start=start_dt,
-                    last_modified_end=end_dt,
-                    cpe_missing_only=bool(profile_defaults["cpe_missing_only"]),
-                    cpe_objects=list(profile_defaults["cpe_objects_catalog"]) or None,
-                    include_total_count=True,
-                )
-            review_map = fetch_daily_review_backlog_map(
-                app_settings,
-                user_profile,
-                [str(row.get("id", "")) for row in rows],
-            )
-        except Exception as exc:  # pragma: no cover
-            error_text = str(exc)
-
-    status_summary = {"pending": 0, "reviewed": 0, "ignored": 0}
-    needs_recheck_count = 0
-    filtered_count = 0
-    row_chunks: list[str] = []
-    for row in rows:
-        cve_id_raw = str(row.get("id", "UNKNOWN"))
-        cve_id = escape(cve_id_raw)
-        state = review_map.get(cve_id_raw, {"status": "pending", "note": "", "needs_recheck": False})
-        current_status = state.get("status", "pending")
-        if current_status not in status_summary:
-            current_status = "pending"
-        needs_recheck = bool(state.get("needs_recheck", False))
-        display_status = current_status
-        if needs_recheck and current_status in {"reviewed", "ignored"}:
-            display_status = "pending"
-            needs_recheck_count += 1
-        status_summary[display_status] += 1
-        if status_filter != "all" and display_status != status_filter:
-            continue
-        filtered_count += 1
-        current_note = escape(state.get("note", ""))
-        score_label, score_class = format_cvss_badge(row.get("cvss_score"))
-        status_badge_class = "review-badge pending"
-        status_badge_text = "미검토"
-        if needs_recheck and current_status in {"reviewed", "ignored"}:
-            status_badge_text = "재검토 필요"
-        elif current_status == "reviewed":
-            status_badge_class = "review-badge reviewed"
-            status_badge_text = "검토완료"
-        elif current_status == "ignored":
-            status_badge_class = "review-badge ignored"
-            status_badge_text = "제외"
-        cpe_entries = row.get("cpe_entries") or []
-        cpe_badges = "".join(
-            f"<span class='cpe-chip'>{format_cpe_for_wrap(cpe_value)}</span>" for cpe_value in cpe_entries[:10]
-        )
-        if not cpe_badges:
-            cpe_badges = "<span class='cpe-chip'>-</span>"
-        last_modified_text = format_last_modified(row.get("last_modified_at", "N/A"))
-        last_modified_parts = last_modified_text.split(" ", 1)
-        if len(last_modified_parts) == 2:
-            last_modified_html = f"{escape(last_modified_parts[0])}<br>{escape(last_modified_parts[1])}"
+      {error_html}
+      <div class="results-scroll">
+      <table>
+        <thead>
+          <tr>
+            <th>CVE ID</th>
+            <th><a href="{escape(cvss_sort_href)}">CVSS <span class="sort-mark">{cvss_sort_marker}</span></a></th>
+            <th><a href="{escape(last_modified_sort_href)}">Last Modified <span class="sort-mark">{last_modified_sort_marker}</span></a></th>
+            <th>Type</th>
+            <th>Description</th>
+            <th>CPE</th>
+            <th>Actions</th>
+          </tr>
+        </thead>
+        <tbody>
+          """
+
+    def generate() -> Iterator[bytes | str]:
+        yield _SEARCH_PAGE_HEAD_BYTES
+        yield page_body
+        if rows:
+            yield from _join_in_batches(map(_render_search_row, rows))
         else:
-            last_modified_html = escape(last_modified_text)
-        row_chunks.append(
-            "<tr class='review-row'>"
-            f"<td class='sticky-col sticky-left'><input type='checkbox' name='selected_cve_id' value='{cve_id}' form='bulk-form' class='bulk-cve-check'></td>"
-            f"<td class='id'>{cve_id}</td>"
-            f"<td class='score'><span class='cvss-chip {escape(score_class)}'>{escape(score_label)}</span></td>"
-            f"<td>{escape(str(row.get('vuln_type', 'Other')))}</td>"
-            f"<td class='last-mod'>{last_modified_html}</td>"
-            f"<td class='desc'>{escape(shorten(str(row.get('description', '')), 120))} "
-            f"<button type='button' class='view-btn' data-cve='{cve_id}' data-desc='{escape(str(row.get('description', '')))}'>View</button></td>"
-            f"<td class='cpe'><div class='cpe-wrap'>{cpe_badges}</div></td>"
-            f"<td>{escape(', '.join(matched_preset_map.get(cve_id_raw, [])) or '-')}</td>"
-            f"<td class='sticky-col sticky-right {'row-highlight' if cve_id_raw == highlight_cve_id else ''}'>"
-            f"<div class='{status_badge_class}'>{status_badge_text}</div>"
-            "<form method='post' class='review-form'>"
-            f"<input type='hidden' name='user_profile' value='{escape(user_profile)}'>"
-            f"<input type='hidden' name='period_mode' value='{escape(period_mode)}'>"
-            f"<input type='hidden' name='window_days' value='{window_days}'>"
-            f"<input type='hidden' name='review_limit' value='{review_limit}'>"
-            f"<input type='hidden' name='status_filter' value='{escape(status_filter)}'>"
-            "<input type='hidden' name='action' value='row_update'>"
-            f"<input type='hidden' name='cve_id' value='{cve_id}'>"
-            "<select name='status'>"
-            f"<option value='pending' {'selected' if current_status == 'pending' else ''}>미검토</option>"
-            f"<option value='reviewed' {'selected' if current_status == 'reviewed' else ''}>검토완료</option>"
-            f"<option value='ignored' {'selected' if current_status == 'ignored' else ''}>제외</option>"
-            "</select>"
-            f"<input name='note' value='{current_note}' placeholder='메모 (선택)'>"
-            "<button type='submit'>저장</button>"
-            "</form>"
-            "</td>"
-            "</tr>"
-        )
-    if not row_chunks:
-        row_chunks.append("<tr><td colspan='9'>대상 없음</td></tr>")
-
-    info_lines = [
-        f"기간: {period_label}",
-        f"필터: vendor={profile_defaults['vendor'] or '-'}, product={profile_defaults['product'] or '-'}, keyword={profile_defaults['keyword'] or '-'}",
-        f"필터: impact={', '.join(profile_defaults['impact_type']) if profile_defaults['impact_type'] else '-'}, cpe_objects={len(profile_defaults['cpe_objects_catalog'])}",
-        f"검토상태: 미검토 {status_summary['pending']} / 검토완료 {status_summary['reviewed']} / 제외 {status_summary['ignored']}",
-        f"추가검토 필요: {needs_recheck_count}건",
-        f"현재 표시 필터: {status_filter} (표시 {filtered_count}건)",
-        f"활성 프리셋: {', '.join(item['preset_name'] for item in active_presets) if active_presets else '없음(프로필 기본 규칙 사용)'}",
-    ]
-    has_undo_bulk = bool(_last_bulk_action_cache.get(undo_cache_key, {}).get("items"))
-    quick_status_links = "".join(
-        f"<a class='quick-chip {'active' if status_filter == key else ''}' href='/daily?{urlencode({'user_profile': user_profile, 'period_mode': period_mode, 'window_days': str(window_days), 'review_limit': str(review_limit), 'status_filter': key})}'>{label}</a>"
-        for key, label in [("pending", "미검토"), ("reviewed", "검토완료"), ("ignored", "제외"), ("all", "전체")]
-    )
-    quick_period_links = "".join(
-        f"<a class='quick-chip {'active' if period_mode == key else ''}' href='/daily?{urlencode({'user_profile': user_profile, 'period_mode': key, 'window_days': str(window_days), 'review_limit': str(review_limit), 'status_filter': status_filter})}'>{label}</a>"
-        for key, label in [("previous_day", "전일 마감"), ("last24h", "최근 24h")]
+            yield _NO_RESULTS_HTML
+        yield _SEARCH_PAGE_TAIL_BYTES
+
+    return Response(
+        stream_with_context(generate()), mimetype="text/html", headers={"Link": _SEARCH_PAGE_LINK_HEADER}
     )
-    daily_export_href = (
-        "/daily_export.xlsx?"
-        + urlencode(
-            {
-                "user_profile": user_profile,
-                "period_mode": period_mode,
-                "window_days": str(window_days),
-                "review_limit": str(review_limit),
-                "status_filter": status_filter,
-            }
+
+
+def _fetch_preset_rows(
+    settings_obj: Settings,
+    presets: list[dict[str, object]],
+    review_limit: int,
+    start_dt: datetime,
+    end_dt: datetime,
+) -> tuple[list[CveRow], int, dict[str, list[str]]]:
+    def fetch_rule_rows(rule: dict[str, object]) -> list[CveRow]:
+        preset_rows, _ = fetch_cves_from_db(
+            settings_obj,
+            str(rule["product"]) or None,
+            str(rule["vendor"]) or None,
+            str(rule["keyword"]) or None,
+            list(rule["impact_type"]) or None,
+            float(rule["min_cvss"]),
+            review_limit,
+            offset=0,
+            sort_by="last_modified",
+            sort_order="desc",
+            last_modified_start=start_dt,
+            last_modified_end=end_dt,
+            cpe_missing_only=bool(rule["cpe_missing_only"]),
+            cpe_objects=list(rule["cpe_objects_catalog"]) or None,
+            include_total_count=False,
         )
+        return preset_rows
+
+    rules = [dict(preset["rule"]) for preset in presets]
+    if len(rules) > 1:
+        rows_by_preset = list(_db_executor.map(fetch_rule_rows, rules))
+    else:
+        rows_by_preset = [fetch_rule_rows(rule) for rule in rules]
+
+    merged_by_cve: dict[str, CveRow] = {}
+    matched_preset_map: dict[str, list[str]] = {}
+    for preset, preset_rows in zip(presets, rows_by_preset):
+        preset_name = str(preset["preset_name"])
+        for row in preset_rows:
+            cve_id = row.id
+            if not cve_id:
+                continue
+            if cve_id not in merged_by_cve:
+                merged_by_cve[cve_id] = row
+            matched_preset_map.setdefault(cve_id, [])
+            if preset_name not in matched_preset_map[cve_id]:
+                matched_preset_map[cve_id].append(preset_name)
+    rows = list(merged_by_cve.values())
+    rows.sort(
+        key=lambda row: (
+            row.last_modified_at or datetime.min,
+            float(row.cvss_score or 0.0),
+        ),
+        reverse=True,
     )
-    notice_html = f"<p class='ok-msg'>{escape(notice_text)}</p>" if notice_text else ""
-    error_html = f"<p class='error-msg'>{escape(error_text)}</p>" if error_text else ""
-    menu_html = _build_menu_html("daily", user_profile=user_profile)
+    return rows[:review_limit], len(rows), matched_preset_map
 
-    return f"""
-<!doctype html>
-<html lang="ko">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>CVE Daily Review</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
-  <style>
-    :root {{
+
+_DAILY_CSS = """
+    :root {
       --bg: #f7f4ee; --panel: #fffdf8; --ink: #1e2b31; --muted: #5e6c73; --line: #d7d5cc; --accent-2: #0f6f65;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{ margin: 0; font-family: "Space Grotesk", "Pretendard", sans-serif; color: var(--ink); background: var(--bg); }}
-    .wrap {{ width: min(1600px, 90vw); margin: 34px auto 54px; }}
-    .top-menu {{ display:flex; gap:10px; margin-bottom:12px; }}
-    .menu-link {{ text-decoration:none; color:var(--ink); border:1px solid var(--line); background:#fff8ed; border-radius:999px; padding:8px 14px; font-size:13px; font-weight:700; }}
-    .menu-link.active {{ color:#fff; background:var(--accent-2); border-color:var(--accent-2); }}
-    .panel {{ border:1px solid var(--line); background:var(--panel); border-radius:16px; padding:14px; }}
-    .profile-tabs {{ display:flex; gap:8px; margin-bottom:10px; }}
-    .profile-tab {{ text-decoration:none; border:1px solid var(--line); color:var(--ink); padding:6px 12px; border-radius:999px; font-size:13px; font-weight:700; background:#fff; }}
-    .profile-tab.active {{ color:#fff; background:var(--accent-2); border-color:var(--accent-2); }}
-    .toolbar {{ display:flex; gap:8px; flex-wrap:wrap; align-items:flex-end; margin-bottom:10px; }}
-    .toolbar label {{ font-size:12px; color:var(--muted); display:block; margin-bottom:4px; }}
-    .toolbar select,.toolbar input {{ border:1px solid var(--line); border-radius:8px; padding:8px 10px; font:inherit; background:#fff; }}
-    .toolbar button {{ border:1px solid var(--line); border-radius:8px; padding:8px 12px; font:inherit; font-weight:700; cursor:pointer; background:#fff; }}
-    .toolbar-link {{
+    }
+    * { box-sizing: border-box; }
+    body { margin: 0; font-family: "Space Grotesk", "Pretendard", sans-serif; color: var(--ink); background: var(--bg); }
+    .wrap { width: min(1600px, 90vw); margin: 34px auto 54px; }
+    .top-menu { display:flex; gap:10px; margin-bottom:12px; }
+    .menu-link { text-decoration:none; color:var(--ink); border:1px solid var(--line); background:#fff8ed; border-radius:999px; padding:8px 14px; font-size:13px; font-weight:700; }
+    .menu-link.active { color:#fff; background:var(--accent-2); border-color:var(--accent-2); }
+    .panel { border:1px solid var(--line); background:var(--panel); border-radius:16px; padding:14px; }
+    .profile-tabs { display:flex; gap:8px; margin-bottom:10px; }
+    .profile-tab { text-decoration:none; border:1px solid var(--line); color:var(--ink); padding:6px 12px; border-radius:999px; font-size:13px; font-weight:700; background:#fff; }
+    .profile-tab.active { color:#fff; background:var(--accent-2); border-color:var(--accent-2); }
+    .toolbar { display:flex; gap:8px; flex-wrap:wrap; align-items:flex-end; margin-bottom:10px; }
+    .toolbar label { font-size:12px; color:var(--muted); display:block; margin-bottom:4px; }
+    .toolbar select,.toolbar input { border:1px solid var(--line); border-radius:8px; padding:8px 10px; font:inherit; background:#fff; }
+    .toolbar button { border:1px solid var(--line); border-radius:8px; padding:8px 12px; font:inherit; font-weight:700; cursor:pointer; background:#fff; }
+    .toolbar-link {
       text-decoration: none;
       border: 1px solid var(--line);
       border-radius: 8px;
@@ -3682,14 +3924,14 @@ def daily_review() -> str | object:
       align-items: center;
       justify-content: center;
       min-height: 38px;
-    }}
-    .quick-filters {{
+    }
+    .quick-filters {
       display: flex;
       flex-wrap: wrap;
       gap: 6px;
       margin: 0 0 10px;
-    }}
-    .quick-chip {{
+    }
+    .quick-chip {
       text-decoration: none;
       border: 1px solid #ccd6d3;
       border-radius: 999px;
@@ -3698,40 +3940,40 @@ def daily_review() -> str | object:
       font-weight: 700;
       color: #28444c;
       background: #fff;
-    }}
-    .quick-chip.active {{
+    }
+    .quick-chip.active {
       color: #fff;
       background: var(--accent-2);
       border-color: var(--accent-2);
-    }}
-    .bulk-toolbar {{ margin: 0 0 10px; }}
-    .meta {{ margin: 8px 0 10px; font-size: 13px; color: var(--muted); }}
-    .ok-msg {{ color:#0c6d57; font-size:13px; font-weight:700; margin: 4px 0; }}
-    .error-msg {{ color:#ad3427; font-size:13px; font-weight:700; margin: 4px 0; }}
-    table {{ width:100%; border-collapse: collapse; }}
-    th, td {{ border-top:1px solid var(--line); padding:8px 10px; vertical-align:middle; text-align:center; font-size:13px; }}
-    th {{ text-align:center; color:var(--muted); font-size:12px; text-transform:uppercase; }}
-    td.last-mod, td.desc {{ text-align:left; vertical-align:middle; }}
-    td.last-mod {{ white-space:normal; line-height:1.35; min-width:120px; }}
-    .id {{ white-space:nowrap; font-weight:700; }}
-    .review-form {{ display:grid; grid-template-columns: 120px 1fr auto; gap:6px; }}
-    .review-form select,.review-form input,.review-form button {{ border:1px solid var(--line); border-radius:7px; padding:6px 8px; font:inherit; }}
-    .review-form button {{ font-weight:700; background:#f0faf7; color:#1a5852; cursor:pointer; }}
-    .cvss-chip {{ display:inline-flex; min-width:84px; justify-content:center; border-radius:999px; padding:2px 8px; font-size:12px; border:1px solid transparent; }}
-    .cvss-critical {{ color:#9f1f1f; background:#fde8e8; border-color:#efb6b6; }}
-    .cvss-high {{ color:#9a4a00; background:#fff1e4; border-color:#f0c79c; }}
-    .cvss-medium {{ color:#7b6400; background:#fff8d8; border-color:#ead88a; }}
-    .cvss-low {{ color:#4b4f55; background:#eef0f3; border-color:#d3d8de; }}
-    .cvss-none {{ color:#8f98a3; background:#1b1f24; border-color:#2f3842; }}
-    .table-wrap {{ overflow: auto; border: 1px solid var(--line); border-radius: 10px; }}
-    .sticky-col {{
+    }
+    .bulk-toolbar { margin: 0 0 10px; }
+    .meta { margin: 8px 0 10px; font-size: 13px; color: var(--muted); }
+    .ok-msg { color:#0c6d57; font-size:13px; font-weight:700; margin: 4px 0; }
+    .error-msg { color:#ad3427; font-size:13px; font-weight:700; margin: 4px 0; }
+    table { width:100%; border-collapse: collapse; }
+    th, td { border-top:1px solid var(--line); padding:8px 10px; vertical-align:middle; text-align:center; font-size:13px; }
+    th { text-align:center; color:var(--muted); font-size:12px; text-transform:uppercase; }
+    td.last-mod, td.desc { text-align:left; vertical-align:middle; }
+    td.last-mod { white-space:normal; line-height:1.35; min-width:120px; }
+    .id { white-space:nowrap; font-weight:700; }
+    .review-form { display:grid; grid-template-columns: 120px 1fr auto; gap:6px; }
+    .review-form select,.review-form input,.review-form button { border:1px solid var(--line); border-radius:7px; padding:6px 8px; font:inherit; }
+    .review-form button { font-weight:700; background:#f0faf7; color:#1a5852; cursor:pointer; }
+    .cvss-chip { display:inline-flex; min-width:84px; justify-content:center; border-radius:999px; padding:2px 8px; font-size:12px; border:1px solid transparent; }
+    .cvss-critical { color:#9f1f1f; background:#fde8e8; border-color:#efb6b6; }
+    .cvss-high { color:#9a4a00; background:#fff1e4; border-color:#f0c79c; }
+    .cvss-medium { color:#7b6400; background:#fff8d8; border-color:#ead88a; }
+    .cvss-low { color:#4b4f55; background:#eef0f3; border-color:#d3d8de; }
+    .cvss-none { color:#8f98a3; background:#1b1f24; border-color:#2f3842; }
+    .table-wrap { overflow: auto; border: 1px solid var(--line); border-radius: 10px; }
+    .sticky-col {
       position: sticky;
       background: #fffdf8;
       z-index: 3;
-    }}
-    .sticky-left {{ left: 0; min-width: 42px; }}
-    .sticky-right {{ right: 0; min-width: 340px; box-shadow: -6px 0 8px rgba(20, 34, 40, 0.04); }}
-    .review-badge {{
+    }
+    .sticky-left { left: 0; min-width: 42px; }
+    .sticky-right { right: 0; min-width: 340px; box-shadow: -6px 0 8px rgba(20, 34, 40, 0.04); }
+    .review-badge {
       display: inline-flex;
       align-items: center;
       justify-content: center;
@@ -3742,28 +3984,31 @@ def daily_review() -> str | object:
       font-size: 11px;
       font-weight: 700;
       margin-bottom: 6px;
-    }}
-    .review-badge.pending {{ background: #f1f3f5; color: #3f4950; border-color: #d4dade; }}
-    .review-badge.reviewed {{ background: #e7f6ef; color: #0e6a4c; border-color: #9ecfb9; }}
-    .review-badge.ignored {{ background: #fff0ea; color: #8d3a21; border-color: #efb8a3; }}
-    .row-highlight {{
+    }
+    .review-badge.pending { background: #f1f3f5; color: #3f4950; border-color: #d4dade; }
+    .review-badge.reviewed { background: #e7f6ef; color: #0e6a4c; border-color: #9ecfb9; }
+    .review-badge.ignored { background: #fff0ea; color: #8d3a21; border-color: #efb8a3; }
+    .row-highlight {
       animation: rowGlow 1.2s ease-out;
       box-shadow: inset 0 0 0 2px rgba(15, 111, 101, 0.22);
-    }}
-    .review-row.row-selected td {{
+    }
+    .review-row.row-selected td {
       background: #edf6f2;
-    }}
-    .review-row.row-selected .sticky-col {{
+    }
+    .review-row.row-selected .sticky-col {
       background: #e5f2ec;
-    }}
-    .review-row.row-active {{
+    }
+    .review-row.row-deferred {
+      display: none;
+    }
+    .review-row.row-active {
       position: relative;
       z-index: 2;
       outline: 2px solid rgba(29, 87, 79, 0.68);
       outline-offset: -2px;
       animation: activeRowGlow 1.2s ease-in-out infinite alternate;
-    }}
-    .view-btn {{
+    }
+    .view-btn {
       margin-left: 6px;
       width: auto;
       border: 1px solid #d2c2ee;
@@ -3774,8 +4019,8 @@ def daily_review() -> str | object:
       font-size: 11px;
       font-weight: 700;
       cursor: pointer;
-    }}
-    .cpe-wrap {{
+    }
+    .cpe-wrap {
       display: flex;
       flex-wrap: wrap;
       justify-content: center;
@@ -3783,8 +4028,8 @@ def daily_review() -> str | object:
       gap: 4px;
       min-width: 220px;
       max-width: 320px;
-    }}
-    .cpe-chip {{
+    }
+    .cpe-chip {
       display: inline-flex;
       align-items: center;
       max-width: 100%;
@@ -3797,8 +4042,8 @@ def daily_review() -> str | object:
       line-height: 1.35;
       white-space: normal;
       word-break: break-all;
-    }}
-    .desc-drawer {{
+    }
+    .desc-drawer {
       position: fixed;
       top: 0;
       right: 0;
@@ -3812,11 +4057,11 @@ def daily_review() -> str | object:
       transition: transform 170ms ease;
       display: flex;
       flex-direction: column;
-    }}
-    .desc-drawer.open {{
+    }
+    .desc-drawer.open {
       transform: translateX(0);
-    }}
-    .desc-drawer-header {{
+    }
+    .desc-drawer-header {
       display: flex;
       justify-content: space-between;
       align-items: center;
@@ -3824,22 +4069,22 @@ def daily_review() -> str | object:
       padding: 14px 16px;
       border-bottom: 1px solid var(--line);
       background: #f7faf8;
-    }}
-    .desc-drawer-title {{
+    }
+    .desc-drawer-title {
       margin: 0;
       font-size: 15px;
       font-weight: 700;
       color: #1f343b;
-    }}
-    .desc-drawer-body {{
+    }
+    .desc-drawer-body {
       padding: 14px 16px;
       overflow: auto;
       line-height: 1.55;
       white-space: pre-wrap;
       color: #2f3f45;
       font-size: 14px;
-    }}
-    .desc-drawer-close {{
+    }
+    .desc-drawer-close {
       width: auto;
       min-height: 34px;
       border: 1px solid #ced9d5;
@@ -3850,28 +4095,554 @@ def daily_review() -> str | object:
       font-size: 12px;
       font-weight: 700;
       cursor: pointer;
-    }}
-    @keyframes rowGlow {{
-      0% {{ background: #e9f8f3; }}
-      100% {{ background: #fffdf8; }}
-    }}
-    @keyframes activeRowGlow {{
-      0% {{ filter: drop-shadow(0 0 0 rgba(38, 133, 113, 0)); }}
-      100% {{ filter: drop-shadow(0 0 6px rgba(38, 133, 113, 0.35)); }}
-    }}
-  </style>
+    }
+    @keyframes rowGlow {
+      0% { background: #e9f8f3; }
+      100% { background: #fffdf8; }
+    }
+    @keyframes activeRowGlow {
+      0% { filter: drop-shadow(0 0 0 rgba(38, 133, 113, 0)); }
+      100% { filter: drop-shadow(0 0 6px rgba(38, 133, 113, 0.35)); }
+    }
+"""
+_DAILY_CSS_URL = _register_asset("daily", "css", _minify_css(_DAILY_CSS), "text/css")
+_DAILY_PAGE_LINK_HEADER = f"<{_DAILY_CSS_URL}>; rel=preload; as=style"
+
+_DAILY_PAGE_HEAD = f"""
+<!doctype html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>CVE Daily Review</title>
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
+  <link rel="stylesheet" href="{_DAILY_CSS_URL}">
 </head>
 <body>
+"""
+_DAILY_PAGE_TAIL = """
+        </tbody>
+      </table>
+      </div>
+      <div id="review-rows-sentinel" aria-hidden="true"></div>
+    </section>
+  </main>
+  <aside id="daily-desc-drawer" class="desc-drawer" aria-hidden="true">
+    <div class="desc-drawer-header">
+      <h3 id="daily-desc-drawer-title" class="desc-drawer-title">Description</h3>
+      <button id="daily-desc-drawer-close" type="button" class="desc-drawer-close">닫기</button>
+    </div>
+    <div id="daily-desc-drawer-body" class="desc-drawer-body"></div>
+  </aside>
+</body>
+<script>
+  (() => {
+    const selectAll = document.querySelector("#bulk-select-all");
+    const checks = () => Array.from(document.querySelectorAll(".bulk-cve-check"));
+    const reviewRows = Array.from(document.querySelectorAll("tr.review-row"));
+    const reviewTableBody = document.querySelector(".table-wrap tbody");
+    const descDrawer = document.querySelector("#daily-desc-drawer");
+    const descDrawerBody = document.querySelector("#daily-desc-drawer-body");
+    const descDrawerTitle = document.querySelector("#daily-desc-drawer-title");
+    const descDrawerClose = document.querySelector("#daily-desc-drawer-close");
+    const rowsSentinel = document.querySelector("#review-rows-sentinel");
+    const revealBatchSize = 100;
+    let revealedRowCount = reviewRows.findIndex((row) => row.classList.contains("row-deferred"));
+    let rowsObserver = null;
+    let activeRowIndex = -1;
+    let selectionAnchorIndex = -1;
+    const revealRowsThrough = (index) => {
+      if (revealedRowCount < 0) return;
+      while (revealedRowCount <= index && revealedRowCount < reviewRows.length) {
+        reviewRows[revealedRowCount].classList.remove("row-deferred");
+        revealedRowCount += 1;
+      }
+      if (revealedRowCount >= reviewRows.length) {
+        revealedRowCount = -1;
+        rowsObserver?.disconnect();
+      }
+    };
+    if (revealedRowCount >= 0 && rowsSentinel && "IntersectionObserver" in window) {
+      rowsObserver = new IntersectionObserver((entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          revealRowsThrough(revealedRowCount + revealBatchSize - 1);
+        }
+      }, { rootMargin: "600px 0px" });
+      rowsObserver.observe(rowsSentinel);
+    } else {
+      revealRowsThrough(reviewRows.length - 1);
+    }
+    const isTypingTarget = (target) => {
+      if (!target || !(target instanceof Element)) return false;
+      if (target.closest("input, select, textarea")) return true;
+      if (target.closest("#daily-desc-drawer")) return false;
+      return !!target.isContentEditable;
+    };
+    const setActiveRow = (index, focusRow = false, setAnchor = false) => {
+      if (index < 0 || index >= reviewRows.length) return;
+      revealRowsThrough(index);
+      reviewRows.forEach((row, idx) => {
+        row.classList.toggle("row-active", idx === index);
+      });
+      activeRowIndex = index;
+      if (setAnchor) {
+        selectionAnchorIndex = index;
+      }
+      const row = reviewRows[index];
+      if (focusRow && row) {
+        row.focus({ preventScroll: true });
+        row.scrollIntoView({ block: "nearest" });
+      }
+    };
+    // Outside-click and Escape listeners only exist while the drawer is open.
+    const onDrawerOutsideClick = (event) => {
+      if (event.target.closest("#daily-desc-drawer, .view-btn")) return;
+      closeDrawer();
+    };
+    const onDrawerKeyDown = (event) => {
+      if (event.key === "Escape") closeDrawer();
+    };
+    const closeDrawer = () => {
+      descDrawer?.classList.remove("open");
+      descDrawer?.setAttribute("aria-hidden", "true");
+      document.removeEventListener("click", onDrawerOutsideClick);
+      document.removeEventListener("keydown", onDrawerKeyDown);
+    };
+    const renderDrawer = (cve, desc) => {
+      if (!descDrawer || !descDrawerBody || !descDrawerTitle) {
+        return;
+      }
+      descDrawerTitle.textContent = cve || "CVE";
+      descDrawerBody.textContent = desc || "";
+      descDrawer.classList.add("open");
+      descDrawer.setAttribute("aria-hidden", "false");
+      document.addEventListener("click", onDrawerOutsideClick);
+      document.addEventListener("keydown", onDrawerKeyDown);
+    };
+    const syncDrawerToActiveRow = () => {
+      if (!descDrawer || !descDrawer.classList.contains("open")) {
+        return;
+      }
+      if (activeRowIndex < 0 || activeRowIndex >= reviewRows.length) {
+        return;
+      }
+      const viewBtn = reviewRows[activeRowIndex].querySelector(".view-btn");
+      if (!viewBtn) {
+        return;
+      }
+      renderDrawer(viewBtn.dataset.cve || "CVE", viewBtn.dataset.desc || "");
+    };
+    const applyRangeSelection = (fromIndex, toIndex, checkedValue) => {
+      if (!reviewRows.length) return;
+      const start = Math.max(0, Math.min(fromIndex, toIndex));
+      const end = Math.min(reviewRows.length - 1, Math.max(fromIndex, toIndex));
+      for (let idx = start; idx <= end; idx += 1) {
+        const checkbox = reviewRows[idx].querySelector(".bulk-cve-check");
+        if (!checkbox || checkbox.checked === checkedValue) continue;
+        checkbox.checked = checkedValue;
+        checkbox.dispatchEvent(new Event("change", { bubbles: true }));
+      }
+    };
+    const syncRowSelected = (checkbox) => {
+      const row = checkbox?.closest("tr.review-row");
+      if (!row) return;
+      row.classList.toggle("row-selected", !!checkbox.checked);
+    };
+    const syncAllSelectedRows = () => {
+      checks().forEach((checkbox) => syncRowSelected(checkbox));
+    };
+    selectAll?.addEventListener("change", () => {
+      const checked = !!selectAll.checked;
+      checks().forEach((el) => {
+        el.checked = checked;
+        syncRowSelected(el);
+      });
+    });
+    // Row, checkbox and View handling is delegated to the table body instead of bound per row.
+    reviewTableBody?.addEventListener("change", (event) => {
+      const el = event.target;
+      if (!(el instanceof HTMLInputElement) || !el.matches(".bulk-cve-check")) return;
+      syncRowSelected(el);
+      const changedRow = el.closest("tr.review-row");
+      if (changedRow) {
+        const rowIndex = reviewRows.indexOf(changedRow);
+        if (rowIndex >= 0) setActiveRow(rowIndex, false, false);
+      }
+      const all = checks();
+      if (!all.length || !selectAll) return;
+      selectAll.checked = all.every((x) => x.checked);
+    });
+    reviewRows.forEach((row) => {
+      row.setAttribute("tabindex", "-1");
+    });
+    reviewTableBody?.addEventListener("click", (event) => {
+      const target = event.target;
+      if (!(target instanceof Element)) return;
+      const row = target.closest("tr.review-row");
+      const rowIndex = row ? reviewRows.indexOf(row) : -1;
+      if (rowIndex >= 0) setActiveRow(rowIndex, false, true);
+      const viewButton = target.closest(".view-btn");
+      if (viewButton) {
+        renderDrawer(viewButton.dataset.cve || "CVE", viewButton.dataset.desc || "");
+        return;
+      }
+      if (target.closest("button, a, input, select, label, textarea")) {
+        return;
+      }
+      const checkbox = row?.querySelector(".bulk-cve-check");
+      if (!checkbox) {
+        return;
+      }
+      checkbox.checked = !checkbox.checked;
+      checkbox.dispatchEvent(new Event("change", { bubbles: true }));
+    });
+    syncAllSelectedRows();
+    document.addEventListener("keydown", (event) => {
+      const isArrow = event.key === "ArrowDown" || event.key === "ArrowUp";
+      const isSpace = event.key === " " || event.key === "Spacebar" || event.code === "Space";
+      if (!isArrow && !isSpace) {
+        return;
+      }
+      if (isTypingTarget(event.target)) {
+        return;
+      }
+      if (!reviewRows.length) {
+        return;
+      }
+      event.preventDefault();
+      if (isArrow) {
+        const baseIndex = activeRowIndex >= 0 ? activeRowIndex : 0;
+        const delta = event.key === "ArrowDown" ? 1 : -1;
+        const nextIndex = Math.max(0, Math.min(reviewRows.length - 1, baseIndex + delta));
+        const isRangeSelect = !!event.shiftKey;
+        if (isRangeSelect) {
+          const anchor = selectionAnchorIndex >= 0 ? selectionAnchorIndex : baseIndex;
+          setActiveRow(nextIndex, true, false);
+          applyRangeSelection(anchor, nextIndex, true);
+        } else {
+          setActiveRow(nextIndex, true, true);
+        }
+        syncDrawerToActiveRow();
+        return;
+      }
+      const targetIndex = activeRowIndex >= 0 ? activeRowIndex : 0;
+      setActiveRow(targetIndex, true, true);
+      const checkbox = reviewRows[targetIndex].querySelector(".bulk-cve-check");
+      if (!checkbox) {
+        return;
+      }
+      checkbox.checked = !checkbox.checked;
+      checkbox.dispatchEvent(new Event("change", { bubbles: true }));
+    });
+    const bulkForm = document.querySelector("#bulk-form");
+    bulkForm?.addEventListener("submit", (event) => {
+      const submitter = event.submitter;
+      if (!submitter || submitter.value !== "bulk_update") {
+        return;
+      }
+      const selected = checks().filter((x) => x.checked).length;
+      if (selected <= 0) {
+        event.preventDefault();
+        window.alert("일괄 변경할 CVE를 선택하세요.");
+        return;
+      }
+      const targetStatus = (document.querySelector("#bulk_status") || { value: "pending" }).value;
+      const confirmed = window.confirm(`선택한 ${selected}건을 '${targetStatus}' 상태로 변경할까요?`);
+      if (!confirmed) {
+        event.preventDefault();
+      }
+    });
+    const rowUpdateForm = document.querySelector("#row-update-form");
+    const submitRowUpdate = (container) => {
+      if (!rowUpdateForm || !container) return;
+      rowUpdateForm.elements.cve_id.value = container.dataset.cve || "";
+      rowUpdateForm.elements.status.value = container.querySelector(".row-status")?.value || "pending";
+      rowUpdateForm.elements.note.value = container.querySelector(".row-note")?.value || "";
+      rowUpdateForm.submit();
+    };
+    reviewTableBody?.addEventListener("click", (event) => {
+      const saveButton = event.target instanceof Element ? event.target.closest(".row-save-btn") : null;
+      if (saveButton) {
+        submitRowUpdate(saveButton.closest(".review-form"));
+      }
+    });
+    reviewTableBody?.addEventListener("keydown", (event) => {
+      if (event.key !== "Enter" || !(event.target instanceof Element) || !event.target.matches(".row-note")) return;
+      event.preventDefault();
+      submitRowUpdate(event.target.closest(".review-form"));
+    });
+    const noticeMessage = document.querySelector(".ok-msg");
+    if (noticeMessage) {
+      const toast = document.createElement("div");
+      toast.textContent = noticeMessage.textContent;
+      toast.style.position = "fixed";
+      toast.style.right = "18px";
+      toast.style.bottom = "18px";
+      toast.style.padding = "10px 14px";
+      toast.style.border = "1px solid #9ecfb9";
+      toast.style.background = "#e7f6ef";
+      toast.style.color = "#0e6a4c";
+      toast.style.borderRadius = "10px";
+      toast.style.fontSize = "12px";
+      toast.style.fontWeight = "700";
+      toast.style.zIndex = "999";
+      document.body.appendChild(toast);
+      setTimeout(() => {
+        toast.remove();
+      }, 1500);
+    }
+    descDrawerClose?.addEventListener("click", closeDrawer);
+  })();
+</script>
+</html>
+"""
+_DAILY_PAGE_HEAD_BYTES = _DAILY_PAGE_HEAD.encode("utf-8")
+_DAILY_PAGE_TAIL_BYTES = _DAILY_PAGE_TAIL.encode("utf-8")
+
+
+def _fetch_daily_rows(
+    settings_obj: Settings,
+    profile_settings: dict[str, object],
+    active_presets: list[dict[str, object]],
+    review_limit: int,
+    start_dt: datetime,
+    end_dt: datetime,
+) -> tuple[list[CveRow], int, dict[str, list[str]]]:
+    rules_fingerprint = _dump_json(
+        [profile_settings, [(item["preset_name"], item["rule"]) for item in active_presets]]
+    )
+    cache_key = (settings_obj, review_limit, start_dt, end_dt, rules_fingerprint)
+    cached = _daily_rows_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    if active_presets:
+        result = _fetch_preset_rows(settings_obj, active_presets, review_limit, start_dt, end_dt)
+    else:
+        rows, total_count = fetch_cves_from_db(
+            settings_obj,
+            str(profile_settings["product"]) or None,
+            str(profile_settings["vendor"]) or None,
+            str(profile_settings["keyword"]) or None,
+            list(profile_settings["impact_type"]) or None,
+            float(profile_settings["min_cvss"]),
+            review_limit,
+            offset=0,
+            sort_by="last_modified",
+            sort_order="desc",
+            last_modified_start=start_dt,
+            last_modified_end=end_dt,
+            cpe_missing_only=bool(profile_settings["cpe_missing_only"]),
+            cpe_objects=list(profile_settings["cpe_objects_catalog"]) or None,
+            include_total_count=True,
+        )
+        result = (rows, total_count or 0, {})
+    _daily_rows_cache.set(cache_key, result)
+    return result
+
+
+@app.route("/daily", methods=["GET", "POST"])
+def daily_review() -> object:
+    values = request.values.to_dict()
+    user_profile = _normalize_user_profile(values.get("user_profile"))
+    app_settings: Settings | None = None
+    profile_defaults = DEFAULT_PROFILE_SETTINGS
+    error_text = ""
+    notice_text = (request.args.get("notice") or "").strip()
+    highlight_cve_id = (request.args.get("highlight_cve") or "").strip()
+    try:
+        app_settings = _load_app_settings()
+        profile_defaults = fetch_profile_settings(app_settings, user_profile)
+    except Exception as exc:  # pragma: no cover
+        error_text = f"설정 로딩 실패: {exc}"
+    active_presets: list[dict[str, object]] = []
+    if app_settings is not None:
+        try:
+            active_presets = [item for item in fetch_profile_presets(app_settings, user_profile) if item["is_enabled"]]
+        except Exception:
+            active_presets = []
+
+    now_utc = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    window_days = _clip_int(
+        values.get("window_days"), 1, 30, int(profile_defaults["daily_review_window_days"])
+    )
+    review_limit = _clip_int(values.get("review_limit"), 1, 1000, int(profile_defaults["daily_review_limit"]))
+
+    period_mode = (values.get("period_mode") or "previous_day").strip().lower()
+    if period_mode not in {"previous_day", "last24h"}:
+        period_mode = "previous_day"
+    status_filter = (values.get("status_filter") or "pending").strip().lower()
+    if status_filter not in {"all", "pending", "reviewed", "ignored"}:
+        status_filter = "pending"
+
+    if period_mode == "previous_day":
+        utc_midnight = now_utc.replace(hour=0, minute=0)
+        start_dt = utc_midnight - timedelta(days=window_days)
+        end_dt = now_utc
+        period_label = f"{start_dt.strftime('%Y-%m-%d %H:%M')} ~ {end_dt.strftime('%Y-%m-%d %H:%M')} UTC"
+    else:
+        end_dt = now_utc
+        start_dt = now_utc - timedelta(hours=24 * window_days)
+        period_label = f"{start_dt.strftime('%Y-%m-%d %H:%M')} ~ {end_dt.strftime('%Y-%m-%d %H:%M')} UTC"
+    undo_cache_key = f"{user_profile}:backlog"
+
+    if request.method == "POST" and not error_text:
+        form = request.form
+        action = (form.get("action") or "row_update").strip().lower()
+        redirect_query = {
+            "user_profile": user_profile,
+            "period_mode": period_mode,
+            "window_days": str(window_days),
+            "review_limit": str(review_limit),
+            "status_filter": status_filter,
+        }
+        if action == "bulk_update":
+            selected_cve_ids = [value.strip() for value in form.getlist("selected_cve_id") if value.strip()]
+            bulk_status = (form.get("bulk_status") or "pending").strip().lower()
+            bulk_note = (form.get("bulk_note") or "").strip()
+            if not selected_cve_ids:
+                error_text = "일괄 변경할 CVE를 선택하세요."
+            else:
+                try:
+                    previous_state = fetch_daily_review_backlog_map(app_settings, user_profile, selected_cve_ids)
+                    _last_bulk_action_cache[undo_cache_key] = {
+                        "items": [
+                            {
+                                "cve_id": cve_id,
+                                "status": previous_state.get(cve_id, {}).get("status", "pending"),
+                                "note": previous_state.get(cve_id, {}).get("note", ""),
+                            }
+                            for cve_id in selected_cve_ids
+                        ]
+                    }
+                    for cve_id in selected_cve_ids:
+                        upsert_daily_review_backlog_item(app_settings, user_profile, cve_id, bulk_status, bulk_note)
+                    redirect_query["notice"] = f"{len(selected_cve_ids)}건 상태가 일괄 저장되었습니다."
+                    return redirect("/daily?" + urlencode(redirect_query))
+                except Exception as exc:  # pragma: no cover
+                    error_text = f"일괄 상태 저장 실패: {exc}"
+        elif action == "undo_bulk":
+            last_bulk = _last_bulk_action_cache.get(undo_cache_key, {})
+            items = list(last_bulk.get("items", []))
+            if not items:
+                error_text = "되돌릴 최근 일괄 변경이 없습니다."
+            else:
+                try:
+                    for item in items:
+                        upsert_daily_review_backlog_item(
+                            app_settings,
+                            user_profile,
+                            str(item.get("cve_id", "")),
+                            str(item.get("status", "pending")),
+                            str(item.get("note", "")),
+                        )
+                    _last_bulk_action_cache.pop(undo_cache_key, None)
+                    redirect_query["notice"] = f"{len(items)}건 일괄 변경을 되돌렸습니다."
+                    return redirect("/daily?" + urlencode(redirect_query))
+                except Exception as exc:  # pragma: no cover
+                    error_text = f"일괄 상태 되돌리기 실패: {exc}"
+        else:
+            cve_id = (form.get("cve_id") or "").strip()
+            status = (form.get("status") or "pending").strip().lower()
+            note = (form.get("note") or "").strip()
+            if not cve_id:
+                error_text = "상태를 저장할 CVE ID가 없습니다."
+            else:
+                try:
+                    upsert_daily_review_backlog_item(app_settings, user_profile, cve_id, status, note)
+                    redirect_query["notice"] = f"{cve_id} 상태가 저장되었습니다."
+                    redirect_query["highlight_cve"] = cve_id
+                    return redirect("/daily?" + urlencode(redirect_query))
+                except Exception as exc:  # pragma: no cover
+                    error_text = f"상태 저장 실패: {exc}"
+
+    rows: list[CveRow] = []
+    total_count = 0
+    review_map: dict[str, dict[str, str]] = {}
+    matched_preset_map: dict[str, list[str]] = {}
+    if not error_text:
+        try:
+            rows, total_count, matched_preset_map = _fetch_daily_rows(
+                app_settings, profile_defaults, active_presets, review_limit, start_dt, end_dt
+            )
+            review_map = fetch_daily_review_backlog_map(
+                app_settings,
+                user_profile,
+                [row.id for row in rows],
+            )
+        except Exception as exc:  # pragma: no cover
+            error_text = str(exc)
+
+    status_summary = {"pending": 0, "reviewed": 0, "ignored": 0}
+    needs_recheck_count = 0
+    show_all_statuses = status_filter == "all"
+    visible_rows: list[tuple[CveRow, str, bool, str]] = []
+    for row in rows:
+        cve_id_raw = row.id
+        state = review_map.get(cve_id_raw, _DEFAULT_REVIEW_STATE)
+        current_status = state.get("status", "pending")
+        if current_status not in status_summary:
+            current_status = "pending"
+        needs_recheck = bool(state.get("needs_recheck", False))
+        display_status = current_status
+        if needs_recheck and current_status in {"reviewed", "ignored"}:
+            display_status = "pending"
+            needs_recheck_count += 1
+        status_summary[display_status] += 1
+        if not show_all_statuses and display_status != status_filter:
+            continue
+        visible_rows.append((row, current_status, needs_recheck, str(state.get("note_html", ""))))
+    filtered_count = len(visible_rows)
+
+    info_html = (
+        f"기간: {period_label} | "
+        f"필터: vendor={escape(str(profile_defaults['vendor'] or '-'))}, "
+        f"product={escape(str(profile_defaults['product'] or '-'))}, "
+        f"keyword={escape(str(profile_defaults['keyword'] or '-'))} | "
+        f"필터: impact={escape(', '.join(profile_defaults['impact_type']) or '-')}, "
+        f"cpe_objects={len(profile_defaults['cpe_objects_catalog'])} | "
+        f"검토상태: 미검토 {status_summary['pending']} / 검토완료 {status_summary['reviewed']} / 제외 {status_summary['ignored']} | "
+        f"추가검토 필요: {needs_recheck_count}건 | "
+        f"현재 표시 필터: {status_filter} (표시 {filtered_count}건) | "
+        f"활성 프리셋: {escape(', '.join(item['preset_name'] for item in active_presets)) if active_presets else '없음(프로필 기본 규칙 사용)'}"
+    )
+    has_undo_bulk = bool(_last_bulk_action_cache.get(undo_cache_key, {}).get("items"))
+    # Every context value is whitelisted or an int, so the links are built without urlencode.
+    limits_query = f"window_days={window_days}&review_limit={review_limit}"
+    status_query_prefix = f"user_profile={user_profile}&period_mode={period_mode}&{limits_query}&status_filter="
+    quick_status_links = "".join(
+        f"<a class='quick-chip {'active' if status_filter == key else ''}' href='/daily?{status_query_prefix}{key}'>{label}</a>"
+        for key, label in [("pending", "미검토"), ("reviewed", "검토완료"), ("ignored", "제외"), ("all", "전체")]
+    )
+    quick_period_links = "".join(
+        f"<a class='quick-chip {'active' if period_mode == key else ''}' href='/daily?user_profile={user_profile}&period_mode={key}&{limits_query}&status_filter={status_filter}'>{label}</a>"
+        for key, label in [("previous_day", "전일 마감"), ("last24h", "최근 24h")]
+    )
+    daily_export_href = f"/daily_export.xlsx?{status_query_prefix}{status_filter}"
+    notice_html = f"<p class='ok-msg'>{escape(notice_text)}</p>" if notice_text else ""
+    error_html = f"<p class='error-msg'>{escape(error_text)}</p>" if error_text else ""
+    menu_html = _build_menu_html("daily", user_profile=user_profile)
+    # user_profile, period_mode and status_filter are whitelisted above, so they need no escaping.
+    hidden_context_html = (
+        f'<input type="hidden" name="user_profile" value="{user_profile}">'
+        f'<input type="hidden" name="period_mode" value="{period_mode}">'
+        f'<input type="hidden" name="window_days" value="{window_days}">'
+        f'<input type="hidden" name="review_limit" value="{review_limit}">'
+        f'<input type="hidden" name="status_filter" value="{status_filter}">'
+    )
+
+    page_head = f"""
   <main class="wrap">
     {menu_html}
     <section class="panel">
       <h1 style="margin:0 0 8px;font-size:24px;">일일 검토</h1>
       <div class="profile-tabs">
-        <a class="profile-tab {'active' if user_profile == 'hq' else ''}" href="/daily?user_profile=hq&period_mode={escape(period_mode)}&window_days={window_days}&review_limit={review_limit}&status_filter={escape(status_filter)}">본사</a>
-        <a class="profile-tab {'active' if user_profile == 'jaehwa' else ''}" href="/daily?user_profile=jaehwa&period_mode={escape(period_mode)}&window_days={window_days}&review_limit={review_limit}&status_filter={escape(status_filter)}">재화</a>
+        <a class="profile-tab {'active' if user_profile == 'hq' else ''}" href="/daily?user_profile=hq&period_mode={period_mode}&window_days={window_days}&review_limit={review_limit}&status_filter={status_filter}">본사</a>
+        <a class="profile-tab {'active' if user_profile == 'jaehwa' else ''}" href="/daily?user_profile=jaehwa&period_mode={period_mode}&window_days={window_days}&review_limit={review_limit}&status_filter={status_filter}">재화</a>
       </div>
       <form method="get" class="toolbar">
-        <input type="hidden" name="user_profile" value="{escape(user_profile)}">
+        <input type="hidden" name="user_profile" value="{user_profile}">
         <div>
           <label for="period_mode">기간 기준</label>
           <select id="period_mode" name="period_mode">
@@ -3906,11 +4677,7 @@ def daily_review() -> str | object:
         {quick_status_links}
       </div>
       <form id="bulk-form" method="post" class="toolbar bulk-toolbar">
-        <input type="hidden" name="user_profile" value="{escape(user_profile)}">
-        <input type="hidden" name="period_mode" value="{escape(period_mode)}">
-        <input type="hidden" name="window_days" value="{window_days}">
-        <input type="hidden" name="review_limit" value="{review_limit}">
-        <input type="hidden" name="status_filter" value="{escape(status_filter)}">
+        {hidden_context_html}
         <div>
           <label for="bulk_status">일괄 상태</label>
           <select id="bulk_status" name="bulk_status">
@@ -3926,9 +4693,16 @@ def daily_review() -> str | object:
         <button type="submit" name="action" value="bulk_update">선택 항목 일괄 저장</button>
         <button type="submit" name="action" value="undo_bulk" {'disabled' if not has_undo_bulk else ''}>최근 일괄 변경 되돌리기</button>
       </form>
+      <form id="row-update-form" method="post" hidden>
+        {hidden_context_html}
+        <input type="hidden" name="action" value="row_update">
+        <input type="hidden" name="cve_id">
+        <input type="hidden" name="status">
+        <input type="hidden" name="note">
+      </form>
       {notice_html}
       {error_html}
-      <p class="meta">대상 {total_count}건 (표시 {filtered_count}건) | {' | '.join(escape(line) for line in info_lines)}</p>
+      <p class="meta">대상 {total_count}건 (표시 {filtered_count}건) | {info_html}</p>
       <div class="table-wrap">
       <table>
         <thead>
@@ -3937,283 +4711,54 @@ def daily_review() -> str | object:
           </tr>
         </thead>
         <tbody>
-          {''.join(row_chunks)}
-        </tbody>
-      </table>
-      </div>
-    </section>
-  </main>
-  <aside id="daily-desc-drawer" class="desc-drawer" aria-hidden="true">
-    <div class="desc-drawer-header">
-      <h3 id="daily-desc-drawer-title" class="desc-drawer-title">Description</h3>
-      <button id="daily-desc-drawer-close" type="button" class="desc-drawer-close">닫기</button>
-    </div>
-    <div id="daily-desc-drawer-body" class="desc-drawer-body"></div>
-  </aside>
-</body>
-<script>
-  (() => {{
-    const selectAll = document.querySelector("#bulk-select-all");
-    const checks = () => Array.from(document.querySelectorAll(".bulk-cve-check"));
-    const reviewRows = Array.from(document.querySelectorAll("tr.review-row"));
-    const viewButtons = Array.from(document.querySelectorAll(".view-btn"));
-    const descDrawer = document.querySelector("#daily-desc-drawer");
-    const descDrawerBody = document.querySelector("#daily-desc-drawer-body");
-    const descDrawerTitle = document.querySelector("#daily-desc-drawer-title");
-    const descDrawerClose = document.querySelector("#daily-desc-drawer-close");
-    let activeRowIndex = -1;
-    let selectionAnchorIndex = -1;
-    const isTypingTarget = (target) => {{
-      if (!target || !(target instanceof Element)) return false;
-      if (target.closest("input, select, textarea")) return true;
-      if (target.closest("#daily-desc-drawer")) return false;
-      return !!target.isContentEditable;
-    }};
-    const setActiveRow = (index, focusRow = false, setAnchor = false) => {{
-      if (index < 0 || index >= reviewRows.length) return;
-      reviewRows.forEach((row, idx) => {{
-        row.classList.toggle("row-active", idx === index);
-      }});
-      activeRowIndex = index;
-      if (setAnchor) {{
-        selectionAnchorIndex = index;
-      }}
-      const row = reviewRows[index];
-      if (focusRow && row) {{
-        row.focus({{ preventScroll: true }});
-        row.scrollIntoView({{ block: "nearest" }});
-      }}
-    }};
-    const renderDrawer = (cve, desc) => {{
-      if (!descDrawer || !descDrawerBody || !descDrawerTitle) {{
-        return;
-      }}
-      descDrawerTitle.textContent = cve || "CVE";
-      descDrawerBody.textContent = desc || "";
-      descDrawer.classList.add("open");
-      descDrawer.setAttribute("aria-hidden", "false");
-    }};
-    const syncDrawerToActiveRow = () => {{
-      if (!descDrawer || !descDrawer.classList.contains("open")) {{
-        return;
-      }}
-      if (activeRowIndex < 0 || activeRowIndex >= reviewRows.length) {{
-        return;
-      }}
-      const viewBtn = reviewRows[activeRowIndex].querySelector(".view-btn");
-      if (!viewBtn) {{
-        return;
-      }}
-      renderDrawer(viewBtn.dataset.cve || "CVE", viewBtn.dataset.desc || "");
-    }};
-    const applyRangeSelection = (fromIndex, toIndex, checkedValue) => {{
-      if (!reviewRows.length) return;
-      const start = Math.max(0, Math.min(fromIndex, toIndex));
-      const end = Math.min(reviewRows.length - 1, Math.max(fromIndex, toIndex));
-      for (let idx = start; idx <= end; idx += 1) {{
-        const checkbox = reviewRows[idx].querySelector(".bulk-cve-check");
-        if (!checkbox || checkbox.checked === checkedValue) continue;
-        checkbox.checked = checkedValue;
-        checkbox.dispatchEvent(new Event("change", {{ bubbles: true }}));
-      }}
-    }};
-    const syncRowSelected = (checkbox) => {{
-      const row = checkbox?.closest("tr.review-row");
-      if (!row) return;
-      row.classList.toggle("row-selected", !!checkbox.checked);
-    }};
-    const syncAllSelectedRows = () => {{
-      checks().forEach((checkbox) => syncRowSelected(checkbox));
-    }};
-    selectAll?.addEventListener("change", () => {{
-      const checked = !!selectAll.checked;
-      checks().forEach((el) => {{
-        el.checked = checked;
-        syncRowSelected(el);
-      }});
-    }});
-    checks().forEach((el) => {{
-      el.addEventListener("change", () => {{
-        syncRowSelected(el);
-        const changedRow = el.closest("tr.review-row");
-        if (changedRow) {{
-          const rowIndex = reviewRows.indexOf(changedRow);
-          if (rowIndex >= 0) setActiveRow(rowIndex, false, false);
-        }}
-        const all = checks();
-        if (!all.length || !selectAll) return;
-        selectAll.checked = all.every((x) => x.checked);
-      }});
-    }});
-    reviewRows.forEach((row) => {{
-      row.setAttribute("tabindex", "-1");
-    }});
-    reviewRows.forEach((row) => {{
-      row.addEventListener("click", (event) => {{
-        const target = event.target;
-        const rowIndex = reviewRows.indexOf(row);
-        if (rowIndex >= 0) setActiveRow(rowIndex, false, true);
-        if (
-          target.closest("button")
-          || target.closest("a")
-          || target.closest("input")
-          || target.closest("select")
-          || target.closest("label")
-          || target.closest("textarea")
-        ) {{
-          return;
-        }}
-        const checkbox = row.querySelector(".bulk-cve-check");
-        if (!checkbox) {{
-          return;
-        }}
-        checkbox.checked = !checkbox.checked;
-        checkbox.dispatchEvent(new Event("change", {{ bubbles: true }}));
-      }});
-    }});
-    syncAllSelectedRows();
-    document.addEventListener("keydown", (event) => {{
-      const isArrow = event.key === "ArrowDown" || event.key === "ArrowUp";
-      const isSpace = event.key === " " || event.key === "Spacebar" || event.code === "Space";
-      if (!isArrow && !isSpace) {{
-        return;
-      }}
-      if (isTypingTarget(event.target)) {{
-        return;
-      }}
-      if (!reviewRows.length) {{
-        return;
-      }}
-      event.preventDefault();
-      if (isArrow) {{
-        const baseIndex = activeRowIndex >= 0 ? activeRowIndex : 0;
-        const delta = event.key === "ArrowDown" ? 1 : -1;
-        const nextIndex = Math.max(0, Math.min(reviewRows.length - 1, baseIndex + delta));
-        const isRangeSelect = !!event.shiftKey;
-        if (isRangeSelect) {{
-          const anchor = selectionAnchorIndex >= 0 ? selectionAnchorIndex : baseIndex;
-          setActiveRow(nextIndex, true, false);
-          applyRangeSelection(anchor, nextIndex, true);
-        }} else {{
-          setActiveRow(nextIndex, true, true);
-        }}
-        syncDrawerToActiveRow();
-        return;
-      }}
-      const targetIndex = activeRowIndex >= 0 ? activeRowIndex : 0;
-      setActiveRow(targetIndex, true, true);
-      const checkbox = reviewRows[targetIndex].querySelector(".bulk-cve-check");
-      if (!checkbox) {{
-        return;
-      }}
-      checkbox.checked = !checkbox.checked;
-      checkbox.dispatchEvent(new Event("change", {{ bubbles: true }}));
-    }});
-    const bulkForm = document.querySelector("#bulk-form");
-    bulkForm?.addEventListener("submit", (event) => {{
-      const submitter = event.submitter;
-      if (!submitter || submitter.value !== "bulk_update") {{
-        return;
-      }}
-      const selected = checks().filter((x) => x.checked).length;
-      if (selected <= 0) {{
-        event.preventDefault();
-        window.alert("일괄 변경할 CVE를 선택하세요.");
-        return;
-      }}
-      const targetStatus = (document.querySelector("#bulk_status") || {{ value: "pending" }}).value;
-      const confirmed = window.confirm(`선택한 ${{selected}}건을 '${{targetStatus}}' 상태로 변경할까요?`);
-      if (!confirmed) {{
-        event.preventDefault();
-      }}
-    }});
-    if ({'true' if bool(notice_text) else 'false'}) {{
-      const toast = document.createElement("div");
-      toast.textContent = "{escape(notice_text)}";
-      toast.style.position = "fixed";
-      toast.style.right = "18px";
-      toast.style.bottom = "18px";
-      toast.style.padding = "10px 14px";
-      toast.style.border = "1px solid #9ecfb9";
-      toast.style.background = "#e7f6ef";
-      toast.style.color = "#0e6a4c";
-      toast.style.borderRadius = "10px";
-      toast.style.fontSize = "12px";
-      toast.style.fontWeight = "700";
-      toast.style.zIndex = "999";
-      document.body.appendChild(toast);
-      setTimeout(() => {{
-        toast.remove();
-      }}, 1500);
-    }}
-    viewButtons.forEach((btn) => {{
-      btn.addEventListener("click", () => {{
-        const row = btn.closest("tr.review-row");
-        const rowIndex = row ? reviewRows.indexOf(row) : -1;
-        if (rowIndex >= 0) {{
-          setActiveRow(rowIndex, false, true);
-        }}
-        renderDrawer(btn.dataset.cve || "CVE", btn.dataset.desc || "");
-      }});
-    }});
-    descDrawerClose?.addEventListener("click", () => {{
-      if (!descDrawer) return;
-      descDrawer.classList.remove("open");
-      descDrawer.setAttribute("aria-hidden", "true");
-    }});
-    document.addEventListener("click", (event) => {{
-      if (!descDrawer || !descDrawer.classList.contains("open")) {{
-        return;
-      }}
-      const target = event.target;
-      if (target.closest("#daily-desc-drawer")) {{
-        return;
-      }}
-      if (target.closest(".view-btn")) {{
-        return;
-      }}
-      descDrawer.classList.remove("open");
-      descDrawer.setAttribute("aria-hidden", "true");
-    }});
-    document.addEventListener("keydown", (event) => {{
-      if (event.key === "Escape" && descDrawer?.classList.contains("open")) {{
-        descDrawer.classList.remove("open");
-        descDrawer.setAttribute("aria-hidden", "true");
-      }}
-    }});
-  }})();
-</script>
-</html>
-"""
+          """
+
+    def generate() -> Iterator[bytes | str]:
+        yield _DAILY_PAGE_HEAD_BYTES
+        yield page_head
+        if not visible_rows:
+            yield "<tr><td colspan='9'>대상 없음</td></tr>"
+        yield from _join_in_batches(
+            _render_daily_row(
+                row,
+                current_status,
+                needs_recheck,
+                note_html,
+                matched_preset_map.get(row.id, []),
+                row.id == highlight_cve_id,
+                deferred=index >= DAILY_REVIEW_INITIAL_ROWS,
+            )
+            for index, (row, current_status, needs_recheck, note_html) in enumerate(visible_rows)
+        )
+        yield _DAILY_PAGE_TAIL_BYTES
+
+    return Response(
+        stream_with_context(generate()), mimetype="text/html", headers={"Link": _DAILY_PAGE_LINK_HEADER}
+    )
 
 
 @app.get("/daily_export.xlsx")
 def daily_export_xlsx() -> object:
-    user_profile = _normalize_user_profile(request.args.get("user_profile"))
-    period_mode = (request.args.get("period_mode") or "previous_day").strip().lower()
+    args = request.args
+    user_profile = _normalize_user_profile(args.get("user_profile"))
+    period_mode = (args.get("period_mode") or "previous_day").strip().lower()
     if period_mode not in {"previous_day", "last24h"}:
         period_mode = "previous_day"
-    status_filter = (request.args.get("status_filter") or "pending").strip().lower()
+    status_filter = (args.get("status_filter") or "pending").strip().lower()
     if status_filter not in {"all", "pending", "reviewed", "ignored"}:
         status_filter = "pending"
 
     try:
-        settings_obj = load_settings(".env")
+        settings_obj = _load_app_settings()
         profile_defaults = fetch_profile_settings(settings_obj, user_profile)
     except Exception as exc:  # pragma: no cover
         return f"Failed to load settings: {exc}", 500
 
     now_utc = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-    window_days_raw = request.args.get("window_days") or str(profile_defaults["daily_review_window_days"])
-    try:
-        window_days = max(1, min(int(window_days_raw), 30))
-    except ValueError:
-        window_days = int(profile_defaults["daily_review_window_days"])
-    review_limit_raw = request.args.get("review_limit") or str(profile_defaults["daily_review_limit"])
-    try:
-        review_limit = max(1, min(int(review_limit_raw), 1000))
-    except ValueError:
-        review_limit = int(profile_defaults["daily_review_limit"])
+    window_days = _clip_int(
+        args.get("window_days"), 1, 30, int(profile_defaults["daily_review_window_days"])
+    )
+    review_limit = _clip_int(args.get("review_limit"), 1, 1000, int(profile_defaults["daily_review_limit"]))
 
     if period_mode == "previous_day":
         utc_midnight = now_utc.replace(hour=0, minute=0)
@@ -4229,47 +4774,9 @@ def daily_export_xlsx() -> object:
         active_presets = []
 
     matched_preset_map: dict[str, list[str]] = {}
-    rows: list[dict[str, object]] = []
+    rows: list[CveRow] = []
     if active_presets:
-        merged_by_cve: dict[str, dict[str, object]] = {}
-        for preset in active_presets:
-            preset_name = str(preset["preset_name"])
-            rule = dict(preset["rule"])
-            preset_rows, _ = fetch_cves_from_db(
-                settings_obj,
-                str(rule["product"]) or None,
-                str(rule["vendor"]) or None,
-                str(rule["keyword"]) or None,
-                list(rule["impact_type"]) or None,
-                float(rule["min_cvss"]),
-                review_limit,
-                offset=0,
-                sort_by="last_modified",
-                sort_order="desc",
-                last_modified_start=start_dt,
-                last_modified_end=end_dt,
-                cpe_missing_only=bool(rule["cpe_missing_only"]),
-                cpe_objects=list(rule["cpe_objects_catalog"]) or None,
-                include_total_count=False,
-            )
-            for row in preset_rows:
-                cve_id = str(row.get("id", ""))
-                if not cve_id:
-                    continue
-                if cve_id not in merged_by_cve:
-                    merged_by_cve[cve_id] = row
-                matched_preset_map.setdefault(cve_id, [])
-                if preset_name not in matched_preset_map[cve_id]:
-                    matched_preset_map[cve_id].append(preset_name)
-        rows = list(merged_by_cve.values())
-        rows.sort(
-            key=lambda row: (
-                row.get("last_modified_at") or datetime.min,
-                float(row.get("cvss_score") or 0.0),
-            ),
-            reverse=True,
-        )
-        rows = rows[:review_limit]
+        rows, _, matched_preset_map = _fetch_preset_rows(settings_obj, active_presets, review_limit, start_dt, end_dt)
     else:
         rows, _ = fetch_cves_from_db(
             settings_obj,
@@ -4292,12 +4799,20 @@ def daily_export_xlsx() -> object:
     review_map = fetch_daily_review_backlog_map(
         settings_obj,
         user_profile,
-        [str(row.get("id", "")) for row in rows],
+        [row.id for row in rows],
     )
 
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Daily Review"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Daily Review")
+    sheet.column_dimensions["A"].width = 22
+    sheet.column_dimensions["B"].width = 10
+    sheet.column_dimensions["C"].width = 24
+    sheet.column_dimensions["D"].width = 24
+    sheet.column_dimensions["E"].width = 90
+    sheet.column_dimensions["F"].width = 42
+    sheet.column_dimensions["G"].width = 34
+    sheet.column_dimensions["H"].width = 14
+    sheet.column_dimensions["I"].width = 42
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     sheet.append(["Generated At", generated_at])
     sheet.append(["Profile", user_profile])
@@ -4306,18 +4821,22 @@ def daily_export_xlsx() -> object:
     sheet.append(["Status Filter", status_filter])
     sheet.append([])
     headers = ["CVE ID", "CVSS", "Type", "Last Modified", "Description", "CPE", "Preset", "Review Status", "Review Note"]
-    sheet.append(headers)
-
-    header_row = sheet.max_row
-    for col in range(1, len(headers) + 1):
-        cell = sheet.cell(row=header_row, column=col)
-        cell.font = Font(bold=True, color="2F3F45")
-        cell.fill = PatternFill(fill_type="solid", start_color="F2EEE4", end_color="F2EEE4")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    sheet.append(
+        [
+            _styled_cell(
+                sheet,
+                header,
+                font=_XLSX_HEADER_FONT,
+                fill=_XLSX_HEADER_FILL,
+                alignment=_XLSX_HEADER_ALIGNMENT,
+            )
+            for header in headers
+        ]
+    )
 
     for row in rows:
-        cve_id = str(row.get("id", ""))
-        state = review_map.get(cve_id, {"status": "pending", "note": "", "needs_recheck": False})
+        cve_id = row.id
+        state = review_map.get(cve_id, _DEFAULT_REVIEW_STATE)
         row_status = str(state.get("status", "pending"))
         needs_recheck = bool(state.get("needs_recheck", False))
         display_status = "pending" if needs_recheck and row_status in {"reviewed", "ignored"} else row_status
@@ -4327,42 +4846,19 @@ def daily_export_xlsx() -> object:
         sheet.append(
             [
                 cve_id,
-                str(row.get("cvss_score") if row.get("cvss_score") is not None else "0.0"),
-                str(row.get("vuln_type", "Other")),
-                format_last_modified(row.get("last_modified_at", "N/A")),
-                str(row.get("description", "")),
-                "\n".join(str(cpe) for cpe in (row.get("cpe_entries") or [])),
+                str(row.cvss_score if row.cvss_score is not None else "0.0"),
+                row.vuln_type,
+                format_last_modified(row.last_modified_at),
+                _styled_cell(sheet, row.description, alignment=_XLSX_TOP_WRAP_ALIGNMENT),
+                _styled_cell(sheet, "\n".join(row.cpe_entries), alignment=_XLSX_TOP_WRAP_ALIGNMENT),
                 ", ".join(matched_preset_map.get(cve_id, [])),
                 export_status,
-                str(state.get("note", "")),
+                _styled_cell(sheet, str(state.get("note", "")), alignment=_XLSX_TOP_WRAP_ALIGNMENT),
             ]
         )
 
-    sheet.column_dimensions["A"].width = 22
-    sheet.column_dimensions["B"].width = 10
-    sheet.column_dimensions["C"].width = 24
-    sheet.column_dimensions["D"].width = 24
-    sheet.column_dimensions["E"].width = 90
-    sheet.column_dimensions["F"].width = 42
-    sheet.column_dimensions["G"].width = 34
-    sheet.column_dimensions["H"].width = 14
-    sheet.column_dimensions["I"].width = 42
-
-    for row_idx in range(header_row + 1, sheet.max_row + 1):
-        sheet.cell(row=row_idx, column=5).alignment = Alignment(vertical="top", wrap_text=True)
-        sheet.cell(row=row_idx, column=6).alignment = Alignment(vertical="top", wrap_text=True)
-        sheet.cell(row=row_idx, column=9).alignment = Alignment(vertical="top", wrap_text=True)
-
-    output = BytesIO()
-    workbook.save(output)
-    output.seek(0)
     filename = f"daily_review_{user_profile}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    return send_file(
-        output,
-        as_attachment=True,
-        download_name=filename,
-        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    )
+    return _send_workbook(workbook, filename)
 
 
 def main() -> None: